@@ -23,6 +23,9 @@
 import argparse
 import os.path
 import tegra_pmx_board_parser
+import tegra_pmx_dt
+import tegra_pmx_fdt
+import tegra_pmx_regs
 from tegra_pmx_utils import *
 
 dbg = False
@@ -30,6 +33,16 @@ dbg = False
 parser = argparse.ArgumentParser(description='Create a kernel device tree ' +
     'pinmux fragment from a board config file')
 parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--group-pins', choices=tegra_pmx_dt.group_pins_modes, default='none',
+    help='Merge identically configured pins into shared nodes: "all" merges ' +
+    'pins with identical mux and configuration, "config" emits separate ' +
+    'per-function mux nodes and per-configuration nodes (default: none)')
+parser.add_argument('--dtbo', help='Also write the pinmux configuration as a DT overlay blob to this file')
+parser.add_argument('--dtbo-target', default='pinmux', help='Label of the pinmux controller node the overlay applies to')
+parser.add_argument('--dtbo-state', default='default', help='Name of the pinctrl state the overlay defines')
+parser.add_argument('--skip-reset', action='store_true',
+    help='Omit pins whose configuration matches their reset state (needs reset_values in the SoC file)')
+parser.add_argument('-o', '--output', help='File to write; only replaced if the content changes')
 parser.add_argument('board', help='Board to process')
 args = parser.parse_args()
 if args.debug:
@@ -38,34 +51,31 @@ if dbg: print(args)
 
 board = tegra_pmx_board_parser.load_board(args.board)
 
-def mapper_pull(val):
-    return 'TEGRA_PIN_PULL_' + val.upper()
+if args.output:
+    out = OutputFile(args.output).redirect_stdout()
 
-def mapper_bool(val):
-    return 'TEGRA_PIN_' + {False: 'DISABLE', True: 'ENABLE'}[val]
+if args.skip_reset:
+    skip_names = tegra_pmx_regs.reset_state_names(board)
+else:
+    skip_names = ()
 
-for pincfg in board.pincfgs_by_num():
-    print('			' + pincfg.fullname + ' {')
-    print('				nvidia,pins = "' + pincfg.fullname + '";')
-    if pincfg.mux:
-        print('				nvidia,function = "' + pincfg.mux + '";')
-    print('				nvidia,pull = <' + mapper_pull(pincfg.pull) + '>;')
-    print('				nvidia,tristate = <' + mapper_bool(pincfg.tri) + '>;')
-    print('				nvidia,enable-input = <' + mapper_bool(pincfg.e_inp) + '>;')
-    if pincfg.gpio_pin.od:
-        print('				nvidia,open-drain = <' + mapper_bool(pincfg.od) + '>;')
-    if board.soc.soc_pins_have_rcv_sel and pincfg.gpio_pin.rcv_sel and hasattr(pincfg.gpio_pin, 'rcv_sel'):
-        print('				nvidia,rcv-sel = <' + mapper_bool(pincfg.rcv_sel) + '>;')
-    if board.soc.soc_pins_have_e_io_hv and pincfg.gpio_pin.e_io_hv and hasattr(pincfg.gpio_pin, 'e_io_hv'):
-        print('				nvidia,io-hv = <' + mapper_bool(pincfg.e_io_hv) + '>;')
-    print('			};')
+nodes = tegra_pmx_dt.pin_nodes(board, args.group_pins, skip_names)
+for node in nodes:
+    print(tegra_pmx_dt.format_node(node), end='')
 
-# FIXME: Handle drive groups
+if args.output:
+    out.close()
 
-for cfg in board.mipipadctrlcfgs_by_num():
-    print('			' + cfg.name + ' {')
-    print('				nvidia,pins = "mipi_pad_ctrl_' + cfg.name + '";')
-    print('				nvidia,function = "' + cfg.mux + '";')
-    print('			};')
+if args.dtbo:
+    blob = tegra_pmx_fdt.pinmux_overlay(nodes, args.dtbo_target, args.dtbo_state)
+    decoded_nodes = tegra_pmx_fdt.pin_nodes_from_overlay(blob)
+    if repr(decoded_nodes) != repr(nodes):
+        raise Exception('DT overlay does not decode to the same pin configuration')
+    changed = write_if_changed(args.dtbo, blob)
+    print('%s: %s' % (args.dtbo, {True: 'updated', False: 'unchanged'}[changed]))
+
+if args.skip_reset:
+    total = len(board.pincfgs_by_num()) + len(board.mipipadctrlcfgs_by_num())
+    tegra_pmx_regs.report_skipped_writes(board, len(skip_names), total)
 
 board.warn_about_unconfigured_pins()
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import os.path
+import struct
+import sys
+import tegra_pmx_board_parser
+import tegra_pmx_regs
+from tegra_pmx_utils import *
+
+dbg = False
+
+parser = argparse.ArgumentParser(description='Create a table of final ' +
+    'pinmux register values from a board config file')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--format', choices=('c', 'bin', 'text'), default='text',
+    help='Output format: a C array, little-endian binary (offset, value, ' +
+    'mask) triples, or one "offset value # mask" line per register (default: text)')
+parser.add_argument('--skip-reset', action='store_true',
+    help='Omit registers whose value matches their reset value (needs reset_values in the SoC file)')
+parser.add_argument('-o', '--output', help='File to write; only replaced if the content changes')
+parser.add_argument('board', help='Board to process')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+board = tegra_pmx_board_parser.load_board(args.board)
+if not board.soc.has_reset_values():
+    print('WARNING: No reset_values in SoC %s; register bits outside each mask are written as 0 rather than their reset value, so only use the values with read-modify-write' % board.soc.name, file=sys.stderr)
+regs = tegra_pmx_regs.reg_image(board)
+if args.skip_reset:
+    total = len(regs)
+    regs = [reg for reg in regs if not reg.is_reset()]
+    tegra_pmx_regs.report_skipped_writes(board, total - len(regs), total)
+if dbg:
+    for reg in regs:
+        print(reg)
+
+if args.format == 'bin':
+    blob = b''.join(struct.pack('<III', reg.reg, reg.value, reg.mask) for reg in regs)
+    if args.output:
+        changed = write_if_changed(args.output, blob)
+        print('%s: %s' % (args.output, {True: 'updated', False: 'unchanged'}[changed]))
+    else:
+        sys.stdout.buffer.write(blob)
+    board.warn_about_unconfigured_pins()
+    sys.exit(0)
+
+if args.output:
+    out = OutputFile(args.output).redirect_stdout()
+
+if args.format == 'text':
+    for reg in regs:
+        print('0x%04x 0x%08x # mask 0x%08x %s' % (reg.reg, reg.value, reg.mask, ' '.join(reg.names)))
+else:
+    print('''\
+/*
+ * THIS FILE IS AUTO-GENERATED - DO NOT EDIT!
+ *
+ * To generate this file, use the tegra-pinmux-scripts tool available from
+ * https://github.com/NVIDIA/tegra-pinmux-scripts
+ * Run "board-to-reg-image.py --format c %(board_name)s".
+ *
+ * Final pinmux register values, sorted by offset from the start of the
+ * APB_MISC register space. mask holds the bits the board configures. The
+ * other bits of value are %(other_bits)s; only the bits in mask should be
+ * merged into the current register contents, with a loop such as:
+ *
+ *	for (i = 0; i < ARRAY_SIZE(%(board_varname)s_pinmux_regs); i++) {
+ *		u32 offset = %(board_varname)s_pinmux_regs[i].offset;
+ *		u32 mask = %(board_varname)s_pinmux_regs[i].mask;
+ *		u32 val = readl(apb_misc + offset) & ~mask;
+ *
+ *		val |= %(board_varname)s_pinmux_regs[i].value & mask;
+ *		writel(val, apb_misc + offset);
+ *	}
+ */
+
+#ifndef _PINMUX_REGS_%(board_define)s_H_
+#define _PINMUX_REGS_%(board_define)s_H_
+
+#define PINMUX_REG(_offset, _value, _mask)	\\
+	{					\\
+		.offset	= _offset,		\\
+		.value	= _value,		\\
+		.mask	= _mask,		\\
+	}
+
+static const struct {
+	u32 offset;
+	u32 value;
+	u32 mask;
+} %(board_varname)s_pinmux_regs[] = {
+''' % {
+    'board_name': args.board,
+    'board_define': board.definename,
+    'board_varname': board.varname,
+    'other_bits': {True: 'their reset values', False: '0'}[board.soc.has_reset_values()],
+}, end='')
+
+    reg_table = []
+    for reg in regs:
+        reg_table.append(('0x%04x' % reg.reg, '0x%08x' % reg.value, '0x%08x' % reg.mask))
+    dump_c_table(('offset', 'value', 'mask'), 'PINMUX_REG', reg_table)
+
+    print('''\
+};
+
+#endif /* _PINMUX_REGS_%s_H_ */
+''' % board.definename, end='')
+
+if args.output:
+    out.close()
+
+board.warn_about_unconfigured_pins()
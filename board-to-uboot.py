@@ -21,9 +21,10 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
-import datetime
 import os.path
+import sys
 import tegra_pmx_board_parser
+import tegra_pmx_regs
 from tegra_pmx_utils import *
 
 dbg = False
@@ -31,6 +32,18 @@ dbg = False
 parser = argparse.ArgumentParser(description='Create a U-Boot board pinmux ' +
     'config table from a board config file')
 parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--reproducible', action='store_true',
+    help='Take the copyright year from the board/SoC config, not the current date')
+parser.add_argument('--gpio-ports', action='store_true',
+    help='Emit one GPIO init entry per GPIO port, holding per-port masks, instead of one per GPIO')
+parser.add_argument('--split-early', action='store_true',
+    help='Emit separate tables for the pins and GPIOs marked early in the board file, and for the rest')
+parser.add_argument('--pingrp-ranges', action='store_true',
+    help='Emit the pin configuration sorted by register, with runs of identically configured pins ' +
+    'in consecutive registers merged into single entries')
+parser.add_argument('--skip-reset', action='store_true',
+    help='Omit pins whose configuration matches their reset state (needs reset_values in the SoC file)')
+parser.add_argument('-o', '--output', help='File to write; only replaced if the content changes')
 parser.add_argument('board', help='Board to process')
 args = parser.parse_args()
 if args.debug:
@@ -39,11 +52,37 @@ if dbg: print(args)
 
 board = tegra_pmx_board_parser.load_board(args.board)
 
-copyright_year = datetime.date.today().year
+if args.skip_reset:
+    skip_names = tegra_pmx_regs.reset_state_names(board)
+else:
+    skip_names = ()
+pincfgs = [pincfg for pincfg in board.pincfgs_by_num() if pincfg.fullname not in skip_names]
+mipipadctrlcfgs = [cfg for cfg in board.mipipadctrlcfgs_by_num() if cfg.mipi_pad_ctrl_group.fullname not in skip_names]
+
+# (array name suffix, early-ness of the pins in the arrays, or None for all)
+if args.split_early:
+    if not (board.early_pins or board.early_functions):
+        print('WARNING: No early_pins or early_functions in board %s' % board.name, file=sys.stderr)
+    stages = (('_early', True), ('_late', False))
+else:
+    stages = (('', None),)
+
+def stage_pincfgs(pincfgs, early):
+    if early is None:
+        return pincfgs
+    return [pincfg for pincfg in pincfgs if board.pincfg_is_early(pincfg) == early]
+
+if args.output:
+    out = OutputFile(args.output).redirect_stdout()
+
+if args.reproducible:
+    copyright_year = board.uboot_copyright_years
+else:
+    copyright_year = source_date_year()
 
 print('''\
 /*
- * Copyright (c) %(copyright_year)d, NVIDIA CORPORATION. All rights reserved.
+ * Copyright (c) %(copyright_year)s, NVIDIA CORPORATION. All rights reserved.
  *
  * SPDX-License-Identifier: GPL-2.0+
  */
@@ -59,39 +98,102 @@ print('''\
 #ifndef _PINMUX_CONFIG_%(board_define)s_H_
 #define _PINMUX_CONFIG_%(board_define)s_H_
 
-#define GPIO_INIT(_port, _gpio, _init)			\\
-	{						\\
-		.gpio	= TEGRA_GPIO(_port, _gpio),	\\
-		.init	= TEGRA_GPIO_INIT_##_init,	\\
-	}
-
-static const struct tegra_gpio_config %(board_varname)s_gpio_inits[] = {
 ''' % {
     'copyright_year': copyright_year,
     'board_name': args.board,
     'board_define': board.definename,
-    'board_varname': board.varname,
 }, end='')
 
-gpio_table = []
-for pincfg in board.pincfgs_by_num():
-    if not pincfg.gpio_init:
-        continue
-    gpio = pincfg.gpio_pin.gpio.upper()
-    port = gpio[:-1]
-    assert port.isalpha()
-    pin = gpio[-1]
-    assert pin.isdigit()
-    row = (
-        port,
-        pin,
-        pincfg.gpio_init.upper(),
-    )
-    gpio_table.append(row)
-headings = ('port', 'pin', 'init_val')
-dump_c_table(headings, 'GPIO_INIT', gpio_table)
+if args.gpio_ports:
+    print('''\
+/*
+ * One entry per GPIO port with any GPIOs to initialize, sorted by port and
+ * hence grouped by GPIO bank (4 ports per bank). Within each 8-bit mask, bit
+ * N is GPIO N of the port: cnf selects the GPIOs to configure as GPIOs, oe
+ * those of them that are outputs, and out the initial output level. The
+ * masks map directly onto the GPIO controller's CNF, OE and OUT registers;
+ * use the masked-write registers to leave the port's other GPIOs untouched.
+ */
+struct tegra_gpio_port_config {
+	u8 port;
+	u8 cnf;
+	u8 oe;
+	u8 out;
+};
 
-print('''\
+#define GPIO_PORT_INIT(_port, _cnf, _oe, _out)		\\
+	{						\\
+		.port	= TEGRA_GPIO_PORT_##_port,	\\
+		.cnf	= _cnf,				\\
+		.oe	= _oe,				\\
+		.out	= _out,				\\
+	}
+
+''', end='')
+
+    for suffix, early in stages:
+        print('static const struct tegra_gpio_port_config %s_gpio_port_inits%s[] = {' % (board.varname, suffix))
+
+        ports = {}
+        for pincfg in stage_pincfgs(board.pincfgs_by_num(), early):
+            if not pincfg.gpio_init:
+                continue
+            gpio_pin = pincfg.gpio_pin
+            # See _gpio_number(); num is port * 8 + GPIO within the port
+            port = gpio_pin.num // 8
+            bit = 1 << (gpio_pin.num % 8)
+            if port not in ports:
+                ports[port] = [gpio_pin.gpio[:-1].upper(), 0, 0, 0]
+            ports[port][1] |= bit
+            if pincfg.gpio_init not in ('in', 'out0', 'out1'):
+                raise Exception('Bad gpio_init %s for %s' % (pincfg.gpio_init, pincfg.fullname))
+            if pincfg.gpio_init != 'in':
+                ports[port][2] |= bit
+            if pincfg.gpio_init == 'out1':
+                ports[port][3] |= bit
+        gpio_table = []
+        for port in sorted(ports):
+            name, cnf, oe, out = ports[port]
+            gpio_table.append((name, '0x%02x' % cnf, '0x%02x' % oe, '0x%02x' % out))
+        headings = ('port', 'cnf', 'oe', 'out')
+        dump_c_table(headings, 'GPIO_PORT_INIT', gpio_table)
+
+        print('''\
+};
+
+''', end='')
+else:
+    print('''\
+#define GPIO_INIT(_port, _gpio, _init)			\\
+	{						\\
+		.gpio	= TEGRA_GPIO(_port, _gpio),	\\
+		.init	= TEGRA_GPIO_INIT_##_init,	\\
+	}
+
+''', end='')
+
+    for suffix, early in stages:
+        print('static const struct tegra_gpio_config %s_gpio_inits%s[] = {' % (board.varname, suffix))
+
+        gpio_table = []
+        for pincfg in stage_pincfgs(board.pincfgs_by_num(), early):
+            if not pincfg.gpio_init:
+                continue
+            gpio = pincfg.gpio_pin.gpio.upper()
+            port = gpio[:-1]
+            assert port.isalpha()
+            pin = gpio[-1]
+            assert pin.isdigit()
+            row = (
+                port,
+                pin,
+                pincfg.gpio_init.upper(),
+            )
+            gpio_table.append(row)
+        headings = ('port', 'pin', 'init_val')
+        dump_c_table(headings, 'GPIO_INIT', gpio_table)
+
+        print('''\
 };
 
 ''', end='')
@@ -137,11 +239,40 @@ print(s)
 
 print('''\
 	}
+''')
+
+if args.pingrp_ranges:
+    s = gen_wrapped_c_macro_header('PINCFG_RANGE', ['_pingrp', '_count'] + params[1:])
+    s += '''\
+	{
+		.cfg	= PINCFG(%s),
+		.count	= _count,
+''' % ', '.join(params)
+    s = append_aligned_tabs_indent_with_tabs(s, 0)
+    print(s)
+
+    print('''\
+	}
 
-static const struct pmux_pingrp_config %(board_varname)s_pingrps[] = {
+/*
+ * Each entry applies the same configuration to _count pin groups with
+ * consecutive registers, the first being _pingrp. Entries are sorted by
+ * register offset. Apply them with e.g.:
+ *
+ *	for (i = 0; i < ARRAY_SIZE(%(board_varname)s_pingrp_ranges); i++) {
+ *		struct pmux_pingrp_config cfg = %(board_varname)s_pingrp_ranges[i].cfg;
+ *
+ *		for (j = 0; j < %(board_varname)s_pingrp_ranges[i].count; j++, cfg.pingrp++)
+ *			pinmux_config_pingrp_table(&cfg, 1);
+ *	}
+ */
+struct pmux_pingrp_range_config {
+	struct pmux_pingrp_config cfg;
+	u32 count;
+};
 ''' % {
     'board_varname': board.varname,
-}, end='')
+})
 
 def mapper_mux(val):
     if val:
@@ -175,31 +306,57 @@ def mapper_e_io_hv(gpio_pin, val):
         return 'DEFAULT'
     return {False: 'NORMAL', True: 'HIGH'}[val]
 
-pincfg_table = []
-for pincfg in board.pincfgs_by_num():
-    row = (
-        pincfg.fullname.upper(),
-        mapper_mux(pincfg.mux),
-        mapper_pull(pincfg.pull.upper()),
-        mapper_tristate(pincfg.tri),
-        mapper_e_input(pincfg.e_inp),
-        mapper_od(pincfg.gpio_pin, pincfg.od),
-    )
+for suffix, early in stages:
+    stage = stage_pincfgs(pincfgs, early)
+    if args.pingrp_ranges:
+        print('static const struct pmux_pingrp_range_config %s_pingrp_ranges%s[] = {' % (board.varname, suffix))
+        stage = sorted(stage, key=lambda pincfg: pincfg.gpio_pin.reg)
+    else:
+        print('static const struct pmux_pingrp_config %s_pingrps%s[] = {' % (board.varname, suffix))
+
+    pincfg_table = []
+    last_reg = None
+    for pincfg in stage:
+        row = (
+            pincfg.fullname.upper(),
+            mapper_mux(pincfg.mux),
+            mapper_pull(pincfg.pull.upper()),
+            mapper_tristate(pincfg.tri),
+            mapper_e_input(pincfg.e_inp),
+            mapper_od(pincfg.gpio_pin, pincfg.od),
+        )
+        if board.soc.soc_pins_have_rcv_sel:
+            row += (mapper_rcv_sel(pincfg.gpio_pin, pincfg.rcv_sel),)
+        if board.soc.soc_pins_have_e_io_hv:
+            row += (mapper_e_io_hv(pincfg.gpio_pin, pincfg.e_io_hv),)
+        if not args.pingrp_ranges:
+            pincfg_table.append(row)
+            continue
+        # Extend the previous range if this pin's register directly follows
+        # it, and the configuration matches
+        reg = pincfg.gpio_pin.reg
+        if pincfg_table and reg == last_reg + 4 and pincfg_table[-1][2:] == list(row[1:]):
+            pincfg_table[-1][1] += 1
+        else:
+            pincfg_table.append([row[0], 1] + list(row[1:]))
+        last_reg = reg
+    headings = ('pingrp', 'mux', 'pull', 'tri', 'e_input', 'od')
     if board.soc.soc_pins_have_rcv_sel:
-        row += (mapper_rcv_sel(pincfg.gpio_pin, pincfg.rcv_sel),)
+        headings += ('rcv_sel',)
     if board.soc.soc_pins_have_e_io_hv:
-        row += (mapper_e_io_hv(pincfg.gpio_pin, pincfg.e_io_hv),)
-    pincfg_table.append(row)
-headings = ('pingrp', 'mux', 'pull', 'tri', 'e_input', 'od')
-if board.soc.soc_pins_have_rcv_sel:
-    headings += ('rcv_sel',)
-if board.soc.soc_pins_have_e_io_hv:
-    headings += ('e_io_hv',)
-dump_c_table(headings, 'PINCFG', pincfg_table)
+        headings += ('e_io_hv',)
+    if args.pingrp_ranges:
+        pincfg_table = [[row[0], str(row[1])] + row[2:] for row in pincfg_table]
+        dump_c_table(headings[:1] + ('count',) + headings[1:], 'PINCFG_RANGE', pincfg_table)
+    else:
+        dump_c_table(headings, 'PINCFG', pincfg_table)
 
-print('''\
+    print('''\
 };
 
+''', end='')
+
+print('''\
 #define DRVCFG(_drvgrp, _slwf, _slwr, _drvup, _drvdn, _lpmd, _schmt, _hsm) \\
 	{						\\
 		.drvgrp = PMUX_DRVGRP_##_drvgrp,	\\
@@ -234,7 +391,7 @@ static const struct pmux_mipipadctrlgrp_config %s_mipipadctrlgrps[] = {
 ''' % board.varname, end='')
 
     mipipadctrl_table = []
-    for cfg in board.mipipadctrlcfgs_by_num():
+    for cfg in mipipadctrlcfgs:
         row = (
             cfg.name.upper(),
             mapper_mux(cfg.mux),
@@ -252,4 +409,11 @@ print('''\
 #endif /* PINMUX_CONFIG_%s_H */
 ''' % board.definename, end='')
 
+if args.output:
+    out.close()
+
+if args.skip_reset:
+    total = len(board.pincfgs_by_num()) + len(board.mipipadctrlcfgs_by_num())
+    tegra_pmx_regs.report_skipped_writes(board, len(skip_names), total)
+
 board.warn_about_unconfigured_pins()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import os
+import os.path
+import sys
+import tegra_pmx_board_parser
+import tegra_pmx_dt
+from tegra_pmx_utils import *
+
+dbg = False
+
+parser = argparse.ArgumentParser(description='Create kernel device tree ' +
+    'pinmux fragments for a set of related boards, with the pin nodes that ' +
+    'all boards share factored out into a common file')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--group-pins', choices=tegra_pmx_dt.group_pins_modes, default='none',
+    help='How to merge pins into nodes; see board-to-kernel-dt.py')
+parser.add_argument('--common', required=True, help='File to write the common pin nodes to')
+parser.add_argument('--outdir', required=True, help='Directory to write per-board <board>.dtsi fragments to')
+parser.add_argument('boards', nargs='+', help='Boards to process')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+boards = [tegra_pmx_board_parser.load_board(boardname) for boardname in args.boards]
+socnames = set(board.soc.name for board in boards)
+if len(socnames) != 1:
+    print('ERROR: Boards use different SoCs: ' + ', '.join(sorted(socnames)), file=sys.stderr)
+    sys.exit(1)
+
+def node_key(node):
+    return (node.name, tuple(node.pins), node.props)
+
+board_nodes = [tegra_pmx_dt.pin_nodes(board, args.group_pins) for board in boards]
+
+common_keys = set(node_key(node) for node in board_nodes[0])
+for nodes in board_nodes[1:]:
+    common_keys &= set(node_key(node) for node in nodes)
+
+os.makedirs(args.outdir, exist_ok=True)
+
+# Keep the first board's node order for the common file
+common_nodes = [node for node in board_nodes[0] if node_key(node) in common_keys]
+with OutputFile(args.common) as f:
+    for node in common_nodes:
+        print(tegra_pmx_dt.format_node(node), file=f, end='')
+
+for board, nodes in zip(boards, board_nodes):
+    own_nodes = [node for node in nodes if node_key(node) not in common_keys]
+    if dbg: print('%s: %d of %d nodes not common' % (board.name, len(own_nodes), len(nodes)))
+    fn = os.path.join(args.outdir, board.name + '.dtsi')
+    with OutputFile(fn) as f:
+        for node in own_nodes:
+            print(tegra_pmx_dt.format_node(node), file=f, end='')
+
+print('%d nodes common to all %d boards' % (len(common_nodes), len(boards)))
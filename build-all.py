@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import os
+import os.path
+import sys
+import tegra_pmx_build
+
+dbg = False
+
+parser = argparse.ArgumentParser(description='Regenerate all kernel and ' +
+    'U-Boot outputs whose inputs changed since they were last generated')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--outdir', default='out', help='Directory to write outputs to')
+parser.add_argument('--dry-run', action='store_true', help='List what would be rebuilt, and why, without running anything')
+parser.add_argument('--force', action='store_true', help='Rebuild everything, even if up to date')
+parser.add_argument('--watch', action='store_true', help='Keep running, and regenerate outputs whenever their inputs change')
+parser.add_argument('--watch-interval', type=float, default=0.2, help='Seconds between checks for changed inputs in --watch mode')
+parser.add_argument('-j', '--jobs', type=int, help='Number of steps to run in parallel (default: number of CPUs)')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+outdir = os.path.abspath(args.outdir)
+manifest = tegra_pmx_build.Manifest(os.path.join(outdir, 'manifest.json'))
+
+if args.watch:
+    try:
+        tegra_pmx_build.watch(outdir, manifest, args.watch_interval, dbg=dbg)
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+steps = tegra_pmx_build.all_steps(outdir)
+builder = tegra_pmx_build.Builder(steps, manifest, jobs=args.jobs, force=args.force, dbg=dbg)
+
+if args.dry_run:
+    builder.dry_run()
+    sys.exit(0)
+
+if not builder.build():
+    sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import filecmp
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import tegra_pmx_board_parser
+import tegra_pmx_soc_parser
+
+dbg = False
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+parser = argparse.ArgumentParser(description='Run every generator twice ' +
+    'for every SoC and board, and check that the outputs are identical')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+soc_names = tegra_pmx_soc_parser.soc_names()
+board_names = tegra_pmx_board_parser.board_names()
+
+# (script, config names, extra args, output file names)
+generators = (
+    ('soc-to-kernel-pinctrl-driver.py', soc_names, (), ('pinctrl.c',)),
+    ('soc-to-uboot-driver.py', soc_names, (), ('pinmux.h', 'pinmux.c')),
+    ('board-to-kernel-dt.py', board_names, (), ('pinmux.dtsi',)),
+    ('board-to-uboot.py', board_names, ('--reproducible',), ('pinmux-config.h',)),
+    ('board-to-reg-image.py', board_names, ('--format', 'bin'), ('pinmux-regs.bin',)),
+)
+
+# The runs use different SOURCE_DATE_EPOCH values (2014 vs 2026), so anything
+# that depends on the date rather than the inputs shows up as a difference.
+run_epochs = ('1400000000', '1790000000')
+
+def run_generator(script, extra_args, name, outputs, outdir, epoch):
+    cmd = [sys.executable, os.path.join(script_dir, script)]
+    cmd += extra_args
+    if len(outputs) == 1:
+        cmd += ['-o', os.path.join(outdir, outputs[0]), name]
+    else:
+        cmd += [name] + [os.path.join(outdir, output) for output in outputs]
+    if dbg: print(cmd)
+    env = dict(os.environ)
+    env['SOURCE_DATE_EPOCH'] = epoch
+    subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+failures = 0
+checked = 0
+with tempfile.TemporaryDirectory() as tmpdir:
+    for script, names, extra_args, outputs in generators:
+        for name in names:
+            outdirs = []
+            for run, epoch in enumerate(run_epochs):
+                outdir = os.path.join(tmpdir, script, name, str(run))
+                os.makedirs(outdir)
+                run_generator(script, extra_args, name, outputs, outdir, epoch)
+                outdirs.append(outdir)
+            for output in outputs:
+                checked += 1
+                fns = [os.path.join(outdir, output) for outdir in outdirs]
+                if not filecmp.cmp(fns[0], fns[1], shallow=False):
+                    print('ERROR: %s %s: %s differs between runs' % (script, name, output), file=sys.stderr)
+                    failures += 1
+
+print('%d outputs checked, %d not reproducible' % (checked, failures))
+if failures:
+    sys.exit(1)
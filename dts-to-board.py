@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import collections
+import concurrent.futures
+import io
+import os
+import os.path
+import re
+import sys
+import tegra_pmx_board_parser
+import tegra_pmx_dts_parser
+import tegra_pmx_soc_parser
+from tegra_pmx_utils import *
+
+dbg = False
+
+re_soc_prefix = re.compile('tegra[0-9]+-')
+
+def find_dts_files(paths):
+    dts_files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            dts_files.append(path)
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                if fn.endswith('.dts'):
+                    dts_files.append(os.path.join(dirpath, fn))
+    return dts_files
+
+# Board names are the DTS file names without the SoC prefix, unless that
+# makes them ambiguous (e.g. tegra30-apalis-eval.dts and
+# tegra124-apalis-eval.dts)
+def board_names(dts_files):
+    names = collections.OrderedDict()
+    for fn in dts_files:
+        names[fn] = os.path.splitext(os.path.basename(fn))[0]
+    short_names = collections.Counter(re_soc_prefix.sub('', name, 1) for name in names.values())
+    for fn, name in names.items():
+        short_name = re_soc_prefix.sub('', name, 1)
+        if short_names[short_name] == 1:
+            names[fn] = short_name
+    boards = collections.OrderedDict()
+    for fn, name in names.items():
+        if name in boards:
+            raise Exception('%s and %s both describe board %s' % (boards[name], fn, name))
+        boards[name] = fn
+    return boards
+
+# Runs in a worker process; returns the SoC, pin count, board file text and
+# the DT properties that couldn't be represented, or None if the file has no
+# pinmux nodes
+def convert(fn, socname, state, include_dirs, dbg):
+    pinmux = tegra_pmx_dts_parser.scan_dts_file(fn, include_dirs, dbg)
+    if not pinmux.states:
+        return None
+    nodes = tegra_pmx_dts_parser.dts_state_nodes(pinmux, state)
+    if not socname:
+        socs = [tegra_pmx_soc_parser.load_soc(name) for name in tegra_pmx_soc_parser.soc_names()]
+        socname = tegra_pmx_dts_parser.detect_dts_soc(pinmux, nodes, socs)
+    soc = tegra_pmx_soc_parser.load_soc(socname)
+    data = tegra_pmx_dts_parser.dts_board_data(nodes, soc)
+    text = io.StringIO()
+    tegra_pmx_board_parser.dump_board(soc, data['pins'], data['mipi_pad_ctrl_groups'], text)
+    return (socname, len(data['pins']), text.getvalue(), data['ignored'])
+
+def main():
+    global dbg
+
+    parser = argparse.ArgumentParser(description='Create board config ' +
+        'files from the pinmux nodes of kernel device tree source files')
+    parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+    parser.add_argument('--soc', help='SoC the boards use (default: detect it from each file\'s includes or pin configuration)')
+    parser.add_argument('--state', help='Name, label or path of the pinctrl state node to convert, where a file has several')
+    parser.add_argument('-I', '--include-dir', action='append', default=[], help='Also search this directory for #included files')
+    parser.add_argument('--outdir', default=tegra_pmx_board_parser.configs_dir, help='Directory to write the board files to (default: configs/)')
+    parser.add_argument('--force', action='store_true', help='Overwrite existing board files')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of files to convert in parallel (default: number of CPUs)')
+    parser.add_argument('paths', nargs='+', metavar='path', help='DTS file, or directory (e.g. arch/arm/boot/dts) to search for *.dts')
+    args = parser.parse_args()
+    if args.debug:
+        dbg = True
+    if dbg: print(args)
+
+    if args.soc:
+        tegra_pmx_soc_parser.load_soc(args.soc)
+
+    boards = board_names(find_dts_files(args.paths))
+    if not boards:
+        raise Exception('No .dts files found')
+
+    converted = 0
+    skipped = 0
+    failed = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = collections.OrderedDict()
+        for board, fn in boards.items():
+            outfn = os.path.join(args.outdir, board + '.board')
+            if os.path.exists(outfn) and not args.force:
+                print('%s: skipped; %s exists' % (board, outfn))
+                skipped += 1
+                continue
+            futures[board] = (outfn, executor.submit(convert, fn, args.soc, args.state, args.include_dir, dbg))
+        for board, (outfn, future) in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print('ERROR: %s: %s: %s' % (board, boards[board], e), file=sys.stderr)
+                failed += 1
+                continue
+            if not result:
+                if dbg: print('%s: skipped; no pinmux nodes' % board)
+                skipped += 1
+                continue
+            (socname, num_pins, text, ignored) = result
+            for what in ignored:
+                print('WARNING: %s: ignoring %s' % (board, what), file=sys.stderr)
+            changed = write_if_changed(outfn, text)
+            print('%s: %s, %d pins: %s %s' % (board, socname, num_pins, outfn, {True: 'updated', False: 'unchanged'}[changed]))
+            converted += 1
+
+    print('%d boards converted, %d skipped, %d failed' % (converted, skipped, failed))
+    if failed:
+        sys.exit(1)
+
+# The guard keeps process pool workers that re-import this script from
+# running it again
+if __name__ == '__main__':
+    main()
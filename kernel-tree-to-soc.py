@@ -0,0 +1,189 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import ast
+import collections
+import concurrent.futures
+import glob
+import io
+import os.path
+import re
+import sys
+import tegra_pmx_kernel_parser
+import tegra_pmx_soc_parser
+from tegra_pmx_utils import *
+
+dbg = False
+
+re_driver_fn = re.compile(r'pinctrl-(tegra\d+)\.c$')
+
+def find_drivers(kernel):
+    # The drivers moved into drivers/pinctrl/tegra/ in Linux 4.1
+    drivers = {}
+    for pattern in ('drivers/pinctrl/pinctrl-tegra*.c', 'drivers/pinctrl/tegra/pinctrl-tegra*.c'):
+        for fn in glob.glob(os.path.join(kernel, pattern)):
+            m = re_driver_fn.match(os.path.basename(fn))
+            if m:
+                drivers[m.group(1)] = fn
+    return drivers
+
+# name -> (first line, end line, value) for each top-level assignment, with
+# 0-based line numbers and an exclusive end
+def soc_assignments(text):
+    assignments = collections.OrderedDict()
+    for node in ast.parse(text).body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if not isinstance(target, ast.Name):
+                continue
+            value = ast.literal_eval(node.value)
+            assignments[target.id] = (node.lineno - 1, node.end_lineno, value)
+    return assignments
+
+def describe_change(name, old, new):
+    if isinstance(old, tuple) and isinstance(new, tuple):
+        # Tables of rows, keyed by the name in their first column
+        old = {row[0]: row for row in old}
+        new = {row[0]: row for row in new}
+    if isinstance(old, dict) and isinstance(new, dict):
+        added = len(new.keys() - old.keys())
+        removed = len(old.keys() - new.keys())
+        changed = len([k for k in new.keys() & old.keys() if old[k] != new[k]])
+        return '%s: %d added, %d removed, %d changed' % (name, added, removed, changed)
+    return '%s: %s -> %s' % (name, repr(old), repr(new))
+
+# Replaces each assignment in old_text with its counterpart from new_text
+# if the value differs. Everything that doesn't come from the kernel driver,
+# such as the U-Boot data, SoC register layout, MIPI pad control groups and
+# comments, is kept. Returns the merged text and a list of the changes.
+def merge_soc(old_text, new_text):
+    old_lines = old_text.splitlines(True)
+    new_lines = new_text.splitlines(True)
+    old = soc_assignments(old_text)
+    new = soc_assignments(new_text)
+
+    replacements = {}
+    inserts = collections.defaultdict(list)
+    changes = []
+    insert_at = 0
+    for name, (new_start, new_end, new_value) in new.items():
+        # e.g. newer drivers have no MODULE_AUTHOR()
+        if new_value is None:
+            continue
+        if not name in old:
+            inserts[insert_at].extend(new_lines[new_start:new_end])
+            changes.append('%s: added' % name)
+            continue
+        (old_start, old_end, old_value) = old[name]
+        insert_at = old_end
+        if old_value == new_value:
+            continue
+        new_block = new_lines[new_start:new_end]
+        for l in old_lines[old_start:old_end]:
+            if l.strip().startswith('#') and l not in new_block:
+                print('WARNING: %s: dropping comment: %s' % (name, l.strip()), file=sys.stderr)
+        replacements[old_start] = (old_end, new_block)
+        changes.append(describe_change(name, old_value, new_value))
+
+    merged = []
+    i = 0
+    while i <= len(old_lines):
+        merged.extend(inserts[i])
+        if i == len(old_lines):
+            break
+        if i in replacements:
+            (end, block) = replacements[i]
+            merged.extend(block)
+            i = end
+            continue
+        merged.append(old_lines[i])
+        i += 1
+    return (''.join(merged), changes)
+
+def refresh_soc(socname, driver, dry_run):
+    text = io.StringIO()
+    tegra_pmx_kernel_parser.dump_soc(driver, file=text)
+    fn = tegra_pmx_soc_parser.soc_filename(socname)
+    with open(fn) as f:
+        (merged, changes) = merge_soc(f.read(), text.getvalue())
+    if not changes:
+        print('%s: unchanged' % socname)
+        return
+    if dry_run:
+        print('%s: would update %s:' % (socname, os.path.relpath(fn)))
+    else:
+        write_if_changed(fn, merged)
+        print('%s: updated %s:' % (socname, os.path.relpath(fn)))
+    for change in changes:
+        print('    ' + change)
+
+def main():
+    global dbg
+
+    parser = argparse.ArgumentParser(description='Refresh the .soc files ' +
+        'of all SoCs from the Tegra pinctrl drivers in a kernel source tree')
+    parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change, without writing any .soc file')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of drivers to parse in parallel (default: number of CPUs)')
+    parser.add_argument('kernel', help='Kernel source tree to read the drivers from')
+    args = parser.parse_args()
+    if args.debug:
+        dbg = True
+    if dbg: print(args)
+
+    drivers = find_drivers(args.kernel)
+    if not drivers:
+        raise Exception('No Tegra pinctrl drivers found in ' + args.kernel)
+    socnames = tegra_pmx_soc_parser.soc_names()
+    for socname in sorted(drivers.keys() - set(socnames)):
+        print('%s: skipped; there is no .soc file for it' % socname)
+    for socname in sorted(set(socnames) - drivers.keys()):
+        print('WARNING: %s: no driver found' % socname, file=sys.stderr)
+
+    failed = False
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = collections.OrderedDict()
+        for socname in sorted(set(socnames) & drivers.keys()):
+            futures[socname] = executor.submit(
+                tegra_pmx_kernel_parser.parse_kernel_driver_file, drivers[socname])
+        for socname, future in futures.items():
+            try:
+                driver = future.result()
+            except Exception as e:
+                print('%s: failed to parse %s: %s' % (socname, drivers[socname], e))
+                failed = True
+                continue
+            if driver.soc != socname:
+                print('%s: %s describes %s' % (socname, drivers[socname], driver.soc))
+                failed = True
+                continue
+            refresh_soc(socname, driver, args.dry_run)
+
+    if failed:
+        sys.exit(1)
+
+# The guard keeps process pool workers that re-import this script from
+# running it again
+if __name__ == '__main__':
+    main()
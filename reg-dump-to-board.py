@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import io
+import sys
+import tegra_pmx_board_parser
+import tegra_pmx_regs
+import tegra_pmx_soc_parser
+from tegra_pmx_utils import *
+
+dbg = False
+
+parser = argparse.ArgumentParser(description='Decode a dump of the pinmux ' +
+    'registers into a board config file, and compare it against a board')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--soc', help='SoC the dump is from (default: that of --board)')
+parser.add_argument('--board', help='Board to compare the dump against; the differences are printed')
+parser.add_argument('--format', choices=('text', 'bin', 'image'), default='text',
+    help='Dump format: lines of an offset followed by register values, ' +
+    'consecutive little-endian 32-bit registers, or the (offset, value, mask) ' +
+    'triples of board-to-reg-image.py --format bin (default: text)')
+parser.add_argument('--base', type=lambda s: int(s, 0),
+    help='Offset from APB_MISC of the first register of a binary dump (default: the first pin register)')
+parser.add_argument('--apb-misc', type=lambda s: int(s, 0), default=0,
+    help='Address of APB_MISC, for text dumps that hold addresses rather than offsets (e.g. 0x70000000)')
+parser.add_argument('-o', '--output', help='Board file to write (default: stdout, unless --board is given)')
+parser.add_argument('dump', help='Register dump file')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+if args.board:
+    board = tegra_pmx_board_parser.load_board(args.board)
+    soc = board.soc
+    if args.soc and args.soc != soc.name:
+        raise Exception('Board %s uses SoC %s, not %s' % (args.board, soc.name, args.soc))
+elif args.soc:
+    soc = tegra_pmx_soc_parser.load_soc(args.soc)
+else:
+    raise Exception('One of --soc or --board is required')
+
+index = tegra_pmx_regs.RegIndex(soc)
+if args.format == 'bin':
+    base = args.base
+    if base is None:
+        base = soc.gpios_pins_by_reg()[0].reg
+    with open(args.dump, 'rb') as f:
+        blob = f.read()
+    if tegra_pmx_regs.is_reg_image_bin(blob, index):
+        raise Exception('%s looks like board-to-reg-image.py --format bin output; use --format image' % args.dump)
+    values = tegra_pmx_regs.parse_reg_dump_bin(blob, base)
+elif args.format == 'image':
+    with open(args.dump, 'rb') as f:
+        values = tegra_pmx_regs.parse_reg_image_bin(f.read())
+else:
+    with open(args.dump, 'r') as f:
+        values = tegra_pmx_regs.parse_reg_dump_text(f, args.apb_misc)
+
+dump = tegra_pmx_regs.decode_reg_dump(soc, values, index)
+if dbg: print(dump)
+for warning in dump.warnings:
+    print('WARNING: ' + warning, file=sys.stderr)
+# Contiguous dumps include the gaps between pin registers, so these are
+# only of interest when debugging
+if dbg and dump.unknown_regs:
+    print('Not pin or MIPI pad ctrl registers: ' + ' '.join('0x%x' % reg for reg in dump.unknown_regs))
+if not dump.pins and not dump.mipi_pad_ctrl_groups:
+    raise Exception('The dump holds no pin or MIPI pad ctrl registers of ' + soc.name)
+
+if args.output or not args.board:
+    text = io.StringIO()
+    tegra_pmx_board_parser.dump_board(soc, dump.pins, dump.mipi_pad_ctrl_groups, text)
+    if args.output:
+        changed = write_if_changed(args.output, text.getvalue())
+        print('%s: %s' % (args.output, {True: 'updated', False: 'unchanged'}[changed]))
+    else:
+        print(text.getvalue(), end='')
+
+if args.board:
+    diffs = tegra_pmx_regs.reg_dump_diffs(board, dump)
+    for diff in diffs:
+        print(diff)
+    print('%s: %d differences' % (args.board, len(diffs)))
+    if diffs:
+        sys.exit(1)
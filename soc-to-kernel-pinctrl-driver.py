@@ -24,6 +24,7 @@ import argparse
 import os
 import os.path
 import sys
+import tegra_pmx_regs
 import tegra_pmx_soc_parser
 from tegra_pmx_utils import *
 
@@ -32,6 +33,11 @@ dbg = False
 parser = argparse.ArgumentParser(description='Create a kernel pinctrl ' +
     'driver from an SoC config file')
 parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--compact', action='store_true',
+    help='Emit a compact pingroup table, expanded at probe time, and report its size on stderr')
+parser.add_argument('--regmap', action='store_true',
+    help='Also emit a regmap configuration, with register defaults, for each register bank')
+parser.add_argument('-o', '--output', help='File to write; only replaced if the content changes')
 parser.add_argument('soc', help='SoC to process')
 args = parser.parse_args()
 if args.debug:
@@ -40,6 +46,9 @@ if dbg: print(args)
 
 soc = tegra_pmx_soc_parser.load_soc(args.soc)
 
+if args.output:
+    out = OutputFile(args.output).redirect_stdout()
+
 print('''\
 // SPDX-License-Identifier: GPL-2.0-only
 /*
@@ -50,6 +59,14 @@ if soc.kernel_author != 'NVIDIA':
     print(' *')
     print(' * Author: %s' % soc.kernel_author)
 
+extra_includes = ''
+if args.regmap:
+    extra_includes += '#include <linux/err.h>\n'
+    extra_includes += '#include <linux/io.h>\n'
+    extra_includes += '#include <linux/regmap.h>\n'
+if args.compact:
+    extra_includes += '#include <linux/string.h>\n'
+
 print('''\
  *
  * Copyright (c) %s, NVIDIA CORPORATION.  All rights reserved.
@@ -60,14 +77,14 @@ print('''\
 #include <linux/platform_device.h>
 #include <linux/pinctrl/pinctrl.h>
 #include <linux/pinctrl/pinmux.h>
-
+%s
 #include "pinctrl-tegra.h"
 
 /*
  * Most pins affected by the pinmux can also be GPIOs. Define these first.
  * These must match how the GPIO driver names/numbers its pins.
  */
-''' % soc.kernel_copyright_years, end='')
+''' % (soc.kernel_copyright_years, extra_includes), end='')
 
 # Do not add any more exceptions here; new SoCs should be formatted correctly
 if soc.name == 'tegra30':
@@ -178,60 +195,61 @@ if len(soc.mipi_pad_ctrl_groups_by_reg()):
 #define MIPI_PAD_CTRL_PINGROUP_REG_Y(r)	((r) - MIPI_PAD_CTRL_PINGROUP_REG_A)
 ''', end='')
 
-print('''\
+def print_pingroup_table():
+    print('''\
 
 #define PINGROUP_BIT_Y(b)		(b)
 #define PINGROUP_BIT_N(b)		(-1)
 
 ''', end='')
 
-params = ['pg_name', 'f0', 'f1', 'f2', 'f3', 'r']
-if soc.soc_pins_have_od and not soc.soc_pins_all_have_od:
-    params += ['od',]
-if soc.soc_pins_have_ior:
-    params += ['ior',]
-if soc.soc_pins_have_rcv_sel:
-    params += ['rcv_sel',]
-if soc.soc_pins_have_hsm:
-    params += ['hsm',]
-if soc.soc_pins_have_schmitt and not soc.soc_pins_all_have_schmitt:
-    params += ['schmitt',]
-if soc.soc_pins_have_drvtype:
-    params += ['drvtype',]
-if soc.soc_pins_have_e_io_hv:
-    params += ['e_io_hv',]
-drive_params = ['drvdn_b', 'drvdn_w', 'drvup_b', 'drvup_w', 'slwr_b', 'slwr_w', 'slwf_b', 'slwf_w']
-if soc.soc_combine_pin_drvgroup:
-    params += ['rdrv',]
-    params += drive_params
+    params = ['pg_name', 'f0', 'f1', 'f2', 'f3', 'r']
+    if soc.soc_pins_have_od and not soc.soc_pins_all_have_od:
+        params += ['od',]
+    if soc.soc_pins_have_ior:
+        params += ['ior',]
+    if soc.soc_pins_have_rcv_sel:
+        params += ['rcv_sel',]
+    if soc.soc_pins_have_hsm:
+        params += ['hsm',]
+    if soc.soc_pins_have_schmitt and not soc.soc_pins_all_have_schmitt:
+        params += ['schmitt',]
+    if soc.soc_pins_have_drvtype:
+        params += ['drvtype',]
+    if soc.soc_pins_have_e_io_hv:
+        params += ['e_io_hv',]
+    drive_params = ['drvdn_b', 'drvdn_w', 'drvup_b', 'drvup_w', 'slwr_b', 'slwr_w', 'slwf_b', 'slwf_w']
+    if soc.soc_combine_pin_drvgroup:
+        params += ['rdrv',]
+        params += drive_params
 
-s = gen_wrapped_c_macro_header('PINGROUP', params)
+    s = gen_wrapped_c_macro_header('PINGROUP', params)
 
-einput_val = str(soc.soc_einput_b)
+    einput_val = str(soc.soc_einput_b)
 
-if soc.soc_pins_have_od:
-    if soc.soc_pins_all_have_od:
-        odrain_val = str(soc.soc_odrain_b)
+    if soc.soc_pins_have_od:
+        if soc.soc_pins_all_have_od:
+            odrain_val = str(soc.soc_odrain_b)
+        else:
+            odrain_val = 'PINGROUP_BIT_##od(%s)' % str(soc.soc_odrain_b)
     else:
-        odrain_val = 'PINGROUP_BIT_##od(%s)' % str(soc.soc_odrain_b)
-else:
-        odrain_val = '-1'
+            odrain_val = '-1'
 
-if soc.soc_pins_have_ior:
-    ioreset_val = 'PINGROUP_BIT_##ior(8)'
-else:
-    ioreset_val = '-1'
-
-# rcv_sel and e_io_hv are different names for essentially the same thing.
-# Re-use the field to save space
-if soc.soc_pins_have_rcv_sel:
-    rcv_sel_val = 'PINGROUP_BIT_##rcv_sel(9),'
-elif soc.soc_pins_have_e_io_hv:
-    rcv_sel_val = 'PINGROUP_BIT_##e_io_hv(10),'
-else:
-    rcv_sel_val = '-1,'
+    if soc.soc_pins_have_ior:
+        ioreset_val = 'PINGROUP_BIT_##ior(8)'
+    else:
+        ioreset_val = '-1'
+
+    # rcv_sel and e_io_hv are different names for essentially the same thing.
+    # Re-use the field to save space
+    if soc.soc_pins_have_rcv_sel:
+        rcv_sel_val = 'PINGROUP_BIT_##rcv_sel(9),'
+    elif soc.soc_pins_have_e_io_hv:
+        rcv_sel_val = 'PINGROUP_BIT_##e_io_hv(10),'
+    else:
+        rcv_sel_val = '-1,'
 
-s += '''\
+    s += '''\
 	{
 		.name = #pg_name,
 		.pins = pg_name##_pins,
@@ -256,34 +274,34 @@ s += '''\
 		.lock_bit = 7,
 		.ioreset_bit = %(ioreset_val)s,
 		.rcv_sel_bit = %(rcv_sel_val)s
-''' % globals()
+''' % locals()
 
-if soc.soc_pins_have_hsm:
-    s += '''\
+    if soc.soc_pins_have_hsm:
+        s += '''\
 		.hsm_bit = PINGROUP_BIT_##hsm(9),
 '''
 
-if soc.soc_pins_have_schmitt:
-    if soc.soc_pins_all_have_schmitt:
-        s += '''\
+    if soc.soc_pins_have_schmitt:
+        if soc.soc_pins_all_have_schmitt:
+            s += '''\
 		.schmitt_bit = 12,
 '''
-    else:
-        s += '''\
+        else:
+            s += '''\
 		.schmitt_bit = PINGROUP_BIT_##schmitt(12),
 '''
 
-if soc.soc_pins_have_drvtype:
-    s += '''\
+    if soc.soc_pins_have_drvtype:
+        s += '''\
 		.drvtype_bit = PINGROUP_BIT_##drvtype(13),
 '''
 
-if soc.soc_combine_pin_drvgroup:
-    # FIXME: if !soc.soc_pins_have_hsm, then we should include hsm_bit
-    # here. Same for schmitt and drvtype. However, no SoCs have that
-    # combination at present, so I don't feel like cluttering the code.
-    # We should also handle !soc_drvgroups_have_lpmd.
-    s += '''\
+    if soc.soc_combine_pin_drvgroup:
+        # FIXME: if !soc.soc_pins_have_hsm, then we should include hsm_bit
+        # here. Same for schmitt and drvtype. However, no SoCs have that
+        # combination at present, so I don't feel like cluttering the code.
+        # We should also handle !soc_drvgroups_have_lpmd.
+        s += '''\
 		.drv_reg = DRV_PINGROUP_REG(rdrv),
 		.drv_bank = 0,
 		.lpmd_bit = -1,
@@ -296,69 +314,69 @@ if soc.soc_combine_pin_drvgroup:
 		.slwf_bit = slwf_b,
 		.slwf_width = slwf_w,
 '''
-else:
-    s += '''\
+    else:
+        s += '''\
 		.drv_reg = -1,
 '''
 
-if soc.soc_pins_all_have_parked:
-    s += '''\
+    if soc.soc_pins_all_have_parked:
+        s += '''\
 		.parked_bitmask = BIT(%s),
 ''' % (soc.soc_parked_bit)
-else:
-    s+= '''\
+    else:
+        s+= '''\
 		.parked_bitmask = 0,
 '''
 
-s = append_aligned_tabs_indent_with_tabs(s, 72)
-print(s)
+    s = append_aligned_tabs_indent_with_tabs(s, 72)
+    print(s)
 
-print('''\
+    print('''\
 	}
 
 ''', end='')
 
-params = ['pg_name', 'r']
-if soc.soc_drvgroups_have_hsm:
-    params += ['hsm_b',]
-if soc.soc_drvgroups_have_schmitt:
-    params += ['schmitt_b',]
-if soc.soc_drvgroups_have_lpmd:
-    params += ['lpmd_b',]
-if soc.soc_drvgroups_have_parked:
-    params += ['prk_mask',]
-params += drive_params
-if soc.soc_drvgroups_have_drvtype:
-    params += ['drvtype',]
-
-s = gen_wrapped_c_macro_header('DRV_PINGROUP', params)
-
-if soc.soc_drvgroups_have_hsm:
-    hsm_bit_val = 'hsm_b'
-else:
-    hsm_bit_val = '-1'
+    params = ['pg_name', 'r']
+    if soc.soc_drvgroups_have_hsm:
+        params += ['hsm_b',]
+    if soc.soc_drvgroups_have_schmitt:
+        params += ['schmitt_b',]
+    if soc.soc_drvgroups_have_lpmd:
+        params += ['lpmd_b',]
+    if soc.soc_drvgroups_have_parked:
+        params += ['prk_mask',]
+    params += drive_params
+    if soc.soc_drvgroups_have_drvtype:
+        params += ['drvtype',]
 
-if soc.soc_drvgroups_have_schmitt:
-    schmitt_bit_val = 'schmitt_b'
-else:
-    schmitt_bit_val = '-1'
+    s = gen_wrapped_c_macro_header('DRV_PINGROUP', params)
 
-if soc.soc_drvgroups_have_lpmd:
-    lpmd_bit_val = 'lpmd_b'
-else:
-    lpmd_bit_val = '-1'
+    if soc.soc_drvgroups_have_hsm:
+        hsm_bit_val = 'hsm_b'
+    else:
+        hsm_bit_val = '-1'
 
-if soc.soc_drvgroups_have_parked:
-    parked_bit_mask = 'prk_mask'
-else:
-    parked_bit_mask = '0'
+    if soc.soc_drvgroups_have_schmitt:
+        schmitt_bit_val = 'schmitt_b'
+    else:
+        schmitt_bit_val = '-1'
 
-if soc.soc_drvgroups_have_drvtype:
-    drvtype_bit_val = 'PINGROUP_BIT_##drvtype(6),'
-else:
-    drvtype_bit_val = '-1,'
+    if soc.soc_drvgroups_have_lpmd:
+        lpmd_bit_val = 'lpmd_b'
+    else:
+        lpmd_bit_val = '-1'
+
+    if soc.soc_drvgroups_have_parked:
+        parked_bit_mask = 'prk_mask'
+    else:
+        parked_bit_mask = '0'
 
-s += '''\
+    if soc.soc_drvgroups_have_drvtype:
+        drvtype_bit_val = 'PINGROUP_BIT_##drvtype(6),'
+    else:
+        drvtype_bit_val = '-1,'
+
+    s += '''\
 	{
 		.name = "drive_" #pg_name,
 		.pins = drive_##pg_name##_pins,
@@ -386,18 +404,18 @@ s += '''\
 		.slwf_width = slwf_w,
 		.drvtype_bit = %(drvtype_bit_val)s
 		.parked_bitmask = %(parked_bit_mask)s,
-''' % globals()
+''' % locals()
 
-s = append_aligned_tabs_indent_with_tabs(s, 72)
-print(s)
+    s = append_aligned_tabs_indent_with_tabs(s, 72)
+    print(s)
 
-print('''\
+    print('''\
 	}
 
 ''', end='')
 
-if len(soc.mipi_pad_ctrl_groups_by_reg()):
-    print('''\
+    if len(soc.mipi_pad_ctrl_groups_by_reg()):
+        print('''\
 #define MIPI_PAD_CTRL_PINGROUP(pg_name, r, b, f0, f1)			\\
 	{								\\
 		.name = "mipi_pad_ctrl_" #pg_name,			\\
@@ -424,195 +442,446 @@ if len(soc.mipi_pad_ctrl_groups_by_reg()):
 
 ''', end='')
 
-print('''\
+    print('''\
 static const struct tegra_pingroup %s_groups[] = {
 ''' % soc.name, end='')
 
-# Do not add any more exceptions here; new SoCs should be formatted correctly
-if soc.name == 'tegra30':
-    max_gpio_pin_len = max([len(pin.fullname) for pin in soc.gpios_pins_by_reg()])
-    max_f0_len = 12
-    max_f1_len = 12
-    max_f2_len = 12
-    max_f3_len = 12
-    yn_width = 1
-    col_widths = (max_gpio_pin_len, max_f0_len, max_f1_len, max_f2_len, max_f3_len, 6, yn_width, yn_width)
-    if soc.soc_pins_have_rcv_sel:
-        col_widths += (yn_width,)
-    right_justifies = None
-elif soc.name in ('tegra114', 'tegra124'):
-    max_gpio_pin_len = max([len(pin.fullname) for pin in soc.gpios_pins_by_reg()])
-    max_f0_len = 10
-    max_f1_len = 10
-    max_f2_len = 12
-    max_f3_len = 11
-    yn_width = 2
-    col_widths = (max_gpio_pin_len, max_f0_len, max_f1_len, max_f2_len, max_f3_len, 6, yn_width, yn_width)
-    if soc.soc_pins_have_rcv_sel:
-        col_widths += (yn_width,)
-    right_justifies = (False, False, False, False, False, False, False, True, True, True)
-else:
-    col_widths = None
-    right_justifies = None
-
-headings = ['pg_name', 'f0', 'f1', 'f2', 'f3', 'r']
-if soc.soc_pins_have_od and not soc.soc_pins_all_have_od:
-    headings += ['od',]
-if soc.soc_pins_have_ior:
-    headings += ['ior',]
-if soc.soc_pins_have_rcv_sel:
-    headings += ['rcv_sel',]
-if soc.soc_pins_have_hsm:
-    headings += ['hsm',]
-if soc.soc_pins_have_schmitt and not soc.soc_pins_all_have_schmitt:
-    headings += ['schmitt',]
-if soc.soc_pins_have_drvtype:
-    headings += ['drvtype',]
-if soc.soc_pins_have_e_io_hv:
-    headings += ['e_io_hv',]
-if soc.soc_combine_pin_drvgroup:
-    headings += ['rdrv',]
-    headings += drive_params
-
-rows = []
-# Do not add any more exceptions here; new SoCs should be formatted correctly
-if soc.name == 'tegra30':
-    f = soc.gpios_pins_by_num
-else:
-    f = soc.gpios_pins_by_reg
-for pin in f():
-    if not pin.reg:
-        continue
-    row = (
-        pin.fullname,
-        pin.f0.upper(),
-        pin.f1.upper(),
-        pin.f2.upper(),
-        pin.f3.upper(),
-        '0x%x' % pin.reg,
-    )
+    # Do not add any more exceptions here; new SoCs should be formatted correctly
+    if soc.name == 'tegra30':
+        max_gpio_pin_len = max([len(pin.fullname) for pin in soc.gpios_pins_by_reg()])
+        max_f0_len = 12
+        max_f1_len = 12
+        max_f2_len = 12
+        max_f3_len = 12
+        yn_width = 1
+        col_widths = (max_gpio_pin_len, max_f0_len, max_f1_len, max_f2_len, max_f3_len, 6, yn_width, yn_width)
+        if soc.soc_pins_have_rcv_sel:
+            col_widths += (yn_width,)
+        right_justifies = None
+    elif soc.name in ('tegra114', 'tegra124'):
+        max_gpio_pin_len = max([len(pin.fullname) for pin in soc.gpios_pins_by_reg()])
+        max_f0_len = 10
+        max_f1_len = 10
+        max_f2_len = 12
+        max_f3_len = 11
+        yn_width = 2
+        col_widths = (max_gpio_pin_len, max_f0_len, max_f1_len, max_f2_len, max_f3_len, 6, yn_width, yn_width)
+        if soc.soc_pins_have_rcv_sel:
+            col_widths += (yn_width,)
+        right_justifies = (False, False, False, False, False, False, False, True, True, True)
+    else:
+        col_widths = None
+        right_justifies = None
+
+    headings = ['pg_name', 'f0', 'f1', 'f2', 'f3', 'r']
     if soc.soc_pins_have_od and not soc.soc_pins_all_have_od:
-        row += (boolean_to_yn(pin.od),)
+        headings += ['od',]
     if soc.soc_pins_have_ior:
-        row += (boolean_to_yn(pin.ior),)
+        headings += ['ior',]
     if soc.soc_pins_have_rcv_sel:
-        row += (boolean_to_yn(pin.rcv_sel),)
+        headings += ['rcv_sel',]
     if soc.soc_pins_have_hsm:
-        row += (boolean_to_yn(pin.hsm),)
+        headings += ['hsm',]
     if soc.soc_pins_have_schmitt and not soc.soc_pins_all_have_schmitt:
-        row += (boolean_to_yn(pin.schmitt),)
+        headings += ['schmitt',]
     if soc.soc_pins_have_drvtype:
-        row += (boolean_to_yn(pin.drvtype),)
+        headings += ['drvtype',]
     if soc.soc_pins_have_e_io_hv:
-        row += (boolean_to_yn(pin.e_io_hv),)
+        headings += ['e_io_hv',]
     if soc.soc_combine_pin_drvgroup:
-        if pin.per_pin_drive_group:
-            row += (
-                '0x%x' % pin.per_pin_drive_group.reg,
-                repr(pin.per_pin_drive_group.drvdn_b),
-                repr(pin.per_pin_drive_group.drvdn_w),
-                repr(pin.per_pin_drive_group.drvup_b),
-                repr(pin.per_pin_drive_group.drvup_w),
-                repr(pin.per_pin_drive_group.slwr_b),
-                repr(pin.per_pin_drive_group.slwr_w),
-                repr(pin.per_pin_drive_group.slwf_b),
-                repr(pin.per_pin_drive_group.slwf_w),
-            )
-        else:
-            row += (
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-                '-1',
-            )
-    rows.append(row)
-dump_c_table(headings, 'PINGROUP', rows, col_widths=col_widths, right_justifies=right_justifies)
-
-# Do not add any more exceptions here; new SoCs should be formatted correctly
-if soc.name != 'tegra30':
-    print()
+        headings += ['rdrv',]
+        headings += drive_params
 
-max_drvgrp_len = max([len(drvgroup.name) for drvgroup in soc.drive_groups_by_reg()])
-
-print('\t/* pg_name, r, ', end='')
-if soc.soc_drvgroups_have_hsm:
-    print('hsm_b, ', end='')
-if soc.soc_drvgroups_have_schmitt:
-    print('schmitt_b, ', end='')
-if soc.soc_drvgroups_have_lpmd:
-    print('lpmd_b, ', end='')
-if soc.soc_drvgroups_have_parked:
-    print('prk_mask, ', end='')
-print('drvdn_b, drvdn_w, drvup_b, drvup_w, slwr_b, slwr_w, slwf_b, slwf_w', end='')
-if soc.soc_drvgroups_have_drvtype:
-    print(', drvtype', end='')
-print(' */')
-
-rows = []
-# Do not add any more exceptions here; new SoCs should be formatted correctly
-if soc.name == 'tegra30':
-    f = soc.drive_groups_by_alpha
-else:
-    f = soc.drive_groups_by_reg
-# Do not add any more exceptions here; new SoCs should be formatted correctly
-if soc.name in ('tegra30', 'tegra114', 'tegra124'):
-    col_widths = (0, 0, 2, 2, 2, 3, 2, 3, 2, 3, 2, 3, 2, 2)
-    right_justifies = (False, False, True, True, True, True, True, True, True, True, True, True, True, True)
-else:
-    col_widths = None
-    right_justifies = None
-for drvgroup in f():
-    if drvgroup.has_matching_pin:
-        continue
-    row = (
-        drvgroup.name,
-        '0x%x' % drvgroup.reg,
-    )
+    rows = []
+    # Do not add any more exceptions here; new SoCs should be formatted correctly
+    if soc.name == 'tegra30':
+        f = soc.gpios_pins_by_num
+    else:
+        f = soc.gpios_pins_by_reg
+    for pin in f():
+        if not pin.reg:
+            continue
+        row = (
+            pin.fullname,
+            pin.f0.upper(),
+            pin.f1.upper(),
+            pin.f2.upper(),
+            pin.f3.upper(),
+            '0x%x' % pin.reg,
+        )
+        if soc.soc_pins_have_od and not soc.soc_pins_all_have_od:
+            row += (boolean_to_yn(pin.od),)
+        if soc.soc_pins_have_ior:
+            row += (boolean_to_yn(pin.ior),)
+        if soc.soc_pins_have_rcv_sel:
+            row += (boolean_to_yn(pin.rcv_sel),)
+        if soc.soc_pins_have_hsm:
+            row += (boolean_to_yn(pin.hsm),)
+        if soc.soc_pins_have_schmitt and not soc.soc_pins_all_have_schmitt:
+            row += (boolean_to_yn(pin.schmitt),)
+        if soc.soc_pins_have_drvtype:
+            row += (boolean_to_yn(pin.drvtype),)
+        if soc.soc_pins_have_e_io_hv:
+            row += (boolean_to_yn(pin.e_io_hv),)
+        if soc.soc_combine_pin_drvgroup:
+            if pin.per_pin_drive_group:
+                row += (
+                    '0x%x' % pin.per_pin_drive_group.reg,
+                    repr(pin.per_pin_drive_group.drvdn_b),
+                    repr(pin.per_pin_drive_group.drvdn_w),
+                    repr(pin.per_pin_drive_group.drvup_b),
+                    repr(pin.per_pin_drive_group.drvup_w),
+                    repr(pin.per_pin_drive_group.slwr_b),
+                    repr(pin.per_pin_drive_group.slwr_w),
+                    repr(pin.per_pin_drive_group.slwf_b),
+                    repr(pin.per_pin_drive_group.slwf_w),
+                )
+            else:
+                row += (
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                    '-1',
+                )
+        rows.append(row)
+    dump_c_table(headings, 'PINGROUP', rows, col_widths=col_widths, right_justifies=right_justifies)
+
+    # Do not add any more exceptions here; new SoCs should be formatted correctly
+    if soc.name != 'tegra30':
+        print()
+
+    max_drvgrp_len = max([len(drvgroup.name) for drvgroup in soc.drive_groups_by_reg()])
+
+    print('\t/* pg_name, r, ', end='')
     if soc.soc_drvgroups_have_hsm:
-        row += (repr(drvgroup.hsm_b),)
+        print('hsm_b, ', end='')
     if soc.soc_drvgroups_have_schmitt:
-        row += (repr(drvgroup.schmitt_b),)
+        print('schmitt_b, ', end='')
     if soc.soc_drvgroups_have_lpmd:
-        row += (repr(drvgroup.lpmd_b),)
+        print('lpmd_b, ', end='')
     if soc.soc_drvgroups_have_parked:
-        if (drvgroup.prk_mask != -1):
-                row += (hex(drvgroup.prk_mask),)
-        else:
-                row += (repr(drvgroup.prk_mask),)
-    row += (
-        repr(drvgroup.drvdn_b),
-        repr(drvgroup.drvdn_w),
-        repr(drvgroup.drvup_b),
-        repr(drvgroup.drvup_w),
-        repr(drvgroup.slwr_b),
-        repr(drvgroup.slwr_w),
-        repr(drvgroup.slwf_b),
-        repr(drvgroup.slwf_w),
-    )
+        print('prk_mask, ', end='')
+    print('drvdn_b, drvdn_w, drvup_b, drvup_w, slwr_b, slwr_w, slwf_b, slwf_w', end='')
     if soc.soc_drvgroups_have_drvtype:
-        row += (boolean_to_yn(drvgroup.drvtype),)
-    rows.append(row)
-dump_c_table(None, 'DRV_PINGROUP', rows, col_widths=col_widths, right_justifies=right_justifies)
+        print(', drvtype', end='')
+    print(' */')
 
-if len(soc.mipi_pad_ctrl_groups_by_reg()):
-    print()
-    headings = ('pg_name', 'r', 'b', 'f0', 'f1')
     rows = []
-    for group in soc.mipi_pad_ctrl_groups_by_reg():
+    # Do not add any more exceptions here; new SoCs should be formatted correctly
+    if soc.name == 'tegra30':
+        f = soc.drive_groups_by_alpha
+    else:
+        f = soc.drive_groups_by_reg
+    # Do not add any more exceptions here; new SoCs should be formatted correctly
+    if soc.name in ('tegra30', 'tegra114', 'tegra124'):
+        col_widths = (0, 0, 2, 2, 2, 3, 2, 3, 2, 3, 2, 3, 2, 2)
+        right_justifies = (False, False, True, True, True, True, True, True, True, True, True, True, True, True)
+    else:
+        col_widths = None
+        right_justifies = None
+    for drvgroup in f():
+        if drvgroup.has_matching_pin:
+            continue
         row = (
-            group.name,
-            '0x%x' % group.reg,
-            repr(group.bit),
-            group.f0.upper(),
-            group.f1.upper(),
+            drvgroup.name,
+            '0x%x' % drvgroup.reg,
         )
-    rows.append(row)
-    dump_c_table(headings, 'MIPI_PAD_CTRL_PINGROUP', rows )
+        if soc.soc_drvgroups_have_hsm:
+            row += (repr(drvgroup.hsm_b),)
+        if soc.soc_drvgroups_have_schmitt:
+            row += (repr(drvgroup.schmitt_b),)
+        if soc.soc_drvgroups_have_lpmd:
+            row += (repr(drvgroup.lpmd_b),)
+        if soc.soc_drvgroups_have_parked:
+            if (drvgroup.prk_mask != -1):
+                    row += (hex(drvgroup.prk_mask),)
+            else:
+                    row += (repr(drvgroup.prk_mask),)
+        row += (
+            repr(drvgroup.drvdn_b),
+            repr(drvgroup.drvdn_w),
+            repr(drvgroup.drvup_b),
+            repr(drvgroup.drvup_w),
+            repr(drvgroup.slwr_b),
+            repr(drvgroup.slwr_w),
+            repr(drvgroup.slwf_b),
+            repr(drvgroup.slwf_w),
+        )
+        if soc.soc_drvgroups_have_drvtype:
+            row += (boolean_to_yn(drvgroup.drvtype),)
+        rows.append(row)
+    dump_c_table(None, 'DRV_PINGROUP', rows, col_widths=col_widths, right_justifies=right_justifies)
+
+    if len(soc.mipi_pad_ctrl_groups_by_reg()):
+        print()
+        headings = ('pg_name', 'r', 'b', 'f0', 'f1')
+        rows = []
+        for group in soc.mipi_pad_ctrl_groups_by_reg():
+            row = (
+                group.name,
+                '0x%x' % group.reg,
+                repr(group.bit),
+                group.f0.upper(),
+                group.f1.upper(),
+            )
+        rows.append(row)
+        dump_c_table(headings, 'MIPI_PAD_CTRL_PINGROUP', rows )
+
+def print_compact_pingroup_table():
+    # Each group is split into the fields that vary between groups, which
+    # stay in the (narrow) table entries, and its bit layout: every other
+    # field that the PINGROUP/DRV_PINGROUP/MIPI_PAD_CTRL_PINGROUP macros set.
+    # Groups share the layout entries, of which there are only a few per SoC.
+    # A pupd_reg/tri_reg of 0 in a layout means "same as mux_reg".
+    def yn_bit(flag, bit):
+        if flag:
+            return bit
+        return -1
+
+    def pin_layout(pin):
+        layout = [
+            ('mux_bank', 1),
+            ('mux_bit', 0),
+            ('pupd_reg', 0),
+            ('pupd_bank', 1),
+            ('pupd_bit', 2),
+            ('tri_reg', 0),
+            ('tri_bank', 1),
+            ('tri_bit', 4),
+            ('einput_bit', soc.soc_einput_b),
+        ]
+        if soc.soc_pins_all_have_od:
+            layout.append(('odrain_bit', soc.soc_odrain_b))
+        elif soc.soc_pins_have_od:
+            layout.append(('odrain_bit', yn_bit(pin.od, soc.soc_odrain_b)))
+        else:
+            layout.append(('odrain_bit', -1))
+        layout.append(('lock_bit', 7))
+        if soc.soc_pins_have_ior:
+            layout.append(('ioreset_bit', yn_bit(pin.ior, 8)))
+        else:
+            layout.append(('ioreset_bit', -1))
+        if soc.soc_pins_have_rcv_sel:
+            layout.append(('rcv_sel_bit', yn_bit(pin.rcv_sel, 9)))
+        elif soc.soc_pins_have_e_io_hv:
+            layout.append(('rcv_sel_bit', yn_bit(pin.e_io_hv, 10)))
+        else:
+            layout.append(('rcv_sel_bit', -1))
+        if soc.soc_pins_have_hsm:
+            layout.append(('hsm_bit', yn_bit(pin.hsm, 9)))
+        if soc.soc_pins_all_have_schmitt:
+            layout.append(('schmitt_bit', 12))
+        elif soc.soc_pins_have_schmitt:
+            layout.append(('schmitt_bit', yn_bit(pin.schmitt, 12)))
+        if soc.soc_pins_have_drvtype:
+            layout.append(('drvtype_bit', yn_bit(pin.drvtype, 13)))
+        if soc.soc_combine_pin_drvgroup:
+            layout += [('drv_bank', 0), ('lpmd_bit', -1)]
+            for field in ('drvdn', 'drvup', 'slwr', 'slwf'):
+                if pin.per_pin_drive_group:
+                    layout += [
+                        (field + '_bit', getattr(pin.per_pin_drive_group, field + '_b')),
+                        (field + '_width', getattr(pin.per_pin_drive_group, field + '_w')),
+                    ]
+                else:
+                    layout += [(field + '_bit', -1), (field + '_width', -1)]
+        if soc.soc_pins_all_have_parked:
+            layout.append(('parked_bitmask', 'BIT(%d)' % soc.soc_parked_bit))
+        else:
+            layout.append(('parked_bitmask', 0))
+        return tuple(layout)
+
+    def drive_group_layout(drvgroup):
+        layout = [('pupd_reg', -1), ('tri_reg', -1)]
+        for field in ('einput_bit', 'odrain_bit', 'lock_bit', 'ioreset_bit', 'rcv_sel_bit'):
+            layout.append((field, -1))
+        layout += [
+            ('drv_bank', 0),
+            ('hsm_bit', yn_bit(soc.soc_drvgroups_have_hsm, getattr(drvgroup, 'hsm_b', -1))),
+            ('schmitt_bit', yn_bit(soc.soc_drvgroups_have_schmitt, getattr(drvgroup, 'schmitt_b', -1))),
+            ('lpmd_bit', yn_bit(soc.soc_drvgroups_have_lpmd, getattr(drvgroup, 'lpmd_b', -1))),
+        ]
+        for field in ('drvdn', 'drvup', 'slwr', 'slwf'):
+            layout += [
+                (field + '_bit', getattr(drvgroup, field + '_b')),
+                (field + '_width', getattr(drvgroup, field + '_w')),
+            ]
+        layout.append(('drvtype_bit', yn_bit(soc.soc_drvgroups_have_drvtype and drvgroup.drvtype, 6)))
+        if soc.soc_drvgroups_have_parked:
+            if drvgroup.prk_mask != -1:
+                layout.append(('parked_bitmask', hex(drvgroup.prk_mask)))
+            else:
+                layout.append(('parked_bitmask', -1))
+        else:
+            layout.append(('parked_bitmask', 0))
+        return tuple(layout)
+
+    def mipi_pad_ctrl_group_layout(group):
+        layout = [('mux_bank', 2), ('mux_bit', group.bit), ('pupd_reg', -1), ('tri_reg', -1)]
+        for field in ('einput_bit', 'odrain_bit', 'lock_bit', 'ioreset_bit', 'rcv_sel_bit'):
+            layout.append((field, -1))
+        return tuple(layout)
+
+    layouts = []
+    def layout_index(layout):
+        if layout not in layouts:
+            layouts.append(layout)
+        return str(layouts.index(layout))
+
+    # Same group order as the full table
+    pin_rows = []
+    if soc.name == 'tegra30':
+        f = soc.gpios_pins_by_num
+    else:
+        f = soc.gpios_pins_by_reg
+    for pin in f():
+        if not pin.reg:
+            continue
+        if soc.soc_combine_pin_drvgroup and pin.per_pin_drive_group:
+            rdrv = 'DRV_PINGROUP_REG(0x%x)' % pin.per_pin_drive_group.reg
+        else:
+            rdrv = 'PINGROUP_REG_NONE'
+        pin_rows.append((pin.fullname,) + tuple(func.upper() for func in pin.funcs) +
+            (layout_index(pin_layout(pin)), 'PINGROUP_REG(0x%x)' % pin.reg, rdrv))
+    drv_rows = []
+    if soc.name == 'tegra30':
+        f = soc.drive_groups_by_alpha
+    else:
+        f = soc.drive_groups_by_reg
+    for drvgroup in f():
+        if drvgroup.has_matching_pin:
+            continue
+        drv_rows.append((drvgroup.fullname, layout_index(drive_group_layout(drvgroup)),
+            'DRV_PINGROUP_REG(0x%x)' % drvgroup.reg))
+    mipi_rows = []
+    for group in soc.mipi_pad_ctrl_groups_by_reg():
+        mipi_rows.append((group.fullname, group.f0.upper(), group.f1.upper(), 'RSVD3', 'RSVD4',
+            layout_index(mipi_pad_ctrl_group_layout(group)),
+            'MIPI_PAD_CTRL_PINGROUP_REG_Y(0x%x)' % group.reg, 'PINGROUP_REG_NONE'))
+    ngroups = len(pin_rows) + len(drv_rows) + len(mipi_rows)
+
+    print('''\
+
+/*
+ * Compact form of struct tegra_pingroup. The fields that are the same for
+ * many groups live in %(soc)s_pingroup_layouts[]; %(soc)s_expand_group()
+ * rebuilds the full struct tegra_pingroup from an entry and its layout.
+ * Register offsets are bank-relative, or PINGROUP_REG_NONE if absent.
+ *
+ * The compact tables are only used by the probe function, which expands
+ * them into %(soc)s_expanded_groups[] once, at boot. They are init data,
+ * freed afterwards, so only the expanded table remains at run-time.
+ */
+struct tegra_pingroup_compact {
+	const char *name;
+	const unsigned *pins;
+	u8 npins;
+	u8 funcs[4];
+	u8 layout;
+	u16 mux_reg;
+	u16 drv_reg;
+};
+
+#define PINGROUP_REG_NONE		0xffff
+
+static const struct tegra_pingroup %(soc)s_pingroup_layouts[] __initconst = {
+''' % {'soc': soc.name}, end='')
+
+    for layout in layouts:
+        print('\t{')
+        for field, val in layout:
+            print('\t\t.%s = %s,' % (field, val))
+        print('\t},')
+
+    print('''\
+};
+
+#define COMPACT_PINGROUP(pg_name, f0, f1, f2, f3, l, r, rdrv)	\\
+	{							\\
+		.name = #pg_name,				\\
+		.pins = pg_name##_pins,				\\
+		.npins = ARRAY_SIZE(pg_name##_pins),		\\
+		.funcs = {					\\
+			TEGRA_MUX_##f0,				\\
+			TEGRA_MUX_##f1,				\\
+			TEGRA_MUX_##f2,				\\
+			TEGRA_MUX_##f3,				\\
+		},						\\
+		.layout = l,					\\
+		.mux_reg = r,					\\
+		.drv_reg = rdrv,				\\
+	}
+
+#define COMPACT_DRV_PINGROUP(pg_name, l, r)			\\
+	{							\\
+		.name = #pg_name,				\\
+		.pins = pg_name##_pins,				\\
+		.npins = ARRAY_SIZE(pg_name##_pins),		\\
+		.layout = l,					\\
+		.mux_reg = PINGROUP_REG_NONE,			\\
+		.drv_reg = r,					\\
+	}
+
+static void __init %(soc)s_expand_group(struct tegra_pingroup *g,
+			const struct tegra_pingroup_compact *c)
+{
+	*g = %(soc)s_pingroup_layouts[c->layout];
+	g->name = c->name;
+	g->pins = c->pins;
+	g->npins = c->npins;
+	memcpy(g->funcs, c->funcs, sizeof(g->funcs));
+	g->mux_reg = c->mux_reg == PINGROUP_REG_NONE ? -1 : c->mux_reg;
+	if (!g->pupd_reg)
+		g->pupd_reg = g->mux_reg;
+	if (!g->tri_reg)
+		g->tri_reg = g->mux_reg;
+	g->drv_reg = c->drv_reg == PINGROUP_REG_NONE ? -1 : c->drv_reg;
+}
+
+static const struct tegra_pingroup_compact %(soc)s_groups[] __initconst = {
+''' % {'soc': soc.name}, end='')
+
+    headings = ('pg_name', 'f0', 'f1', 'f2', 'f3', 'l', 'r', 'rdrv')
+    dump_c_table(headings, 'COMPACT_PINGROUP', pin_rows)
+    print()
+    dump_c_table(('pg_name', 'l', 'r'), 'COMPACT_DRV_PINGROUP', drv_rows)
+    if mipi_rows:
+        print()
+        dump_c_table(headings, 'COMPACT_PINGROUP', mipi_rows)
+
+    # Sizes for 64-bit kernels. struct tegra_pingroup is 72 bytes: two
+    # pointers, npins and funcs, four s32 registers, 6 words of bitfields and
+    # parked_bitmask. struct tegra_pingroup_compact is 32 bytes.
+    # pinctrl-tegra.c indexes soc_data->groups directly, so the expanded
+    # table takes as much memory at run-time as the full one would; only the
+    # image shrinks, since the expanded table is BSS and the compact one is
+    # freed with the other init data.
+    full_size = 72 * ngroups
+    compact_size = 32 * ngroups + 72 * len(layouts)
+    print('%s: pingroup table %d bytes, compact table %d bytes (%d groups, %d layouts), %d%% smaller' %
+        (soc.name, full_size, compact_size, ngroups, len(layouts),
+        100 * (full_size - compact_size) // full_size), file=sys.stderr)
+    print('%s: net, the image is %d bytes smaller; after boot, the %d byte expanded table uses as much memory as the full one' %
+        (soc.name, full_size - compact_size, full_size), file=sys.stderr)
+
+if args.compact:
+    print_compact_pingroup_table()
+else:
+    print_pingroup_table()
+
+print('''\
+};
+''')
+
+if args.compact:
+    print('''\
+static struct tegra_pingroup %(soc)s_expanded_groups[ARRAY_SIZE(%(soc)s_groups)];
+''' % {'soc': soc.name})
 
 socvars = {
     'author': soc.kernel_author,
@@ -623,9 +892,166 @@ socvars = {
     'drvtype_in_mux': boolean_to_c_bool(soc.soc_pins_have_drvtype),
 }
 
-print('''\
+if args.regmap:
+    socvars['regmap_decl'] = '\tint ret;\n'
+    socvars['regmap_call'] = '''\
+	ret = %(soc)s_pinctrl_init_regmaps(pdev);
+	if (ret)
+		return ret;
+
+''' % socvars
+else:
+    socvars['regmap_decl'] = ''
+    socvars['regmap_call'] = ''
+
+# TABs then spaces, up to column col (from 0), to align a continuation line
+def c_indent_to(col):
+    return '\t' * (col // 8) + ' ' * (col % 8)
+
+if args.compact:
+    socvars['groups'] = '''\
+	.groups = %(soc)s_expanded_groups,
+	.ngroups = ARRAY_SIZE(%(soc)s_expanded_groups),
+''' % socvars
+    # The probe function reads init data, so it must only run at boot:
+    # platform_driver_probe() neither defers nor allows rebinding
+    socvars['probe'] = '''\
+static int __init %(soc)s_pinctrl_probe(struct platform_device *pdev)
+{
+	unsigned int i;
+%(regmap_decl)s
+	for (i = 0; i < ARRAY_SIZE(%(soc)s_groups); i++)
+		%(soc)s_expand_group(&%(soc)s_expanded_groups[i],
+%(expand_indent)s&%(soc)s_groups[i]);
+
+%(regmap_call)s	return tegra_pinctrl_probe(pdev, &%(soc)s_pinctrl);
+}''' % dict(socvars, expand_indent=c_indent_to(16 + len('%s_expand_group(' % soc.name)))
+    socvars['driver_probe'] = ''
+    socvars['register'] = 'platform_driver_probe(&%(soc)s_pinctrl_driver,\n%(indent)s%(soc)s_pinctrl_probe)' % dict(socvars,
+        indent=c_indent_to(8 + len('return platform_driver_probe(')))
+else:
+    socvars['groups'] = '''\
+	.groups = %(soc)s_groups,
+	.ngroups = ARRAY_SIZE(%(soc)s_groups),
+''' % socvars
+    socvars['probe'] = '''\
+static int %(soc)s_pinctrl_probe(struct platform_device *pdev)
+{
+%(regmap_decl)s%(regmap_blank)s%(regmap_call)s	return tegra_pinctrl_probe(pdev, &%(soc)s_pinctrl);
+}''' % dict(socvars, regmap_blank=socvars['regmap_decl'] and '\n')
+    socvars['driver_probe'] = '\t.probe = %(soc)s_pinctrl_probe,\n' % socvars
+    socvars['register'] = 'platform_driver_register(&%(soc)s_pinctrl_driver)' % socvars
+
+if args.regmap:
+    # (name, register macro, registers) for each bank, in bank order
+    banks = [
+        ('drv', 'DRV_PINGROUP_REG', [group.reg for group in soc.drive_groups_by_reg()]),
+        ('mux', 'PINGROUP_REG', [pin.reg for pin in soc.gpios_pins_by_reg()]),
+    ]
+    if len(soc.mipi_pad_ctrl_groups_by_reg()):
+        regs = sorted(set(group.reg for group in soc.mipi_pad_ctrl_groups_by_reg()))
+        banks.append(('mipi', 'MIPI_PAD_CTRL_PINGROUP_REG_Y', regs))
+
+    print('''\
+/*
+ * regmap configuration for each register bank, in the order of the
+ * controller's reg entries. No pinmux register is changed by hardware, so
+ * each bank's volatile table is empty and all registers can be cached.
+ * Registers with a known reset value are listed in the bank's reg_defaults,
+ * so that the cache can be populated without reading the hardware; the
+ * others are read on first access.
+ *
+ * The probe function creates a regmap for each bank, which exposes the
+ * registers in debugfs. pinctrl-tegra.c still writes the registers
+ * directly, so the cache is bypassed until the driver is converted to
+ * access them through these regmaps.
+ */
+''')
+
+    for bank, macro, regs in banks:
+        bankvars = {
+            'soc': soc.name,
+            'bank': bank,
+            'max_reg': '%s(0x%x)' % (macro, regs[-1]),
+        }
+        defaults = [(reg, soc.reset_value(reg)) for reg in regs if soc.reset_value(reg) is not None]
+        if defaults:
+            print('static const struct reg_default %(soc)s_%(bank)s_reg_defaults[] = {' % bankvars)
+            for reg, val in defaults:
+                print('\t{ %s(0x%x), 0x%08x },' % (macro, reg, val))
+            print('};')
+            print()
+
+        print('static const struct regmap_range %(soc)s_%(bank)s_ranges[] = {' % bankvars)
+        for first, last in tegra_pmx_regs.reg_ranges(regs):
+            print('\tregmap_reg_range(%s(0x%x), %s(0x%x)),' % (macro, first, macro, last))
+        print('''\
+};
+
+static const struct regmap_access_table %(soc)s_%(bank)s_access_table = {
+	.yes_ranges = %(soc)s_%(bank)s_ranges,
+	.n_yes_ranges = ARRAY_SIZE(%(soc)s_%(bank)s_ranges),
+};
+
+static const struct regmap_access_table %(soc)s_%(bank)s_volatile_table = {
+	.n_yes_ranges = 0,
+};
+
+static const struct regmap_config %(soc)s_%(bank)s_regmap_config = {
+	.name = "%(bank)s",
+	.reg_bits = 32,
+	.val_bits = 32,
+	.reg_stride = 4,
+	.max_register = %(max_reg)s,
+	.rd_table = &%(soc)s_%(bank)s_access_table,
+	.wr_table = &%(soc)s_%(bank)s_access_table,
+	.volatile_table = &%(soc)s_%(bank)s_volatile_table,''' % bankvars)
+        if defaults:
+            print('''\
+	.reg_defaults = %(soc)s_%(bank)s_reg_defaults,
+	.num_reg_defaults = ARRAY_SIZE(%(soc)s_%(bank)s_reg_defaults),''' % bankvars)
+        print('''\
+	.cache_type = REGCACHE_RBTREE,
 };
+''')
+
+    print('''\
+static int %s_pinctrl_init_regmaps(struct platform_device *pdev)
+{
+	static const struct regmap_config * const configs[] = {''' % soc.name)
+    for bank, macro, regs in banks:
+        print('\t\t&%s_%s_regmap_config,' % (soc.name, bank))
+    print('''\
+	};
+	unsigned int i;
+
+	for (i = 0; i < ARRAY_SIZE(configs); i++) {
+		struct resource *res;
+		void __iomem *base;
+		struct regmap *map;
+
+		res = platform_get_resource(pdev, IORESOURCE_MEM, i);
+		if (!res)
+			return -ENODEV;
+
+		/* tegra_pinctrl_probe() requests the region itself */
+		base = devm_ioremap(&pdev->dev, res->start, resource_size(res));
+		if (!base)
+			return -ENOMEM;
+
+		map = devm_regmap_init_mmio(&pdev->dev, base, configs[i]);
+		if (IS_ERR(map))
+			return PTR_ERR(map);
+
+		regcache_cache_bypass(map, true);
+	}
+
+	return 0;
+}
+''')
 
+
+print('''\
 static const struct tegra_pinctrl_soc_data %(soc)s_pinctrl = {
 	.ngpios = NUM_GPIOS,
 	.gpio_compatible = "nvidia,%(soc)s-gpio",
@@ -633,17 +1059,12 @@ static const struct tegra_pinctrl_soc_data %(soc)s_pinctrl = {
 	.npins = ARRAY_SIZE(%(soc)s_pins),
 	.functions = %(soc)s_functions,
 	.nfunctions = ARRAY_SIZE(%(soc)s_functions),
-	.groups = %(soc)s_groups,
-	.ngroups = ARRAY_SIZE(%(soc)s_groups),
-	.hsm_in_mux = %(hsm_in_mux)s,
+%(groups)s	.hsm_in_mux = %(hsm_in_mux)s,
 	.schmitt_in_mux = %(schmitt_in_mux)s,
 	.drvtype_in_mux = %(drvtype_in_mux)s,
 };
 
-static int %(soc)s_pinctrl_probe(struct platform_device *pdev)
-{
-	return tegra_pinctrl_probe(pdev, &%(soc)s_pinctrl);
-}
+%(probe)s
 
 static const struct of_device_id %(soc)s_pinctrl_of_match[] = {
 	{ .compatible = "nvidia,%(soc)s-pinmux", },
@@ -655,12 +1076,14 @@ static struct platform_driver %(soc)s_pinctrl_driver = {
 		.name = "%(soc)s-pinctrl",
 		.of_match_table = %(soc)s_pinctrl_of_match,
 	},
-	.probe = %(soc)s_pinctrl_probe,
-};
+%(driver_probe)s};
 
 static int __init %(soc)s_pinctrl_init(void)
 {
-	return platform_driver_register(&%(soc)s_pinctrl_driver);
+	return %(register)s;
 }
 arch_initcall(%(soc)s_pinctrl_init);
 ''' % socvars, end='')
+
+if args.output:
+    out.close()
@@ -42,7 +42,7 @@ if dbg: print(args)
 
 soc = tegra_pmx_soc_parser.load_soc(args.soc)
 
-f = open(args.header, 'wt')
+f = OutputFile(args.header)
 
 print('''\
 /*
@@ -171,7 +171,7 @@ print('''\
 ''' % soc.name.upper(), file=f, end='')
 
 f.close()
-f = open(args.cfile, 'wt')
+f = OutputFile(args.cfile)
 
 print('''\
 /*
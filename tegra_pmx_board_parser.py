@@ -18,21 +18,28 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import glob
 import os.path
 import sys
 import tegra_pmx_soc_parser
 from tegra_pmx_parser_utils import *
+from tegra_pmx_utils import *
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 configs_dir = os.path.join(script_dir, 'configs')
 
+# The columns of a board file's pins table, which depend on the SoC
+def pin_config_fields(soc):
+    fields = ('fullname', 'mux', 'gpio_init', 'pull', 'tri', 'e_inp', 'od')
+    if soc.soc_pins_have_rcv_sel:
+        fields += ('rcv_sel', )
+    if soc.soc_pins_have_e_io_hv:
+        fields += ('e_io_hv', )
+    return fields
+
 class PinConfig(ReprDictObj):
     def __init__(self, soc, data):
-        fields = ('fullname', 'mux', 'gpio_init', 'pull', 'tri', 'e_inp', 'od')
-        if soc.soc_pins_have_rcv_sel:
-            fields += ('rcv_sel', )
-        if soc.soc_pins_have_e_io_hv:
-            fields += ('e_io_hv', )
+        fields = pin_config_fields(soc)
         for i, field in enumerate(fields):
             self.__setattr__(field, data[i])
         self.gpio_pin = soc.gpio_or_pin_by_fullname(self.fullname)
@@ -52,6 +59,7 @@ class Board(TopLevelParsedObj):
         self.definename = name.upper().replace('-', '_')
 
         self.soc = tegra_pmx_soc_parser.load_soc(data['soc'])
+        self.uboot_copyright_years = data.get('uboot_copyright_years', self.soc.uboot_copyright_years)
 
         self._pincfgs = []
         for num, pindata in enumerate(data['pins']):
@@ -67,6 +75,19 @@ class Board(TopLevelParsedObj):
                 mipipadctrlcfg = MipiPadCtrlConfig(self.soc, pindata)
                 self._mipipadctrlcfgs.append(mipipadctrlcfg)
 
+        # Pins that boot firmware must configure before anything else, given
+        # by pin name or by mux function; see board-to-uboot.py --split-early
+        self.early_pins = data.get('early_pins', ())
+        self.early_functions = data.get('early_functions', ())
+        pin_names = [pincfg.fullname for pincfg in self._pincfgs]
+        for pin in self.early_pins:
+            if pin not in pin_names:
+                raise Exception('early_pins entry %s is not a configured pin' % pin)
+        functions = [pincfg.mux for pincfg in self._pincfgs]
+        for function in self.early_functions:
+            if function not in functions:
+                raise Exception('early_functions entry %s is not used by any pin' % function)
+
         self._generate_derived_data()
 
     def _generate_derived_data(self):
@@ -79,6 +100,9 @@ class Board(TopLevelParsedObj):
     def pincfgs_by_num(self):
         return self._pincfgs_by_num
 
+    def pincfg_is_early(self, pincfg):
+        return pincfg.fullname in self.early_pins or pincfg.mux in self.early_functions
+
     def mipipadctrlcfgs_by_conf_order(self):
         return self._mipipadctrlcfgs
 
@@ -92,11 +116,49 @@ class Board(TopLevelParsedObj):
         for gpio_pin in unconfigured_gpio_pins:
             print('WARNING: Unconfigured pin ' + gpio_pin, file=sys.stderr)
 
-def load_board(boardname):
-    fn = os.path.join(configs_dir, boardname + '.board')
+def board_names():
+    fns = glob.glob(os.path.join(configs_dir, '*.board'))
+    return sorted(os.path.basename(fn)[:-6] for fn in fns)
+
+def board_filename(boardname):
+    return os.path.join(configs_dir, boardname + '.board')
+
+def load_board_data(boardname):
+    fn = board_filename(boardname)
     d = {}
     with open(fn) as f:
         code = compile(f.read(), fn, 'exec')
         exec(code, globals(), d)
+    return d
 
-    return Board(boardname, d)
+def load_board(boardname):
+    return Board(boardname, load_board_data(boardname))
+
+# Writes a board file. Each entry of pins is a dict keyed by
+# pin_config_fields(), and each entry of mipi_pad_ctrl_groups is a (name,
+# mux) tuple.
+def dump_board(soc, pins, mipi_pad_ctrl_groups, file, early_pins=(), uboot_copyright_years=None):
+    print('soc = \'%s\'' % soc.name, file=file)
+    print(file=file)
+    if uboot_copyright_years:
+        print('uboot_copyright_years =', repr(uboot_copyright_years), file=file)
+        print(file=file)
+    if early_pins:
+        print('early_pins = (', file=file)
+        for pin in early_pins:
+            print('    %s,' % repr(pin), file=file)
+        print(')', file=file)
+        print(file=file)
+    fields = pin_config_fields(soc)
+    print('pins = (', file=file)
+    rows = [tuple(repr(pin[field]) for field in fields) for pin in pins]
+    dump_py_table(('pin',) + fields[1:], rows, file=file)
+    print(')', file=file)
+    print('', file=file)
+    print('drive_groups = (', file=file)
+    print(')', file=file)
+    print('', file=file)
+    print('mipi_pad_ctrl_groups = (', file=file)
+    rows = [(repr(name), repr(mux)) for (name, mux) in mipi_pad_ctrl_groups]
+    dump_py_table(('pin', 'mux'), rows, file=file)
+    print(')', file=file)
@@ -0,0 +1,411 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import concurrent.futures
+import contextlib
+import difflib
+import hashlib
+import io
+import json
+import os
+import os.path
+import runpy
+import subprocess
+import sys
+import time
+import traceback
+import tegra_pmx_board_parser
+import tegra_pmx_soc_parser
+from tegra_pmx_csv_parser import supported_boards
+from tegra_pmx_parser_utils import *
+from tegra_pmx_utils import *
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+soc_parser_modules = (
+    'tegra_pmx_parser_utils.py',
+    'tegra_pmx_soc_parser.py',
+    'tegra_pmx_utils.py',
+)
+
+board_parser_modules = soc_parser_modules + (
+    'tegra_pmx_board_parser.py',
+)
+
+def relpath(fn):
+    return os.path.relpath(fn, script_dir)
+
+def hash_file(fn):
+    with open(os.path.join(script_dir, fn), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class Step(ReprDictObj):
+    def __init__(self, name, script, args, inputs, outputs):
+        self.name = name
+        self.script = script
+        self.args = args
+        # Inputs are relative to script_dir, so that the manifest doesn't
+        # depend on where the tree is checked out.
+        self.inputs = (script,) + tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.deps = []
+        self.dependents = []
+
+    def command(self):
+        return [sys.executable, os.path.join(script_dir, self.script)] + list(self.args)
+
+    def input_hashes(self):
+        return {fn: hash_file(fn) for fn in self.inputs}
+
+def csv_steps(boardname):
+    board_conf = supported_boards[boardname]
+    if not os.path.exists(os.path.join(script_dir, board_conf['filename'])):
+        return
+    soc_fn = relpath(tegra_pmx_soc_parser.soc_filename(board_conf['soc']))
+    inputs = board_parser_modules + ('tegra_pmx_csv_parser.py', 'tegra_pmx_xlsx.py', soc_fn, board_conf['filename'])
+    fn = tegra_pmx_board_parser.board_filename(boardname)
+    yield Step('csv-to-board/' + boardname,
+        'csv-to-board.py', [boardname], inputs, (fn,))
+
+def soc_steps(socname, outdir):
+    soc_fn = relpath(tegra_pmx_soc_parser.soc_filename(socname))
+    inputs = soc_parser_modules + (soc_fn,)
+
+    fn = os.path.join(outdir, 'kernel', 'pinctrl-%s.c' % socname)
+    yield Step('kernel-pinctrl-driver/' + socname,
+        'soc-to-kernel-pinctrl-driver.py', ['-o', fn, socname], inputs, (fn,))
+
+    header = os.path.join(outdir, 'uboot', socname, 'pinmux.h')
+    cfile = os.path.join(outdir, 'uboot', socname, 'pinmux.c')
+    yield Step('uboot-driver/' + socname,
+        'soc-to-uboot-driver.py', [socname, header, cfile], inputs, (header, cfile))
+
+def board_steps(boardname, outdir):
+    if boardname in supported_boards:
+        socname = supported_boards[boardname]['soc']
+    else:
+        socname = tegra_pmx_board_parser.load_board_data(boardname)['soc']
+    board_fn = relpath(tegra_pmx_board_parser.board_filename(boardname))
+    soc_fn = relpath(tegra_pmx_soc_parser.soc_filename(socname))
+    inputs = board_parser_modules + (board_fn, soc_fn)
+
+    fn = os.path.join(outdir, 'kernel', '%s-pinmux.dtsi' % boardname)
+    yield Step('kernel-dt/' + boardname,
+        'board-to-kernel-dt.py', ['-o', fn, boardname], inputs + ('tegra_pmx_dt.py',), (fn,))
+
+    fn = os.path.join(outdir, 'uboot', 'pinmux-config-%s.h' % boardname)
+    yield Step('uboot-board/' + boardname,
+        'board-to-uboot.py', ['--reproducible', '-o', fn, boardname], inputs, (fn,))
+
+    fn = os.path.join(outdir, 'regs', '%s-pinmux-regs.h' % boardname)
+    yield Step('reg-image/' + boardname,
+        'board-to-reg-image.py', ['--format', 'c', '-o', fn, boardname], inputs + ('tegra_pmx_regs.py',), (fn,))
+
+def link_steps(steps):
+    producers = {}
+    for step in steps:
+        for fn in step.outputs:
+            producers[os.path.abspath(fn)] = step
+    for step in steps:
+        for fn in step.inputs:
+            producer = producers.get(os.path.join(script_dir, fn))
+            if producer and producer not in step.deps:
+                step.deps.append(producer)
+                producer.dependents.append(step)
+
+def all_steps(outdir):
+    steps = []
+    for boardname in sorted(supported_boards):
+        steps.extend(csv_steps(boardname))
+    for socname in tegra_pmx_soc_parser.soc_names():
+        steps.extend(soc_steps(socname, outdir))
+    boardnames = set(tegra_pmx_board_parser.board_names())
+    boardnames.update(step.name.split('/')[1] for step in steps if step.script == 'csv-to-board.py')
+    for boardname in sorted(boardnames):
+        steps.extend(board_steps(boardname, outdir))
+    link_steps(steps)
+    return steps
+
+class Manifest(object):
+    # Records, for each step that has been run, the hash of every input and
+    # the command line used, so that later runs can tell which outputs are
+    # stale.
+    def __init__(self, fn):
+        self.fn = fn
+        try:
+            with open(fn) as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+
+    def stale_reasons(self, step):
+        entry = self.entries.get(step.name)
+        if not entry:
+            return ['not built before']
+        reasons = []
+        if entry['command'] != step.args:
+            reasons.append('command changed')
+        old_hashes = entry['inputs']
+        for fn, hash in step.input_hashes().items():
+            if fn not in old_hashes:
+                reasons.append('new input ' + fn)
+            elif old_hashes[fn] != hash:
+                reasons.append(fn + ' changed')
+        for fn in step.outputs:
+            if not os.path.exists(fn):
+                reasons.append('output ' + fn + ' missing')
+        return reasons
+
+    def record(self, step, input_hashes):
+        self.entries[step.name] = {
+            'command': step.args,
+            'inputs': input_hashes,
+            'outputs': list(step.outputs),
+        }
+
+    def save(self):
+        write_if_changed(self.fn, json.dumps(self.entries, indent=1, sort_keys=True) + '\n')
+
+def run_step(step):
+    for fn in step.outputs:
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+    start = time.monotonic()
+    p = subprocess.run(step.command(), cwd=script_dir, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, universal_newlines=True)
+    return (p, time.monotonic() - start)
+
+def _read_output(fn):
+    try:
+        with open(fn) as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+def run_step_in_process(step):
+    # Runs the generator script inside this process, which avoids interpreter
+    # startup and re-parsing SoC files (see tegra_pmx_soc_parser.load_soc).
+    # A diff of each output against its previous content is appended to the
+    # step's stdout.
+    old_contents = [_read_output(fn) for fn in step.outputs]
+    for fn in step.outputs:
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = step.command()[1:]
+    returncode = 0
+    start = time.monotonic()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(sys.argv[0], run_name='__main__')
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.argv = saved_argv
+    elapsed = time.monotonic() - start
+    if not returncode:
+        for fn, old_content in zip(step.outputs, old_contents):
+            diff = difflib.unified_diff(old_content.splitlines(True),
+                _read_output(fn).splitlines(True), fn, fn)
+            stdout.writelines(diff)
+    p = subprocess.CompletedProcess(step.command(), returncode, stdout.getvalue(), stderr.getvalue())
+    return (p, elapsed)
+
+class SerialExecutor(object):
+    # Runs each submitted function immediately, in the calling thread. Used
+    # for in-process steps, which redirect sys.stdout and so can't overlap.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def submit(self, fn, *args):
+        future = concurrent.futures.Future()
+        future.set_result(fn(*args))
+        return future
+
+class Builder(object):
+    # Runs steps as a DAG: each step starts, as a separate process, as soon
+    # as all the steps that produce its inputs have finished. At most jobs
+    # steps run at once.
+    # Staleness is only evaluated once a step's dependencies are done, since
+    # they may have just rewritten its inputs.
+    def __init__(self, steps, manifest, jobs=None, force=False, dbg=False, in_process=False):
+        self.steps = steps
+        self.manifest = manifest
+        self.jobs = jobs or os.cpu_count()
+        self.force = force
+        self.dbg = dbg
+        self.in_process = in_process
+
+    def stale_reasons(self, step):
+        reasons = self.manifest.stale_reasons(step)
+        if self.force and not reasons:
+            reasons = ['forced']
+        return reasons
+
+    def dry_run(self):
+        # Without running anything, assume that rebuilding a step changes its
+        # outputs, and hence that all its dependents need rebuilding too.
+        # A real build only re-runs dependents whose inputs actually changed.
+        rebuilt = set()
+        for step in self._topological_order():
+            reasons = self.stale_reasons(step)
+            for dep in step.deps:
+                if dep in rebuilt:
+                    reasons.append('depends on ' + dep.name + ', which would be rebuilt')
+            if reasons:
+                print('%s: %s' % (step.name, ', '.join(reasons)))
+                rebuilt.add(step)
+        print('%d of %d steps would be rebuilt' % (len(rebuilt), len(self.steps)))
+        return rebuilt
+
+    def _topological_order(self):
+        order = []
+        done = set()
+        def visit(step):
+            if step in done:
+                return
+            done.add(step)
+            for dep in step.deps:
+                visit(dep)
+            order.append(step)
+        for step in self.steps:
+            visit(step)
+        return order
+
+    def build(self):
+        start = time.monotonic()
+        waiting = {step: len(step.deps) for step in self.steps}
+        rebuilt = set()
+        failed = set()
+        skipped = set()
+        running = {}
+
+        if self.in_process:
+            executor = SerialExecutor()
+            run = run_step_in_process
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs)
+            run = run_step
+
+        with executor:
+            def step_ready(step):
+                del waiting[step]
+                bad_deps = [dep.name for dep in step.deps if dep in failed or dep in skipped]
+                if bad_deps:
+                    print('%s: skipped, %s failed' % (step.name, ', '.join(bad_deps)), file=sys.stderr)
+                    skipped.add(step)
+                    step_done(step)
+                    return
+                reasons = self.stale_reasons(step)
+                if not reasons:
+                    if self.dbg: print('%s: up to date' % step.name)
+                    step_done(step)
+                    return
+                print('%s: %s' % (step.name, ', '.join(reasons)))
+                if self.dbg: print(step.command())
+                future = executor.submit(run, step)
+                running[future] = (step, step.input_hashes())
+
+            def step_done(step):
+                for dependent in step.dependents:
+                    waiting[dependent] -= 1
+                    if not waiting[dependent]:
+                        step_ready(dependent)
+
+            for step in [step for step, count in waiting.items() if not count]:
+                step_ready(step)
+
+            while running:
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    (step, input_hashes) = running.pop(future)
+                    (p, elapsed) = future.result()
+                    if p.returncode:
+                        print('ERROR: %s failed after %.2fs:' % (step.name, elapsed), file=sys.stderr)
+                        print(p.stderr, file=sys.stderr, end='')
+                        failed.add(step)
+                    else:
+                        print(p.stdout, end='')
+                        print('%s: done in %.2fs' % (step.name, elapsed))
+                        self.manifest.record(step, input_hashes)
+                        self.manifest.save()
+                        rebuilt.add(step)
+                    step_done(step)
+
+        print('%d of %d steps rebuilt, %d failed, %d skipped in %.2fs' %
+            (len(rebuilt), len(self.steps), len(failed), len(skipped), time.monotonic() - start))
+        return not (failed or skipped)
+
+def _input_stamps(steps):
+    stamps = {}
+    for step in steps:
+        for fn in step.inputs:
+            if fn in stamps:
+                continue
+            try:
+                st = os.stat(os.path.join(script_dir, fn))
+                stamps[fn] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stamps[fn] = None
+    return stamps
+
+def _config_names():
+    return (tegra_pmx_soc_parser.soc_names(), tegra_pmx_board_parser.board_names())
+
+def watch(outdir, manifest, interval, dbg=False):
+    # Generators run in-process, and csv-to-board.py writes relative to the
+    # current directory.
+    orig_cwd = os.getcwd()
+    os.chdir(script_dir)
+    config_names = _config_names()
+    steps = all_steps(outdir)
+    Builder(steps, manifest, dbg=dbg, in_process=True).build()
+    stamps = _input_stamps(steps)
+    print('Watching for changes...')
+    while True:
+        time.sleep(interval)
+        new_config_names = _config_names()
+        if new_config_names != config_names:
+            config_names = new_config_names
+            steps = all_steps(outdir)
+        new_stamps = _input_stamps(steps)
+        changed = sorted(fn for fn in new_stamps if new_stamps[fn] != stamps.get(fn))
+        if not changed:
+            continue
+        stamps = new_stamps
+        print('Changed: ' + ', '.join(changed))
+        # Modules are only imported once, so start afresh to pick them up.
+        if [fn for fn in changed if fn.startswith('tegra_pmx_')]:
+            print('Parser module changed; restarting')
+            sys.stdout.flush()
+            os.chdir(orig_cwd)
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        Builder(steps, manifest, dbg=dbg, in_process=True).build()
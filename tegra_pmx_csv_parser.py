@@ -0,0 +1,435 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+# This parses a CSV version of Logan_customer_pinmux_release.xlsm
+
+import contextlib
+import csv
+import os.path
+import tegra_pmx_soc_parser
+import tegra_pmx_xlsx
+from tegra_pmx_parser_utils import *
+from tegra_pmx_utils import *
+
+# filename may be a CSV export of the worksheet, or the .xlsx/.xlsm workbook
+# itself, in which case sheet names the worksheet to read.
+#
+# Boards in alphabetical order in this dictionary:
+supported_boards = {
+    'cei-tk1-som': {
+        # tk1-som_pinmux_V2.4.xlsm  Colorado TK1-SOM Configuration (1-based rsvd)
+        # updated to version 11 by Peter Chubb
+        'filename': 'csv/cei-tk1-som.csv',
+        'rsvd_base': 1,
+        'soc': 'tegra124',
+        'sheet': 'Colorado TK1-SOM Configuration',
+    },
+    'e2220-1170': {
+        # T210_customer_pinmux.xlsm worksheet [elided] (0-based rsvd)
+        'filename': 'csv/e2220-1170.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'jetson-tk1': {
+        # Jetson_TK1_customer_pinmux.xlsm worksheet Jetson TK1 Configuration (1-based rsvd) from:
+        # https://developer.nvidia.com/hardware-design-and-development
+        'filename': 'csv/jetson-tk1.csv',
+        'rsvd_base': 1,
+        'soc': 'tegra124',
+        'sheet': 'Jetson TK1 Configuration',
+    },
+    'norrin': {
+        # PM370_T124_customer_pinmux_1.1.xlsm worksheet Customer_Configuration (0-based rsvd)
+        'filename': 'nv-internal-data/PM370_T124_customer_pinmux_1.1.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra124',
+        'sheet': 'Customer_Configuration',
+    },
+    'p2371-0000': {
+        # T210_customer_pinmux.xlsm worksheet [elided] Configuration (0-based rsvd)
+        'filename': 'csv/p2371-0000.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'p2371-2180': {
+        # T210_customer_pinmux.xlsm worksheet [elided] Configuration (0-based rsvd)
+        'filename': 'csv/p2371-2180.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'p3450-porg': {
+        # Jetson_Nano_DeveloperKit_Users_Pinmux_Configuration.xlsm (0-based rsvd)
+        'filename': 'csv/p3450-porg.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'p2571': {
+        # T210_customer_pinmux.xlsm worksheet [elided] Configuration (0-based rsvd)
+        'filename': 'csv/p2571.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'tegra210-smaug': {
+        # erista_customer_pinmux_v04_0420.xlsm
+        'filename': 'csv/tegra210-smaug-v04_0420.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra210',
+    },
+    'venice2': {
+        # Venice2_T124_customer_pinmux_based_on_P4_rev47_2013-07-12.xlsm worksheet Customer_Configuration (0-based rsvd)
+        'filename': 'nv-internal-data/Venice2_T124_customer_pinmux_based_on_P4_rev47_2013-07-12.csv',
+        'rsvd_base': 0,
+        'soc': 'tegra124',
+        'sheet': 'Customer_Configuration',
+    },
+}
+
+COL_BALL_NAME = 0
+COL_BALL_MID = 1
+COL_BALL_DSC = 2
+COL_GPIO = 3
+COL_F0 = 4
+COL_F1 = 5
+COL_F2 = 6
+COL_F3 = 7
+COL_FS = 8
+COL_MUX = 9
+COL_PUPD = 10
+COL_TRI = 11
+COL_E_INPUT = 12
+COL_GPIO_INIT_VAL = 13
+COL_DIRECTION = 14
+COL_RCV_SEL = 15
+
+def pupd_munge(d):
+    return {
+        'NORMAL': 'none',
+        'PULL_UP': 'up',
+        'PULL_DOWN': 'down',
+    }[d]
+
+def tri_munge(d):
+    return {
+        'NORMAL': False,
+        'TRISTATE': True,
+    }[d]
+
+def e_input_munge(d):
+    return {
+        'DISABLE': False,
+        'ENABLE': True,
+    }[d]
+
+def od_from_direction(d):
+    return d == 'Open-Drain'
+
+def rcv_sel_munge(d):
+    return {
+        '': False,
+        'NORMAL': False,
+        'HIGH': True,
+        'Disable': False,
+        'Enable': True,
+    }[d]
+
+# Workbooks are read directly, rather than needing a CSV export of the
+# worksheet first; the rows are the same either way
+@contextlib.contextmanager
+def open_rows(filename, sheet=None):
+    if os.path.splitext(filename)[1].lower() in ('.xlsx', '.xlsm'):
+        if not sheet:
+            raise Exception('No worksheet given for %s; worksheets: %s' %
+                (filename, ', '.join(tegra_pmx_xlsx.xlsx_sheet_names(filename))))
+        with contextlib.closing(tegra_pmx_xlsx.xlsx_rows(filename, sheet)) as rows:
+            yield rows
+        return
+    with open(filename, newline='') as fh:
+        yield csv.reader(fh)
+
+# The result of parsing a board's pinmux spreadsheet: the rows of the board
+# file's pins table (dicts, for tegra_pmx_board_parser.dump_board()) and
+# mipi_pad_ctrl_groups table, and any warnings and errors. The rows are
+# only usable if there are no errors.
+class CsvBoard(ReprDictObj):
+    def __init__(self, soc, pins, mipi_pad_ctrl_groups, warnings, errors):
+        self.soc = soc
+        self.pins = pins
+        self.mipi_pad_ctrl_groups = mipi_pad_ctrl_groups
+        self.warnings = warnings
+        self.errors = errors
+
+# As with KernelDriverParser, instances share no state, so several boards
+# may be parsed by one process. Problems with individual rows are collected
+# rather than stopping the parse, so that all of them can be fixed at once;
+# only problems with the spreadsheet as a whole raise an exception.
+class CsvBoardParser(object):
+    def __init__(self, board_conf, dbg=False):
+        self.board_conf = board_conf
+        self.dbg = dbg
+        self.soc = tegra_pmx_soc_parser.load_soc(board_conf['soc'])
+        self.cols = {}
+        self.warnings = []
+        self.errors = []
+        self.lnum = 0
+        self.warn_empty_gpio_init_val = False
+        # Pin full name -> row number, to catch balls listed twice
+        self.pin_rows = {}
+
+        if self.soc.soc_rsvd_base != board_conf['rsvd_base'] and not self.soc.soc_rsvd_base:
+            raise Exception('CSV 1-based to SoC 0-based not supported')
+
+        # The CSV may name a reserved function by its position rather than
+        # as the SoC does
+        self.alt_rsvds = tuple('rsvd' + str(self.soc.soc_rsvd_base + i) for i in range(4))
+        self.pin_funcs = {}
+        for gpio_pin in self.soc.gpios_pins_by_num():
+            if gpio_pin.reg:
+                self.pin_funcs[gpio_pin] = frozenset(gpio_pin.funcs)
+
+        self.col_names = {
+            COL_BALL_NAME:     'Ball Name',
+            COL_BALL_MID:      'MID',
+            COL_BALL_DSC:      'DSC',
+            COL_GPIO:          'GPIO',
+            COL_F0:            'F0',
+            COL_F1:            'F1',
+            COL_F2:            'F2',
+            COL_F3:            'F3',
+            COL_FS:            'FS',
+            COL_MUX:           'Pin Group',
+            COL_PUPD:          'PUPD',
+            COL_TRI:           'Tristate',
+            COL_E_INPUT:       'E_Input',
+            COL_GPIO_INIT_VAL: 'GPIO Init Value',
+            COL_DIRECTION:     'Pin Direction',
+        }
+
+        if self.soc.soc_pins_have_rcv_sel:
+            self.col_names[COL_RCV_SEL] = 'High or Normal VIL/VIH'
+
+        if self.soc.soc_pins_have_e_io_hv:
+            self.col_names[COL_RCV_SEL] = '3.3V Tolerance Enable'
+
+    def warn(self, msg):
+        self.warnings.append('row %d: %s' % (self.lnum, msg))
+
+    def error(self, msg):
+        self.errors.append('row %d: %s' % (self.lnum, msg))
+
+    def func_munge(self, f):
+        if self.board_conf['soc'] == 'tegra124':
+            if f in ('sdmmc2a', 'sdmmc2b'):
+                return 'sdmmc2'
+            if f in ('ir3_rxd', 'ir3_txd'):
+                return 'irda'
+        if self.soc.soc_rsvd_base != self.board_conf['rsvd_base']:
+            return rsvd_0base_to_1base(f)
+        return f
+
+    def gpio_init_val_munge(self, d):
+        if d == '':
+            self.warn_empty_gpio_init_val = True
+        return {
+            '': 'out?',
+            '0': 'out0',
+            '1': 'out1',
+        }[d]
+
+    # Returns munger() of the column's text, or None (recording an error)
+    # if the text isn't one of the values the munger knows
+    def munge_col(self, row, ball_name, colid, munger):
+        text = row[self.cols[colid]]
+        try:
+            return munger(text)
+        except KeyError:
+            self.error('%s: invalid %s %s' % (ball_name, self.col_names[colid], repr(text)))
+            return None
+
+    def parse_header(self, row):
+        missing = []
+        for colid, coltext in self.col_names.items():
+            try:
+                self.cols[colid] = row.index(coltext)
+            except ValueError:
+                if colid in (COL_BALL_MID, COL_BALL_DSC):
+                    pass
+                elif self.board_conf['soc'] != 'tegra124' or colid != COL_RCV_SEL:
+                    missing.append(coltext)
+                self.cols[colid] = None
+        if missing:
+            raise Exception('Header columns not found: ' + ', '.join('"%s"' % coltext for coltext in missing))
+        # CSV exports may drop trailing empty cells
+        self.row_len = max(col for col in self.cols.values() if col is not None) + 1
+
+    def parse_row(self, row):
+        soc = self.soc
+        cols = self.cols
+        func_munge = self.func_munge
+        num_errors = len(self.errors)
+
+        if len(row) < self.row_len:
+            row = row + [''] * (self.row_len - len(row))
+
+        ball_name = row[cols[COL_BALL_NAME]].lower()
+        if ball_name.startswith('mipi_pad_ctrl_'):
+            ball_name = ball_name[14:]
+            mipi = soc.mipi_pad_ctrl_group_by_name(ball_name)
+        else:
+            mipi = None
+
+        if cols[COL_BALL_MID]:
+            ball_mid = row[cols[COL_BALL_MID]]
+        else:
+            ball_mid = None
+        if cols[COL_BALL_DSC]:
+            ball_dsc = row[cols[COL_BALL_DSC]]
+        else:
+            ball_dsc = None
+
+
+        # Section title row
+        if not ball_mid and not ball_dsc and not mipi:
+            return
+
+        mux = func_munge(row[cols[COL_MUX]].lower())
+
+        if mipi:
+            if mux not in mipi.funcs:
+                self.error('mipi_pad_ctrl_%s: MUX CSV %s not in SOC list %s' % (ball_name, repr(mux), repr(mipi.funcs)))
+                return
+            self.mipi_table.append((mipi.name, mux))
+            return
+
+        # Pin not affected by pinmux
+        if mux in ('', '0', '#n/a'):
+            return
+
+        if self.dbg: print(ball_name)
+
+        gpio = row[cols[COL_GPIO]].lower()
+        f0 = func_munge(row[cols[COL_F0]].lower())
+        f1 = func_munge(row[cols[COL_F1]].lower())
+        f2 = func_munge(row[cols[COL_F2]].lower())
+        f3 = func_munge(row[cols[COL_F3]].lower())
+        fs = func_munge(row[cols[COL_FS]].lower())
+        pupd = self.munge_col(row, ball_name, COL_PUPD, pupd_munge)
+        tri = self.munge_col(row, ball_name, COL_TRI, tri_munge)
+        e_input = self.munge_col(row, ball_name, COL_E_INPUT, e_input_munge)
+        od = od_from_direction(row[cols[COL_DIRECTION]])
+        if cols[COL_RCV_SEL]:
+            rcv_sel = self.munge_col(row, ball_name, COL_RCV_SEL, rcv_sel_munge)
+        else:
+            rcv_sel = False
+
+        mux_gpio = mux.startswith('gpio_p') or (mux == gpio)
+        if mux_gpio:
+            mux = None
+            if e_input:
+                gpio_init = 'in'
+            else:
+                gpio_init = self.munge_col(row, ball_name, COL_GPIO_INIT_VAL, self.gpio_init_val_munge)
+        else:
+            gpio_init = None
+
+        csv_funcs = (f0, f1, f2, f3)
+        if fs not in csv_funcs:
+            self.error('%s: FSAFE CSV %s not in CSV F0..3 %s' % (ball_name, fs, repr(csv_funcs)))
+        if mux and mux not in csv_funcs:
+            self.error('%s: MUX CSV %s not in CSV F0..3 %s' % (ball_name, mux, repr(csv_funcs)))
+
+        gpio_pin = soc.gpio_or_pin_by_name(ball_name)
+        if not gpio_pin or gpio_pin not in self.pin_funcs:
+            self.error('%s: ball not in SOC pinmux' % ball_name)
+            return
+        if gpio_pin.fullname in self.pin_rows:
+            self.error('%s: ball already listed in row %d' % (ball_name, self.pin_rows[gpio_pin.fullname]))
+        self.pin_rows.setdefault(gpio_pin.fullname, self.lnum)
+        soc_funcs = self.pin_funcs[gpio_pin]
+        for i, func in enumerate(csv_funcs):
+            if func != gpio_pin.funcs[i] and func != self.alt_rsvds[i]:
+                self.warn('%s: F%d mismatch CSV %s vs SOC %s' % (ball_name, i, repr(func), repr(gpio_pin.funcs[i])))
+            if func not in soc_funcs and func != self.alt_rsvds[i]:
+                self.error('%s: F%d CSV %s not in SOC list %s' % (ball_name, i, repr(func), repr(gpio_pin.funcs)))
+        if mux and mux not in soc_funcs:
+            self.error('%s: MUX CSV %s not in SOC F0..3 %s' % (ball_name, mux, repr(gpio_pin.funcs)))
+
+        if len(self.errors) != num_errors:
+            return
+
+        if (self.board_conf['soc'] == 'tegra124') and (ball_name in ('reset_out_n', 'owr', 'hdmi_int', 'ddc_scl', 'ddc_sda')):
+            # These balls' pad type is always OD, so we don't need to set it
+            # FIXME: The SoC data structure should tell us the pad type instead of hard-coding it
+            od = False
+
+        if od and not gpio_pin.od:
+            self.warn('%s: OD in board file, but pin has no OD' % ball_name)
+            od = False
+        pin_has_rcv_sel = False
+        if soc.soc_pins_have_rcv_sel:
+            pin_has_rcv_sel = gpio_pin.rcv_sel
+        if soc.soc_pins_have_e_io_hv:
+            pin_has_rcv_sel = gpio_pin.e_io_hv
+        if rcv_sel and not pin_has_rcv_sel:
+            self.warn('%s: RCV_SEL/E_IO_HV in board file, but pin does not support it' % ball_name)
+            rcv_sel = False
+
+        self.pin_table.append({
+            'fullname': gpio_pin.fullname,
+            'mux': mux,
+            'gpio_init': gpio_init,
+            'pull': pupd,
+            'tri': tri,
+            'e_inp': e_input,
+            'od': od,
+            # The CSV column is whichever of these the SoC has
+            'rcv_sel': rcv_sel,
+            'e_io_hv': rcv_sel,
+        })
+
+    def parse(self, rows):
+        found_header = False
+        self.pin_table = []
+        self.mipi_table = []
+        for row in rows:
+            self.lnum += 1
+
+            # Header rows
+            if not found_header:
+                if 'Ball Name' not in row:
+                    if self.lnum > 25:
+                        raise Exception('Header row not found')
+                    continue
+                self.parse_header(row)
+                found_header = True
+                continue
+
+            self.parse_row(row)
+
+        if not found_header:
+            raise Exception('Header row not found')
+        if self.warn_empty_gpio_init_val:
+            self.warnings.append('Missing gpio_init_vals detected. Manual fixup required')
+        return CsvBoard(self.soc, self.pin_table, self.mipi_table, self.warnings, self.errors)
+
+# Parses a board's pinmux spreadsheet (a CSV export, or the workbook
+# itself); board_conf is the board's supported_boards entry
+def parse_board_csv(filename, board_conf, dbg=False):
+    with open_rows(filename, board_conf.get('sheet')) as rows:
+        return CsvBoardParser(board_conf, dbg).parse(rows)
@@ -0,0 +1,142 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import collections
+from tegra_pmx_parser_utils import *
+
+# Values from include/dt-bindings/pinctrl/pinctrl-tegra.h
+dt_constants = {
+    'TEGRA_PIN_DISABLE': 0,
+    'TEGRA_PIN_ENABLE': 1,
+    'TEGRA_PIN_PULL_NONE': 0,
+    'TEGRA_PIN_PULL_DOWN': 1,
+    'TEGRA_PIN_PULL_UP': 2,
+}
+
+# Properties whose value is a string rather than a dt_constants cell
+dt_string_props = ('nvidia,pins', 'nvidia,function')
+
+def mapper_pull(val):
+    return 'TEGRA_PIN_PULL_' + val.upper()
+
+def mapper_bool(val):
+    return 'TEGRA_PIN_' + {False: 'DISABLE', True: 'ENABLE'}[val]
+
+class DtNode(ReprDictObj):
+    def __init__(self, name, pins, props):
+        self.name = name
+        self.pins = pins
+        # (name, value) for each property other than nvidia,pins
+        self.props = props
+
+def pincfg_mux_props(pincfg):
+    if not pincfg.mux:
+        return ()
+    return (('nvidia,function', pincfg.mux),)
+
+def pincfg_config_props(board, pincfg):
+    props = (
+        ('nvidia,pull', mapper_pull(pincfg.pull)),
+        ('nvidia,tristate', mapper_bool(pincfg.tri)),
+        ('nvidia,enable-input', mapper_bool(pincfg.e_inp)),
+    )
+    if pincfg.gpio_pin.od:
+        props += (('nvidia,open-drain', mapper_bool(pincfg.od)),)
+    if board.soc.soc_pins_have_rcv_sel and pincfg.gpio_pin.rcv_sel and hasattr(pincfg.gpio_pin, 'rcv_sel'):
+        props += (('nvidia,rcv-sel', mapper_bool(pincfg.rcv_sel)),)
+    if board.soc.soc_pins_have_e_io_hv and pincfg.gpio_pin.e_io_hv and hasattr(pincfg.gpio_pin, 'e_io_hv'):
+        props += (('nvidia,io-hv', mapper_bool(pincfg.e_io_hv)),)
+    return props
+
+def _group_nodes(pincfgs, props_func, name_func):
+    groups = collections.OrderedDict()
+    for pincfg in pincfgs:
+        props = props_func(pincfg)
+        if not props:
+            continue
+        groups.setdefault(props, []).append(pincfg)
+    nodes = []
+    for props, group in groups.items():
+        nodes.append(DtNode(name_func(group[0], props), [pincfg.fullname for pincfg in group], props))
+    return nodes
+
+# Values for pin_nodes()' group_pins parameter
+group_pins_modes = ('none', 'all', 'config')
+
+def pin_nodes(board, group_pins='none', skip_names=()):
+    # group_pins selects how pins are combined into nodes:
+    # - none: one node per pin.
+    # - all: one node per distinct combination of mux and configuration.
+    # - config: one node per function setting the mux, plus one node per
+    #   distinct configuration setting everything else.
+    # Pins and MIPI pad ctrl groups named in skip_names are left out.
+    pincfgs = [pincfg for pincfg in board.pincfgs_by_num() if pincfg.fullname not in skip_names]
+    if group_pins == 'none':
+        nodes = [DtNode(pincfg.fullname, [pincfg.fullname],
+            pincfg_mux_props(pincfg) + pincfg_config_props(board, pincfg))
+            for pincfg in pincfgs]
+    elif group_pins == 'all':
+        nodes = _group_nodes(pincfgs,
+            lambda pincfg: pincfg_mux_props(pincfg) + pincfg_config_props(board, pincfg),
+            lambda pincfg, props: pincfg.fullname)
+    elif group_pins == 'config':
+        nodes = _group_nodes(pincfgs, pincfg_mux_props,
+            lambda pincfg, props: 'mux_' + props[0][1])
+        nodes += _group_nodes(pincfgs,
+            lambda pincfg: pincfg_config_props(board, pincfg),
+            lambda pincfg, props: 'conf_' + pincfg.fullname)
+    else:
+        raise Exception('Bad group_pins mode ' + group_pins)
+
+    # FIXME: Handle drive groups
+
+    for cfg in board.mipipadctrlcfgs_by_num():
+        if cfg.mipi_pad_ctrl_group.fullname in skip_names:
+            continue
+        nodes.append(DtNode(cfg.name, ['mipi_pad_ctrl_' + cfg.name],
+            (('nvidia,function', cfg.mux),)))
+
+    return nodes
+
+def format_prop(prop, val):
+    if prop in dt_string_props:
+        return '%s = "%s";' % (prop, val)
+    return '%s = <%s>;' % (prop, val)
+
+def format_node(node, indent='\t\t\t'):
+    s = indent + node.name + ' {\n'
+    pins_intro = indent + '\tnvidia,pins = '
+    # Continuation lines line up with the first pin name; the kernel's DT
+    # files use TABs then spaces to do that.
+    pins_cont = indent + '\t\t' + ' ' * (len('nvidia,pins = ') - 8)
+    for i, pin in enumerate(node.pins):
+        if i == len(node.pins) - 1:
+            suffix = ';'
+        else:
+            suffix = ','
+        if i == 0:
+            s += pins_intro
+        else:
+            s += pins_cont
+        s += '"' + pin + '"' + suffix + '\n'
+    for prop, val in node.props:
+        s += indent + '\t' + format_prop(prop, val) + '\n'
+    s += indent + '};\n'
+    return s
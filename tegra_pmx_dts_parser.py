@@ -0,0 +1,356 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import collections
+import os.path
+import re
+import tegra_pmx_dt
+from tegra_pmx_parser_utils import *
+
+# Preprocessor lines; note that property names such as #address-cells also
+# start with #
+re_dts_preproc = re.compile(r'\s*(?:#\s*(?:include|define|undef|if|ifdef|ifndef|elif|else|endif|error|warning|pragma)\b|/include/)')
+re_dts_include = re.compile(r'\s*(?:#\s*include|/include/)\s*(?:"(?P<quoted>[^"]+)"|<(?P<angled>[^>]+)>)')
+
+# Tokens of DTS source, once /* */ comments are removed
+re_dts_token = re_compile_alternation((
+    ('line_comment', '//.*'),
+    ('string', '"(?P<string_value>(?:[^"\\\\]|\\\\.)*)"'),
+    ('cells', '<(?P<cells_value>[^>]*)>'),
+    ('path_ref', r'&\{(?P<path_ref_value>[^}]*)\}'),
+    ('open', r'\{'),
+    ('close', r'\}'),
+    ('end', ';'),
+    ('equals', '='),
+    # Property and node names may contain commas, as may the separators
+    # between values; only string and cell values are used
+    ('word', r'[^\s{};="<]+'),
+    ('space', r'\s+'),
+))
+
+re_soc_dtsi = re.compile(r'(tegra[0-9]+)\.dtsi$')
+re_soc_compatible = re.compile('nvidia,(tegra[0-9]+)$')
+
+# The pin configuration nodes (those with an nvidia,pins property) found in
+# a DTS file and the files it includes. Nodes are grouped by their parent,
+# which is a pinctrl state node.
+class DtsPinmux(ReprDictObj):
+    def __init__(self, includes, compatibles, states, state_labels):
+        # Base names of all files included, whether found or not
+        self.includes = includes
+        # The root node's compatible strings
+        self.compatibles = compatibles
+        # State node path -> list of tegra_pmx_dt.DtNode
+        self.states = states
+        # State node path -> labels of the state node
+        self.state_labels = state_labels
+
+# Scans DTS source a token at a time, rather than building the whole tree,
+# and only keeps the nvidia,* properties and the root node's compatible
+# property. Nodes defined more than once (e.g. in a .dtsi file and again
+# through a &label reference in the .dts file) have their properties
+# merged, later definitions taking precedence. As with KernelDriverParser,
+# instances share no state.
+class DtsScanner(object):
+    def __init__(self, include_dirs=(), dbg=False):
+        self.include_dirs = include_dirs
+        self.dbg = dbg
+        self.includes = []
+        self.files = []
+        self.compatibles = []
+        self.labels = {}
+        self.path_labels = collections.defaultdict(list)
+        # Path -> OrderedDict of nvidia,* property -> value
+        self.node_props = collections.OrderedDict()
+        self.stack = []
+        self.stmt = []
+
+    def find_include(self, name, curdir):
+        for d in (curdir,) + tuple(self.include_dirs):
+            fn = os.path.join(d, name)
+            if os.path.exists(fn):
+                return fn
+        return None
+
+    def include(self, m):
+        name = m.group('quoted') or m.group('angled')
+        self.includes.append(os.path.basename(name))
+        # Only quoted includes are followed; <> ones are dt-bindings headers
+        if not m.group('quoted'):
+            return
+        fn = self.find_include(name, os.path.dirname(self.files[-1]))
+        if not fn:
+            if self.dbg: print('include not found:', name)
+            return
+        self.scan_file(fn)
+
+    def node_path(self, kind, name):
+        if kind == 'path_ref':
+            return name
+        if name == '/':
+            return '/'
+        if name.startswith('&'):
+            label = name[1:]
+            if label not in self.labels:
+                raise Exception('reference to unknown label ' + label)
+            return self.labels[label]
+        if not self.stack:
+            raise Exception('node %s outside the root node' % name)
+        return self.stack[-1].rstrip('/') + '/' + name
+
+    def open_node(self):
+        words = [(k, v) for (k, v) in self.stmt if k in ('word', 'path_ref')]
+        self.stmt = []
+        if not words:
+            raise Exception('node without a name')
+        path = self.node_path(*words[-1])
+        for (kind, word) in words[:-1]:
+            if not word.endswith(':'):
+                raise Exception('unexpected %s before node %s' % (word, words[-1][1]))
+            self.labels[word[:-1]] = path
+            self.path_labels[path].append(word[:-1])
+        if self.dbg: print('node:', path)
+        self.stack.append(path)
+
+    def close_node(self):
+        if self.stmt:
+            raise Exception('property without a terminating ;')
+        if not self.stack:
+            raise Exception('unbalanced }')
+        self.stack.pop()
+
+    def end_statement(self):
+        stmt = self.stmt
+        self.stmt = []
+        if not stmt or stmt[0][0] != 'word':
+            return
+        prop = stmt[0][1]
+        # /delete-node/, /delete-property/, /dts-v1/, /memreserve/ etc.
+        if prop.startswith('/'):
+            return
+        if not self.stack:
+            raise Exception('property %s outside a node' % prop)
+        path = self.stack[-1]
+        values = [v for (k, v) in stmt[1:] if k in ('string', 'cells')]
+        if path == '/' and prop == 'compatible':
+            self.compatibles = values
+        if not prop.startswith('nvidia,'):
+            return
+        if prop in tegra_pmx_dt.dt_string_props:
+            value = tuple(values)
+        elif len(values) == 1:
+            value = values[0].strip()
+        else:
+            raise Exception('%s: property %s should hold one cell' % (path, prop))
+        if self.dbg: print('prop:', path, prop, repr(value))
+        self.node_props.setdefault(path, collections.OrderedDict())[prop] = value
+
+    def scan_line(self, l):
+        pos = 0
+        while pos < len(l):
+            m = re_dts_token.match(l, pos)
+            pos = m.end()
+            kind = m.lastgroup
+            if kind in ('space', 'line_comment'):
+                continue
+            if kind == 'open':
+                self.open_node()
+            elif kind == 'close':
+                self.close_node()
+            elif kind == 'end':
+                self.end_statement()
+            else:
+                self.stmt.append((kind, m.group(kind + '_value') if kind in ('string', 'cells', 'path_ref') else m.group(kind)))
+
+    def scan_file(self, fn):
+        if fn in self.files:
+            raise Exception('%s includes itself' % fn)
+        self.files.append(fn)
+        lnum = 0
+        for (l, comment) in split_c_comments(mmap_lines(fn)):
+            lnum += 1
+            m = re_dts_include.match(l)
+            if m:
+                self.include(m)
+                continue
+            if re_dts_preproc.match(l):
+                continue
+            try:
+                self.scan_line(l)
+            except Exception as e:
+                raise Exception('%s:%d: %s' % (fn, lnum, e))
+        self.files.pop()
+
+    def scan(self, fn):
+        self.scan_file(fn)
+        if self.stack:
+            raise Exception('%s: file ends inside node %s' % (fn, self.stack[-1]))
+        states = collections.OrderedDict()
+        for path, props in self.node_props.items():
+            if 'nvidia,pins' not in props:
+                continue
+            (state, name) = path.rsplit('/', 1)
+            node = tegra_pmx_dt.DtNode(name, list(props['nvidia,pins']),
+                tuple((prop, value) for (prop, value) in props.items() if prop != 'nvidia,pins'))
+            states.setdefault(state or '/', []).append(node)
+        state_labels = {state: self.path_labels[state] for state in states}
+        return DtsPinmux(self.includes, self.compatibles, states, state_labels)
+
+def scan_dts_file(fn, include_dirs=(), dbg=False):
+    return DtsScanner(include_dirs, dbg).scan(fn)
+
+# Returns the pin configuration nodes of one pinctrl state; state is the
+# state node's name, label or path, and may be omitted if there's only one
+# state.
+def dts_state_nodes(pinmux, state=None):
+    if not pinmux.states:
+        raise Exception('no pinmux nodes')
+    if state is None:
+        if len(pinmux.states) > 1:
+            raise Exception('several pinctrl states (%s); select one' % ', '.join(pinmux.states.keys()))
+        return list(pinmux.states.values())[0]
+    for path, nodes in pinmux.states.items():
+        if state in (path, path.rsplit('/', 1)[1]) or state in pinmux.state_labels[path]:
+            return nodes
+    raise Exception('no pinctrl state %s' % state)
+
+def _dt_value(node, prop, value):
+    if value in tegra_pmx_dt.dt_constants:
+        return tegra_pmx_dt.dt_constants[value]
+    try:
+        return int(value, 0)
+    except ValueError:
+        raise Exception('node %s: %s value %s is not known' % (node.name, prop, value))
+
+def _dt_pull(node, prop, value):
+    pulls = {0: 'none', 1: 'down', 2: 'up'}
+    value = _dt_value(node, prop, value)
+    if value not in pulls:
+        raise Exception('node %s: invalid %s %d' % (node.name, prop, value))
+    return pulls[value]
+
+def _dt_bool(node, prop, value):
+    return bool(_dt_value(node, prop, value))
+
+# DT property -> (board file field, value decoder). nvidia,function is
+# handled separately, since it's checked against the pin's functions.
+dt_pin_props = {
+    'nvidia,pull': ('pull', _dt_pull),
+    'nvidia,tristate': ('tri', _dt_bool),
+    'nvidia,enable-input': ('e_inp', _dt_bool),
+    'nvidia,open-drain': ('od', _dt_bool),
+    'nvidia,rcv-sel': ('rcv_sel', _dt_bool),
+    'nvidia,io-hv': ('e_io_hv', _dt_bool),
+    'nvidia,io-high-voltage': ('e_io_hv', _dt_bool),
+}
+
+# Converts the pin configuration nodes of a pinctrl state into board file
+# data, for tegra_pmx_board_parser.dump_board(). Pins configured by several
+# nodes (such as separate mux and configuration nodes) get the properties
+# of all of them. Raises an exception if the nodes don't fit the SoC.
+def dts_board_data(nodes, soc):
+    drive_group_names = set(group.fullname for group in soc.drive_groups_by_alpha())
+    extra_field = None
+    if soc.soc_pins_have_rcv_sel:
+        extra_field = 'rcv_sel'
+    if soc.soc_pins_have_e_io_hv:
+        extra_field = 'e_io_hv'
+
+    pins = {}
+    mipi_pad_ctrl_groups = collections.OrderedDict()
+    ignored = set()
+    for node in nodes:
+        for name in node.pins:
+            if name.startswith('mipi_pad_ctrl_'):
+                group = soc.mipi_pad_ctrl_group_by_name(name[len('mipi_pad_ctrl_'):])
+                if not group:
+                    raise Exception('node %s: MIPI pad control group %s not in %s' % (node.name, name, soc.name))
+                for prop, value in node.props:
+                    if prop != 'nvidia,function':
+                        ignored.add(prop)
+                        continue
+                    if value[0] not in group.funcs:
+                        raise Exception('node %s: %s mux %s not in %s' % (node.name, name, value[0], repr(group.funcs)))
+                    mipi_pad_ctrl_groups[group.name] = value[0]
+                continue
+            if name in drive_group_names:
+                ignored.add('drive group ' + name)
+                continue
+            gpio_pin = soc.gpio_or_pin_by_fullname(name)
+            if not gpio_pin or not gpio_pin.reg:
+                raise Exception('node %s: pin group %s not in %s' % (node.name, name, soc.name))
+            pin = pins.setdefault(gpio_pin, {
+                'fullname': gpio_pin.fullname,
+                'mux': None,
+                'gpio_init': None,
+                'pull': 'none',
+                'tri': False,
+                'e_inp': False,
+                'od': False,
+            })
+            if extra_field:
+                pin.setdefault(extra_field, False)
+            for prop, value in node.props:
+                if prop == 'nvidia,function':
+                    if value[0] not in gpio_pin.funcs:
+                        raise Exception('node %s: %s mux %s not in %s' % (node.name, name, value[0], repr(gpio_pin.funcs)))
+                    pin['mux'] = value[0]
+                    continue
+                if prop not in dt_pin_props or dt_pin_props[prop][0] not in pin:
+                    ignored.add(prop)
+                    continue
+                (field, decode) = dt_pin_props[prop]
+                pin[field] = decode(node, prop, value)
+
+    return {
+        'pins': [pins[gpio_pin] for gpio_pin in sorted(pins, key=lambda gpio_pin: gpio_pin.sort_by_num_key())],
+        'mipi_pad_ctrl_groups': list(mipi_pad_ctrl_groups.items()),
+        'ignored': sorted(ignored),
+    }
+
+# Returns the name of the SoC the DTS file is for: the one whose .dtsi file
+# it includes, or whose compatible string it has, else the only SoC whose
+# pins and functions fit the nodes
+def detect_dts_soc(pinmux, nodes, socs):
+    socnames = [soc.name for soc in socs]
+    named = set()
+    for include in pinmux.includes:
+        m = re_soc_dtsi.match(include)
+        if m and m.group(1) in socnames:
+            named.add(m.group(1))
+    for compatible in pinmux.compatibles:
+        m = re_soc_compatible.match(compatible)
+        if m and m.group(1) in socnames:
+            named.add(m.group(1))
+    if len(named) == 1:
+        return named.pop()
+
+    matches = []
+    for soc in socs:
+        try:
+            dts_board_data(nodes, soc)
+        except Exception:
+            continue
+        matches.append(soc.name)
+    if not matches:
+        raise Exception('no SoC matches the pin configuration')
+    if len(matches) > 1:
+        raise Exception('pin configuration matches several SoCs (%s)' % ', '.join(matches))
+    return matches[0]
@@ -0,0 +1,233 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+# Reads and writes flattened device tree (FDT/DTB) blobs, as described in the
+# Devicetree Specification, chapter 5, and builds DT overlays containing a
+# board's pinmux configuration.
+
+import collections
+import struct
+import tegra_pmx_dt
+from tegra_pmx_parser_utils import *
+
+FDT_MAGIC = 0xd00dfeed
+FDT_BEGIN_NODE = 1
+FDT_END_NODE = 2
+FDT_PROP = 3
+FDT_NOP = 4
+FDT_END = 9
+
+FDT_VERSION = 17
+FDT_LAST_COMP_VERSION = 16
+
+fdt_header = struct.Struct('>10I')
+
+# Unresolved phandle references in overlays hold this until fixed up
+FDT_UNRESOLVED_PHANDLE = 0xffffffff
+
+class FdtNode(ReprDictObj):
+    def __init__(self, name):
+        self.name = name
+        self.props = collections.OrderedDict()
+        self.children = []
+
+    def add_child(self, name):
+        child = FdtNode(name)
+        self.children.append(child)
+        return child
+
+    def child(self, name):
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+def fdt_string(s):
+    return s.encode() + b'\0'
+
+def fdt_stringlist(l):
+    return b''.join(fdt_string(s) for s in l)
+
+def fdt_cells(*cells):
+    return struct.pack('>%dI' % len(cells), *cells)
+
+def fdt_parse_stringlist(val):
+    if not val.endswith(b'\0'):
+        raise Exception('Property value is not a string list')
+    return [s.decode() for s in val[:-1].split(b'\0')]
+
+def fdt_parse_cells(val):
+    if len(val) & 3:
+        raise Exception('Property value is not a list of cells')
+    return list(struct.unpack('>%dI' % (len(val) // 4), val))
+
+def _pad4(b):
+    return b + b'\0' * (-len(b) & 3)
+
+def fdt_encode(root):
+    strings = bytearray()
+    string_offsets = {}
+    def string_offset(name):
+        # Property names are stored once each in the strings block
+        if name not in string_offsets:
+            string_offsets[name] = len(strings)
+            strings.extend(fdt_string(name))
+        return string_offsets[name]
+
+    dt_struct = bytearray()
+    def emit_node(node):
+        dt_struct.extend(fdt_cells(FDT_BEGIN_NODE))
+        dt_struct.extend(_pad4(fdt_string(node.name)))
+        for name, val in node.props.items():
+            dt_struct.extend(fdt_cells(FDT_PROP, len(val), string_offset(name)))
+            dt_struct.extend(_pad4(val))
+        for child in node.children:
+            emit_node(child)
+        dt_struct.extend(fdt_cells(FDT_END_NODE))
+    emit_node(root)
+    dt_struct.extend(fdt_cells(FDT_END))
+
+    # An empty memory reservation map: a single all-zero entry
+    mem_rsvmap = bytes(16)
+    off_mem_rsvmap = fdt_header.size
+    off_dt_struct = off_mem_rsvmap + len(mem_rsvmap)
+    off_dt_strings = off_dt_struct + len(dt_struct)
+    totalsize = off_dt_strings + len(strings)
+    header = fdt_header.pack(FDT_MAGIC, totalsize, off_dt_struct,
+        off_dt_strings, off_mem_rsvmap, FDT_VERSION, FDT_LAST_COMP_VERSION,
+        0, len(strings), len(dt_struct))
+    return header + mem_rsvmap + bytes(dt_struct) + bytes(strings)
+
+def fdt_decode(blob):
+    (magic, totalsize, off_dt_struct, off_dt_strings, off_mem_rsvmap, version,
+        last_comp_version, boot_cpuid_phys, size_dt_strings,
+        size_dt_struct) = fdt_header.unpack_from(blob)
+    if magic != FDT_MAGIC:
+        raise Exception('Bad FDT magic 0x%x' % magic)
+    if last_comp_version > FDT_VERSION:
+        raise Exception('Unsupported FDT version %d' % version)
+    if totalsize > len(blob):
+        raise Exception('FDT truncated')
+    strings = blob[off_dt_strings:off_dt_strings + size_dt_strings]
+
+    def get_string(data, offset):
+        end = data.index(b'\0', offset)
+        return (data[offset:end].decode(), end + 1)
+
+    root = None
+    stack = []
+    pos = off_dt_struct
+    end = off_dt_struct + size_dt_struct
+    while pos < end:
+        (token,) = struct.unpack_from('>I', blob, pos)
+        pos += 4
+        if token == FDT_BEGIN_NODE:
+            (name, pos) = get_string(blob, pos)
+            pos = (pos + 3) & ~3
+            if stack:
+                node = stack[-1].add_child(name)
+            elif root:
+                raise Exception('FDT has multiple root nodes')
+            else:
+                node = root = FdtNode(name)
+            stack.append(node)
+        elif token == FDT_END_NODE:
+            stack.pop()
+        elif token == FDT_PROP:
+            (length, nameoff) = struct.unpack_from('>II', blob, pos)
+            pos += 8
+            (name, _) = get_string(strings, nameoff)
+            stack[-1].props[name] = blob[pos:pos + length]
+            pos = (pos + length + 3) & ~3
+        elif token == FDT_NOP:
+            pass
+        elif token == FDT_END:
+            break
+        else:
+            raise Exception('Bad FDT token 0x%x at offset 0x%x' % (token, pos - 4))
+    if stack or not root:
+        raise Exception('FDT structure block not terminated correctly')
+    return root
+
+# Reverse of tegra_pmx_dt's mapping, per property, from cell values back to
+# the constant names used in DtNode.props
+_pull_names = {tegra_pmx_dt.dt_constants[n]: n for n in
+    ('TEGRA_PIN_PULL_NONE', 'TEGRA_PIN_PULL_DOWN', 'TEGRA_PIN_PULL_UP')}
+_bool_names = {tegra_pmx_dt.dt_constants[n]: n for n in
+    ('TEGRA_PIN_DISABLE', 'TEGRA_PIN_ENABLE')}
+
+def _encode_pin_prop(prop, val):
+    if prop in tegra_pmx_dt.dt_string_props:
+        return fdt_string(val)
+    return fdt_cells(tegra_pmx_dt.dt_constants[val])
+
+def _decode_pin_prop(prop, val):
+    if prop in tegra_pmx_dt.dt_string_props:
+        return fdt_parse_stringlist(val)[0]
+    (cell,) = fdt_parse_cells(val)
+    if prop == 'nvidia,pull':
+        return _pull_names[cell]
+    return _bool_names[cell]
+
+def pinmux_overlay(nodes, target_label='pinmux', state_name='default'):
+    # Builds an overlay equivalent to this DTS, compiled with dtc -@:
+    #
+    # &pinmux {
+    #         pinctrl-names = "default";
+    #         pinctrl-0 = <&state_default>;
+    #         state_default: pinmux { ... nodes ... };
+    # };
+    root = FdtNode('')
+    fragment = root.add_child('fragment@0')
+    fragment.props['target'] = fdt_cells(FDT_UNRESOLVED_PHANDLE)
+    overlay = fragment.add_child('__overlay__')
+    overlay.props['pinctrl-names'] = fdt_string(state_name)
+    overlay.props['pinctrl-0'] = fdt_cells(1)
+    state = overlay.add_child('pinmux')
+    state.props['phandle'] = fdt_cells(1)
+    for node in nodes:
+        child = state.add_child(node.name)
+        child.props['nvidia,pins'] = fdt_stringlist(node.pins)
+        for prop, val in node.props:
+            child.props[prop] = _encode_pin_prop(prop, val)
+
+    symbols = root.add_child('__symbols__')
+    symbols.props['state_' + state_name] = fdt_string('/fragment@0/__overlay__/pinmux')
+    # The target phandle is resolved against the base tree's label when the
+    # overlay is applied...
+    fixups = root.add_child('__fixups__')
+    fixups.props[target_label] = fdt_string('/fragment@0:target:0')
+    # ... and the overlay's own phandles are renumbered, so references to
+    # them must be recorded too.
+    local_fixups = root.add_child('__local_fixups__')
+    local_fixups = local_fixups.add_child('fragment@0').add_child('__overlay__')
+    local_fixups.props['pinctrl-0'] = fdt_cells(0)
+    return fdt_encode(root)
+
+def pin_nodes_from_overlay(blob):
+    root = fdt_decode(blob)
+    state = root.child('fragment@0').child('__overlay__').child('pinmux')
+    nodes = []
+    for child in state.children:
+        pins = fdt_parse_stringlist(child.props['nvidia,pins'])
+        props = tuple((prop, _decode_pin_prop(prop, val))
+            for prop, val in child.props.items() if prop != 'nvidia,pins')
+        nodes.append(tegra_pmx_dt.DtNode(child.name, pins, props))
+    return nodes
@@ -0,0 +1,539 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import collections
+import re
+from tegra_pmx_parser_utils import *
+from tegra_pmx_utils import *
+
+re_siggpio = re.compile('^(.*)_p([a-z]+[0-7])$')
+
+re_copyright = re.compile(r' \* Copyright \(c\) (.*), NVIDIA CORPORATION.  All rights reserved.')
+
+re_close_brace = re.compile('};')
+
+re_pins_array_entry = re.compile(r'\s+PINCTRL_PIN\(TEGRA_PIN_([A-Z0-9_]+), "([A-Z0-9_ ]+)"\),')
+re_group_pins_array_entry = re.compile(r'\s+TEGRA_PIN_([A-Z0-9_]+),?')
+re_mux_array_entry = re.compile(r'\s+TEGRA_MUX_([A-Z0-9_]+),')
+
+re_groups_array_entry = re_compile_alternation((
+    ('group', r'\s*PINGROUP\((?P<group_args>.*)\),'),
+    ('drvgroup', r'\s*DRV_PINGROUP\((?P<drvgroup_args>.*)\),'),
+    ('mipi_pad_ctrl_group', r'\s*MIPI_PAD_CTRL_PINGROUP\((?P<mipi_pad_ctrl_group_args>.*)\),'),
+))
+
+# Everything of interest outside the arrays; one match per line picks the
+# handler
+re_global = re_compile_alternation((
+    ('pins_array_start', r'static const struct pinctrl_pin_desc tegra\d+_pins\[\] = \{'),
+    ('group_pins_array_start', r'static const unsigned (?P<group_pins_group>[a-z0-9_]+)_pins\[\] = \{'),
+    ('mux_array_start', 'enum tegra_mux(?:_dt)? {'),
+    ('groups_array_start', r'static const struct tegra_pingroup (?P<groups_soc>tegra\d+)_groups\[\] = \{'),
+    ('pin_gpio', r'#define TEGRA_PIN_(?P<pin_gpio_name>[A-Z0-9_]+)\s*_GPIO\((?P<pin_gpio_id>\d+)\)'),
+    ('pin_pin', r'#define TEGRA_PIN_(?P<pin_pin_name>[A-Z0-9_]+)\s*_PIN\((?P<pin_pin_id>\d+)\)'),
+    ('module_author', r'MODULE_AUTHOR\("(?P<module_author_name>.*)"\);'),
+))
+
+# The kernel drivers don't describe which optional fields each SoC's pins and
+# drive groups have; that is implied by the SoC.
+soc_vars = {
+    'soc_pins_have_od': ['tegra30', 'tegra114', 'tegra124', 'tegra210'],
+    'soc_pins_all_have_od': ['tegra210'],
+    'soc_pins_have_ior': ['tegra30', 'tegra114', 'tegra124'],
+    'soc_pins_have_rcv_sel': ['tegra114', 'tegra124'],
+    'soc_pins_have_schmitt': ['tegra210'],
+    'soc_pins_all_have_schmitt': ['tegra210'],
+    'soc_pins_have_hsm': ['tegra210',],
+    'soc_pins_have_drvtype': ['tegra210',],
+    'soc_pins_have_e_io_hv': ['tegra210',],
+    'soc_drvgroups_have_hsm': ['tegra30', 'tegra114', 'tegra124'],
+    'soc_drvgroups_have_schmitt': ['tegra30', 'tegra114', 'tegra124'],
+    'soc_drvgroups_have_lpmd': ['tegra30', 'tegra114', 'tegra124'],
+    'soc_drvgroups_have_drvtype': ['tegra114', 'tegra124'],
+}
+
+# The result of parsing one kernel pinctrl driver
+class KernelDriver(ReprDictObj):
+    def __init__(self, soc, copyright_years, module_author, pins, groups, functions):
+        self.soc = soc
+        self.kernel_copyright_years = copyright_years
+        self.kernel_author = module_author
+        for var, socs in soc_vars.items():
+            self.__setattr__(var, soc in socs)
+        # name -> dict of the pin's signal/GPIO name and number
+        self.pins = pins
+        # name -> dict of the group's pins, and its PINGROUP/DRV_PINGROUP data
+        self.groups = groups
+        # In TEGRA_MUX_* enum order
+        self.functions = functions
+
+# Parses one driver; a separate instance is needed for each driver, but
+# instances share no state, so any number may be used at once.
+class KernelDriverParser(object):
+    def __init__(self, dbg=False):
+        self.dbg = dbg
+        self.num_pin_gpios = 0
+        self.pins = collections.OrderedDict()
+        self.groups = collections.OrderedDict()
+        self.functions = []
+        self.functions_set = set()
+        self.soc = None
+        self.module_author = None
+        self.copyright_years = None
+        self.state_group = None
+        self.global_handlers = {
+            'pins_array_start': self.global_pins_array_start,
+            'group_pins_array_start': self.global_group_pins_array_start,
+            'mux_array_start': self.global_mux_array_start,
+            'groups_array_start': self.global_groups_array_start,
+            'pin_gpio': self.global_pin_gpio,
+            'pin_pin': self.global_pin_pin,
+            'module_author': self.global_module_author,
+        }
+        self.set_global_state()
+
+    def set_soc(self, soc):
+        self.soc = soc
+        for var, socs in soc_vars.items():
+            self.__setattr__(var, soc in socs)
+
+    def set_state(self, s, e):
+        if self.dbg: print("SET STATE: " + repr(s))
+        self.state = s
+        self.re_state_end = e
+
+    def set_global_state(self):
+        self.set_state(self.state_global, None)
+
+    def state_pins_array(self, l):
+        m = re_pins_array_entry.match(l)
+        if not m:
+            raise Exception('pins array entry cannot be parsed')
+        if self.dbg: print('pin desc:', repr(m.group(1)), repr(m.group(2)))
+        pin = m.group(1).lower()
+        signal = self.pins[pin]['signal']
+        if self.pins[pin]['is_gpio']:
+            gpio = self.pins[pin]['gpio']
+        else:
+            gpio = ''
+        pindesc = signal
+        if signal and gpio:
+            pindesc += ' '
+        if gpio:
+            pindesc += 'p'
+        pindesc += gpio
+        if m.group(2) != pindesc.upper():
+            raise Exception('pin ' + pin + ' pindesc mismatch')
+
+    def state_group_pins_array(self, l):
+        m = re_group_pins_array_entry.match(l)
+        if not m:
+            raise Exception('group pins array entry cannot be parsed')
+        if self.dbg: print('pin entry:', repr(m.group(1)))
+        self.groups[self.state_group]['pins'].append(m.group(1).lower())
+
+    def state_mux_array(self, l):
+        m = re_mux_array_entry.match(l)
+        if not m:
+            raise Exception('mux array entry cannot be parsed')
+        if self.dbg: print('function:', repr(m.group(1)))
+        function = m.group(1).lower()
+        self.functions.append(function)
+        self.functions_set.add(function)
+
+    def state_groups_array(self, l):
+        m = re_groups_array_entry.match(l)
+        if not m:
+            raise Exception('groups array entry cannot be parsed')
+        args = re.split(r'\s*,\s*', m.group(m.lastgroup + '_args'))
+        if m.lastgroup == 'group':
+            self.parse_group_entry(args)
+        elif m.lastgroup == 'drvgroup':
+            self.parse_drvgroup_entry(args)
+        else:
+            self.parse_mipi_pad_ctrl_group_entry(args)
+
+    def parse_group_entry(self, args):
+        (group, f0, f1, f2, f3, reg) = args[0:6]
+        argbase = 6
+        if self.soc_pins_have_od and ((not self.soc_pins_all_have_od) or (self.soc == 'tegra210')):
+            od = args[argbase]
+            argbase += 1
+            if self.soc == 'tegra210':
+                if od != 'Y':
+                    raise Exception('od not not expected value for ' + group)
+        if self.soc_pins_have_ior:
+            ior = args[argbase]
+            argbase += 1
+        if self.soc_pins_have_rcv_sel:
+            rcv_sel = args[argbase]
+            argbase += 1
+        if self.soc_pins_have_schmitt and ((not self.soc_pins_all_have_schmitt) or (self.soc == 'tegra210')):
+            schmitt = args[argbase]
+            argbase += 1
+            if self.soc == 'tegra210':
+                if schmitt != '12':
+                    raise Exception('drvtype not expected value for ' + group)
+        if self.soc_pins_have_hsm:
+            hsm = args[argbase]
+            argbase += 1
+        if self.soc_pins_have_drvtype:
+            drvtype = args[argbase]
+            argbase += 1
+        if self.soc_pins_have_e_io_hv:
+            e_io_hv = args[argbase]
+            argbase += 1
+
+        group = group.lower()
+        f0 = f0.lower()
+        f1 = f1.lower()
+        f2 = f2.lower()
+        f3 = f3.lower()
+        if not group in self.groups:
+            raise Exception('invalid group', group)
+        for f in (f0, f1, f2, f3):
+            if not f in self.functions_set:
+                raise Exception('invalid function', f)
+        reg = int(reg, 0)
+        entry = {
+            'is_drive': False,
+            'funcs': (f0, f1, f2, f3),
+            'reg': reg,
+        }
+        if self.soc_pins_have_od and not self.soc_pins_all_have_od:
+            entry['od'] = yn_to_boolean(od)
+        if self.soc_pins_have_ior:
+            entry['ior'] = yn_to_boolean(ior)
+        if self.soc_pins_have_rcv_sel:
+            entry['rcv_sel'] = yn_to_boolean(rcv_sel)
+        if self.soc_pins_have_schmitt and not self.soc_pins_all_have_schmitt:
+            entry['schmitt_b'] = int(schmitt)
+        if self.soc_pins_have_hsm:
+            entry['hsm'] = (hsm != '-1')
+        if self.soc_pins_have_drvtype:
+            entry['drvtype'] = yn_to_boolean(drvtype)
+        if self.soc_pins_have_e_io_hv:
+            entry['e_io_hv'] = yn_to_boolean(e_io_hv)
+        if self.dbg: print('group entry:', repr(entry))
+        self.groups[group].update(entry)
+
+    def parse_drvgroup_entry(self, args):
+        (group, reg) = args[0:2]
+        argbase = 2
+        if self.soc_drvgroups_have_hsm:
+            hsm_b = args[argbase]
+            argbase += 1
+        if self.soc_drvgroups_have_schmitt:
+            schmitt_b = args[argbase]
+            argbase += 1
+        if self.soc_drvgroups_have_lpmd:
+            lpmd_b = args[argbase]
+            argbase += 1
+        (drvdn_b, drvdn_w, drvup_b, drvup_w, slwr_b, slwr_w, slwf_b, slwf_w) = args[argbase:(argbase + 8)]
+        argbase += 8
+        if self.soc_drvgroups_have_drvtype:
+            drvtype = args[argbase]
+            argbase += 1
+
+        group = 'drive_' + group
+        if not group in self.groups:
+            raise Exception('invalid group', group)
+        entry = {
+            'is_drive': True,
+            'reg': int(reg, 0),
+            'drvdn_b': int(drvdn_b, 0),
+            'drvdn_w': int(drvdn_w, 0),
+            'drvup_b': int(drvup_b, 0),
+            'drvup_w': int(drvup_w, 0),
+            'slwr_b': int(slwr_b, 0),
+            'slwr_w': int(slwr_w, 0),
+            'slwf_b': int(slwf_b, 0),
+            'slwf_w': int(slwf_w, 0),
+        }
+        if self.soc_drvgroups_have_hsm:
+            entry['hsm_b'] = int(hsm_b, 0)
+        if self.soc_drvgroups_have_schmitt:
+            entry['schmitt_b'] = int(schmitt_b, 0)
+        if self.soc_drvgroups_have_lpmd:
+            entry['lpmd_b'] = int(lpmd_b, 0)
+        if self.soc_drvgroups_have_drvtype:
+            entry['drvtype'] = yn_to_boolean(drvtype)
+        if self.dbg: print('group entry:', repr(entry))
+        self.groups[group].update(entry)
+
+    # MIPI pad control groups are described by hand in the .soc files, so
+    # their pin lists are only checked for and dropped
+    def parse_mipi_pad_ctrl_group_entry(self, args):
+        group = 'mipi_pad_ctrl_' + args[0]
+        if not group in self.groups:
+            raise Exception('invalid group', group)
+        if self.dbg: print('mipi pad ctrl group entry:', repr(group))
+        del self.groups[group]
+
+    def global_pins_array_start(self, m):
+        self.set_state(self.state_pins_array, re_close_brace)
+
+    def global_group_pins_array_start(self, m):
+        self.state_group = m.group('group_pins_group')
+        if self.dbg: print('group pins array:', repr(self.state_group))
+        self.groups[self.state_group] = {'pins': []}
+        self.set_state(self.state_group_pins_array, re_close_brace)
+
+    def global_mux_array_start(self, m):
+        self.set_state(self.state_mux_array, re_close_brace)
+
+    def global_groups_array_start(self, m):
+        self.set_soc(m.group('groups_soc'))
+        if self.dbg: print('groups array (soc %s):' % self.soc)
+        self.set_state(self.state_groups_array, re_close_brace)
+
+    def global_pin_gpio(self, m):
+        group = m.group('pin_gpio_name').lower()
+        gpioid = m.group('pin_gpio_id')
+        m = re_siggpio.match(group)
+        if m:
+            signal = m.group(1)
+            gpio = m.group(2)
+        else:
+            signal = ''
+            gpio = group[1:]
+
+        entry = {
+            'is_gpio': True,
+            'signal': signal,
+            'gpio': gpio,
+            'id': int(gpioid),
+        }
+        if self.dbg: print('gpio:', repr(group), repr(entry))
+        self.pins[group] = entry
+        self.num_pin_gpios += 1
+
+    def global_pin_pin(self, m):
+        name = m.group('pin_pin_name')
+        entry = {
+            'is_gpio': False,
+            'signal': name.lower(),
+            'id': int(m.group('pin_pin_id')),
+        }
+        if self.dbg: print('pin:', repr(name), repr(entry))
+        self.pins[name.lower()] = entry
+
+    def global_module_author(self, m):
+        self.module_author = m.group('module_author_name')
+
+    def state_global(self, l):
+        m = re_global.match(l)
+        if m:
+            self.global_handlers[m.lastgroup](m)
+
+    def parse_comment(self, comment):
+        m = re_copyright.match(comment)
+        if m:
+            self.copyright_years = m.group(1)
+
+    def parse_line(self, l):
+        if self.dbg: print('<<<', repr(l))
+        if self.re_state_end and self.re_state_end.match(l):
+            self.set_global_state()
+            return
+        self.state(l)
+
+    def finish(self):
+        if self.dbg:
+            print('pins:')
+            print(repr(self.pins))
+            print()
+            print('groups:')
+            print(repr(self.groups))
+            print()
+            print('functions:')
+            print(repr(self.functions))
+
+        groups = self.groups
+        for group in groups:
+            if not 'is_drive' in groups[group]:
+                raise Exception('group ' + group + ' not parsed in group array')
+            if groups[group]['is_drive']:
+                continue
+            if len(groups[group]['pins']) != 1:
+                raise Exception('group ' + group + ' has more than 1 pin')
+            if groups[group]['pins'][0] != group:
+                raise Exception('group ' + group + ' pin list does not match')
+
+        for pin in self.pins:
+            if pin not in groups:
+                groups[pin] = {'is_drive': False}
+                continue
+            for (i, function) in enumerate(groups[pin]['funcs']):
+                if function.startswith('RSVD') and function != 'RSVD' + str(i + 1):
+                    raise Exception('pin ' + pin + ' RSVD func ' + i + ' mismatch')
+
+        return KernelDriver(self.soc, self.copyright_years, self.module_author,
+            self.pins, self.groups, self.functions)
+
+    # Reads lines one at a time, so a file object is parsed without being
+    # read into memory first
+    def parse(self, lines):
+        for (l, comment) in split_c_comments(lines):
+            if comment:
+                self.parse_comment(comment)
+            if l.strip():
+                self.parse_line(l)
+        return self.finish()
+
+# Convenient for use with e.g. concurrent.futures.ProcessPoolExecutor.map()
+def parse_kernel_driver_file(fn, dbg=False):
+    return KernelDriverParser(dbg).parse(mmap_lines(fn))
+
+# Writes the parsed driver in .soc file format
+def dump_soc(driver, file=None):
+    print('kernel_copyright_years =', repr(driver.kernel_copyright_years), file=file)
+    print('kernel_author =', repr(driver.kernel_author), file=file)
+    print(file=file)
+    for var in sorted(soc_vars.keys()):
+        print('%s = %s' % (var, repr(getattr(driver, var))), file=file)
+    print(file=file)
+
+    def dump_pins(dump_gpios):
+        headings = ('name',)
+        if dump_gpios:
+            headings += ('gpio',)
+        headings += ('reg', 'f0', 'f1', 'f2', 'f3')
+        if driver.soc_pins_have_od and not driver.soc_pins_all_have_od:
+            headings += ('od',)
+        if driver.soc_pins_have_ior:
+            headings += ('ior',)
+        if driver.soc_pins_have_rcv_sel:
+            headings += ('rcv_sel',)
+        if driver.soc_pins_have_schmitt and not driver.soc_pins_all_have_schmitt:
+            headings += ('schmitt_b',)
+        if driver.soc_pins_have_hsm:
+            headings += ('hsm',)
+        if driver.soc_pins_have_drvtype:
+            headings += ('drvtype',)
+        if driver.soc_pins_have_e_io_hv:
+            headings += ('e_io_hv',)
+
+        rows = []
+        for pin in driver.pins:
+            p = driver.pins[pin]
+            if p['is_gpio'] != dump_gpios:
+                continue
+
+            if pin not in driver.groups:
+                continue
+            g = driver.groups[pin]
+            if g['is_drive']:
+                continue
+
+            if dump_gpios:
+                signal = p['signal']
+                gpio = p['gpio']
+            else:
+                signal = pin
+                gpio = None
+
+            row = (repr(signal),)
+            if dump_gpios:
+                row += (repr(gpio),)
+            if 'reg' in g:
+                row += ('0x%x' % g['reg'],)
+                for func in g['funcs']:
+                    row += (repr(func),)
+
+                if driver.soc_pins_have_od and not driver.soc_pins_all_have_od:
+                    row += (repr(g['od']),)
+                if driver.soc_pins_have_ior:
+                    row += (repr(g['ior']),)
+                if driver.soc_pins_have_rcv_sel:
+                    row += (repr(g['rcv_sel']),)
+                if driver.soc_pins_have_schmitt and not driver.soc_pins_all_have_schmitt:
+                    row += (repr(g['schmitt_b']),)
+                if driver.soc_pins_have_hsm:
+                    row += (repr(g['hsm']),)
+                if driver.soc_pins_have_drvtype:
+                    row += (repr(g['drvtype']),)
+                if driver.soc_pins_have_e_io_hv:
+                    row += (repr(g['e_io_hv']),)
+            rows.append(row)
+
+        dump_py_table(headings, rows, file=file)
+
+    print('gpios = (', file=file)
+    dump_pins(True)
+    print(')', file=file)
+    print(file=file)
+    print('pins = (', file=file)
+    dump_pins(False)
+    print(')', file=file)
+    print(file=file)
+    print('drive_groups = (', file=file)
+    heading = '    #name, r'
+    if driver.soc_drvgroups_have_hsm:
+        heading += ', hsm_b'
+    if driver.soc_drvgroups_have_schmitt:
+        heading += ', schmitt_b'
+    if driver.soc_drvgroups_have_lpmd:
+        heading += ', lpmd_b'
+    heading += ', drvdn_b, drvdn_w, drvup_b, drvup_w, slwr_b, slwr_w, slwf_b, slwf_w'
+    if driver.soc_drvgroups_have_drvtype:
+        heading += ', drvtype'
+    print(heading, file=file)
+    rows = []
+    for group in driver.groups:
+        g = driver.groups[group]
+        if not driver.groups[group]['is_drive']:
+            continue
+        row = (
+            repr(group[6:]),
+            '0x%x' % g['reg'],
+        )
+        if driver.soc_drvgroups_have_hsm:
+            row += (repr(g['hsm_b']),)
+        if driver.soc_drvgroups_have_schmitt:
+            row += (repr(g['schmitt_b']),)
+        if driver.soc_drvgroups_have_lpmd:
+            row += (repr(g['lpmd_b']),)
+        row += (
+            repr(g['drvdn_b']),
+            repr(g['drvdn_w']),
+            repr(g['drvup_b']),
+            repr(g['drvup_w']),
+            repr(g['slwr_b']),
+            repr(g['slwr_w']),
+            repr(g['slwf_b']),
+            repr(g['slwf_w']),
+        )
+        if driver.soc_drvgroups_have_drvtype:
+            row += (repr(g['drvtype']),)
+        rows.append(row)
+    dump_py_table(None, rows, file=file)
+    print(')', file=file)
+    print(file=file)
+    print('drive_group_pins = {', file=file)
+    for group in driver.groups:
+        g = driver.groups[group]
+        if not driver.groups[group]['is_drive']:
+            continue
+        print('    \'%s\': (' % group[6:], file=file)
+        for pin in g['pins']:
+            print('        \'%s\',' % pin, file=file)
+        print('    ),', file=file)
+    print('}', file=file)
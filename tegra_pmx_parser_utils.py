@@ -18,6 +18,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import mmap
+import re
+
 class ReprDictObj(object):
     def __repr__(self):
         return self.__class__.__name__ + '(' + repr(self.__dict__) + ')'
@@ -38,3 +41,45 @@ class TopLevelParsedObj(ReprDictObj):
                     raise Exception('Missing variable ' + attr)
                 val = default
             self.__setattr__(attr, val)
+
+# Yields the lines of a file, decoded one at a time from a memory mapping of
+# it rather than read into memory first
+def mmap_lines(fn):
+    with open(fn, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for l in iter(mm.readline, b''):
+                yield l.decode('utf-8')
+
+# Yields (code, comment) for each line, where code is the line with any
+# /* */ comment text removed, and comment is the removed text. Comments may
+# span lines.
+def split_c_comments(lines):
+    in_comment = False
+    for l in lines:
+        code = ''
+        comment = ''
+        pos = 0
+        while True:
+            if in_comment:
+                end = l.find('*/', pos)
+                if end == -1:
+                    comment += l[pos:]
+                    break
+                comment += l[pos:end]
+                pos = end + 2
+                in_comment = False
+            else:
+                start = l.find('/*', pos)
+                if start == -1:
+                    code += l[pos:]
+                    break
+                code += l[pos:start]
+                pos = start + 2
+                in_comment = True
+        yield (code, comment)
+
+# Combines (name, regex) pairs into one regex; m.lastgroup names the
+# alternative that matched. Groups within each regex must be named, and
+# the names must be unique.
+def re_compile_alternation(alternatives):
+    return re.compile('|'.join('(?P<%s>%s)' % a for a in alternatives))
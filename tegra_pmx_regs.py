@@ -0,0 +1,348 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import re
+import struct
+import sys
+from tegra_pmx_parser_utils import *
+
+# Bit positions within a pin's pinmux register; these match the values that
+# soc-to-kernel-pinctrl-driver.py writes into the kernel's pingroup table.
+mux_mask = 3 << 0
+pupd_shift = 2
+pupd_mask = 3 << pupd_shift
+tri_bit = 4
+rcv_sel_bit = 9
+e_io_hv_bit = 10
+
+pupd_values = {
+    'none': 0,
+    'down': 1,
+    'up': 2,
+}
+
+def set_bit(val, bit, enable):
+    if enable:
+        return val | (1 << bit)
+    return val & ~(1 << bit)
+
+def pincfg_reg_value(soc, pincfg, base=0):
+    gpio_pin = pincfg.gpio_pin
+    val = base
+    # A pin without a mux function keeps whatever its mux field holds
+    if pincfg.mux:
+        if pincfg.mux not in gpio_pin.funcs:
+            raise Exception('Pin %s does not support function %s' % (pincfg.fullname, pincfg.mux))
+        val = (val & ~mux_mask) | gpio_pin.funcs.index(pincfg.mux)
+    val = (val & ~pupd_mask) | (pupd_values[pincfg.pull] << pupd_shift)
+    val = set_bit(val, tri_bit, pincfg.tri)
+    val = set_bit(val, soc.soc_einput_b, pincfg.e_inp)
+    if gpio_pin.od:
+        val = set_bit(val, soc.soc_odrain_b, pincfg.od)
+    if soc.soc_pins_have_rcv_sel and gpio_pin.rcv_sel:
+        val = set_bit(val, rcv_sel_bit, pincfg.rcv_sel)
+    if soc.soc_pins_have_e_io_hv and gpio_pin.e_io_hv:
+        val = set_bit(val, e_io_hv_bit, pincfg.e_io_hv)
+    # Pins come out of reset parked; the configuration only takes effect
+    # once the park bit is cleared.
+    if soc.soc_pins_all_have_parked:
+        val = set_bit(val, soc.soc_parked_bit, False)
+    return val
+
+# The register bits that pincfg_reg_value() sets from the board file; the
+# others keep their base value
+def pincfg_reg_mask(soc, pincfg):
+    gpio_pin = pincfg.gpio_pin
+    mask = pupd_mask | (1 << tri_bit) | (1 << soc.soc_einput_b)
+    if pincfg.mux:
+        mask |= mux_mask
+    if gpio_pin.od:
+        mask |= 1 << soc.soc_odrain_b
+    if soc.soc_pins_have_rcv_sel and gpio_pin.rcv_sel:
+        mask |= 1 << rcv_sel_bit
+    if soc.soc_pins_have_e_io_hv and gpio_pin.e_io_hv:
+        mask |= 1 << e_io_hv_bit
+    if soc.soc_pins_all_have_parked:
+        mask |= 1 << soc.soc_parked_bit
+    return mask
+
+def mipipadctrlcfg_reg_value(cfg, base=0):
+    group = cfg.mipi_pad_ctrl_group
+    if cfg.mux not in group.funcs:
+        raise Exception('MIPI pad ctrl group %s does not support function %s' % (cfg.name, cfg.mux))
+    return set_bit(base, group.bit, group.funcs.index(cfg.mux))
+
+def mipipadctrlcfg_reg_mask(cfg):
+    return 1 << cfg.mipi_pad_ctrl_group.bit
+
+# Merge sorted register offsets into (first, last) ranges of consecutive
+# registers
+def reg_ranges(regs):
+    ranges = []
+    for reg in regs:
+        if ranges and reg == ranges[-1][1] + 4:
+            ranges[-1][1] = reg
+        else:
+            ranges.append([reg, reg])
+    return [tuple(r) for r in ranges]
+
+class RegValue(ReprDictObj):
+    def __init__(self, reg, value, mask, names, reset):
+        self.reg = reg
+        self.value = value
+        # The bits of value that the board file sets; the others hold the
+        # reset value, or 0 if that isn't known
+        self.mask = mask
+        # Names of the pins or groups configured by this register
+        self.names = names
+        # None if the SoC file doesn't provide the reset value
+        self.reset = reset
+
+    def is_reset(self):
+        return self.value == self.reset
+
+def _new_reg_value(soc, reg):
+    reset = soc.reset_value(reg)
+    if reset is None:
+        return RegValue(reg, 0, 0, [], None)
+    return RegValue(reg, reset, 0, [], reset)
+
+# Register bits that the board file doesn't describe keep their reset value,
+# if known, and are otherwise 0; either way they are left out of the mask, so
+# that the registers can be programmed with read-modify-write.
+def reg_image(board):
+    soc = board.soc
+    regs = {}
+    for pincfg in board.pincfgs_by_num():
+        reg = pincfg.gpio_pin.reg
+        regs[reg] = _new_reg_value(soc, reg)
+        regs[reg].value = pincfg_reg_value(soc, pincfg, regs[reg].value)
+        regs[reg].mask = pincfg_reg_mask(soc, pincfg)
+        regs[reg].names.append(pincfg.fullname)
+    # Several MIPI pad ctrl groups may share one register
+    for cfg in board.mipipadctrlcfgs_by_num():
+        reg = cfg.mipi_pad_ctrl_group.reg
+        if reg not in regs:
+            regs[reg] = _new_reg_value(soc, reg)
+        regs[reg].value = mipipadctrlcfg_reg_value(cfg, regs[reg].value)
+        regs[reg].mask |= mipipadctrlcfg_reg_mask(cfg)
+        regs[reg].names.append(cfg.mipi_pad_ctrl_group.fullname)
+    return [regs[reg] for reg in sorted(regs)]
+
+# Names of the pins and MIPI pad ctrl groups whose registers already hold,
+# at reset, the values the board configures.
+def reset_state_names(board):
+    names = set()
+    for reg in reg_image(board):
+        if reg.is_reset():
+            names.update(reg.names)
+    return names
+
+def report_skipped_writes(board, skipped, total):
+    if not board.soc.has_reset_values():
+        print('WARNING: No reset_values in SoC %s; no writes skipped' % board.soc.name, file=sys.stderr)
+        return
+    print('%s: %d of %d writes skipped (already at reset value)' % (board.name, skipped, total), file=sys.stderr)
+
+# A register dump line: an offset or address, then one or more register
+# values. This covers board-to-reg-image.py --format text output, "offset
+# value" pairs, and U-Boot md.l output (whose trailing ASCII column is
+# ignored). Values without 0x must be 8 hex digits, so that the ASCII
+# column isn't taken for one.
+re_dump_line = re.compile(r'\s*(?:0x)?([0-9a-fA-F]+):?\s+(.*)')
+re_dump_value = re.compile(r'(?:0x([0-9a-fA-F]{1,8})|([0-9a-fA-F]{8}))(?:\s+|$)')
+
+def _add_dump_value(values, reg, value):
+    if reg in values and values[reg] != value:
+        raise Exception('Register 0x%x dumped twice with different values' % reg)
+    values[reg] = value
+
+# Returns {offset: value} for a text register dump. apb_misc is the address
+# of APB_MISC, for dumps that hold addresses rather than offsets.
+def parse_reg_dump_text(lines, apb_misc=0):
+    values = {}
+    for lnum, l in enumerate(lines, 1):
+        m = re_dump_line.match(l)
+        if not m:
+            continue
+        reg = int(m.group(1), 16) - apb_misc
+        rest = m.group(2)
+        pos = 0
+        while True:
+            mv = re_dump_value.match(rest, pos)
+            if not mv:
+                break
+            if reg < 0:
+                raise Exception('line %d: address 0x%x is below APB_MISC' % (lnum, reg + apb_misc))
+            _add_dump_value(values, reg, int(mv.group(1) or mv.group(2), 16))
+            reg += 4
+            pos = mv.end()
+    return values
+
+# Returns {offset: value} for a binary dump of consecutive little-endian
+# 32-bit registers, the first of which is at offset base
+def parse_reg_dump_bin(blob, base):
+    if len(blob) % 4:
+        raise Exception('Binary dump length %d is not a multiple of 4' % len(blob))
+    return {base + (i * 4): value for i, (value,) in enumerate(struct.iter_unpack('<I', blob))}
+
+# Returns {offset: value} for board-to-reg-image.py --format bin output:
+# little-endian 32-bit (offset, value, mask) triples. The mask isn't needed,
+# since the bits outside it are only compared against the board where known.
+def parse_reg_image_bin(blob):
+    if len(blob) % 12:
+        raise Exception('Register image length %d is not a multiple of 12' % len(blob))
+    values = {}
+    for (reg, value, mask) in struct.iter_unpack('<III', blob):
+        _add_dump_value(values, reg, value)
+    return values
+
+# board-to-reg-image.py --format bin output holds ascending pin or MIPI pad
+# ctrl register offsets in every third word, which register values don't
+def is_reg_image_bin(blob, index):
+    if not blob or len(blob) % 12:
+        return False
+    regs = [reg for (reg, value, mask) in struct.iter_unpack('<III', blob)]
+    if regs != sorted(set(regs)):
+        return False
+    return all(index.lookup(reg) is not None for reg in regs)
+
+# Maps register offsets to the pin or the MIPI pad ctrl groups using them,
+# through a list indexed by word offset from the lowest register, so that
+# decoding a dump needs no searches
+class RegIndex(ReprDictObj):
+    def __init__(self, soc):
+        regs = [gpio_pin.reg for gpio_pin in soc.gpios_pins_by_reg()]
+        regs += [group.reg for group in soc.mipi_pad_ctrl_groups_by_reg()]
+        self.first = min(regs)
+        self.slots = [None] * (((max(regs) - self.first) // 4) + 1)
+        for gpio_pin in soc.gpios_pins_by_reg():
+            self.slots[self._slot(gpio_pin.reg)] = gpio_pin
+        # Several MIPI pad ctrl groups may share one register
+        for group in soc.mipi_pad_ctrl_groups_by_reg():
+            i = self._slot(group.reg)
+            if self.slots[i] is None:
+                self.slots[i] = []
+            self.slots[i].append(group)
+
+    def _slot(self, reg):
+        return (reg - self.first) // 4
+
+    def lookup(self, reg):
+        if reg < self.first or reg % 4:
+            return None
+        i = self._slot(reg)
+        if i >= len(self.slots):
+            return None
+        return self.slots[i]
+
+pupd_names = {value: name for name, value in pupd_values.items()}
+
+def get_bit(val, bit):
+    return bool(val & (1 << bit))
+
+# The inverse of pincfg_reg_value(); returns a board file pins table row
+# (as a dict), and a list of warnings about bits that can't be represented
+def decode_pin_reg(soc, gpio_pin, val):
+    warnings = []
+    pupd = (val & pupd_mask) >> pupd_shift
+    if pupd not in pupd_names:
+        warnings.append('%s: reserved pull value %d' % (gpio_pin.fullname, pupd))
+    pin = {
+        'fullname': gpio_pin.fullname,
+        'mux': gpio_pin.funcs[val & mux_mask],
+        'gpio_init': None,
+        'pull': pupd_names.get(pupd, 'none'),
+        'tri': get_bit(val, tri_bit),
+        'e_inp': get_bit(val, soc.soc_einput_b),
+        'od': bool(gpio_pin.od) and get_bit(val, soc.soc_odrain_b),
+    }
+    if soc.soc_pins_have_rcv_sel:
+        pin['rcv_sel'] = bool(gpio_pin.rcv_sel) and get_bit(val, rcv_sel_bit)
+    if soc.soc_pins_have_e_io_hv:
+        pin['e_io_hv'] = bool(gpio_pin.e_io_hv) and get_bit(val, e_io_hv_bit)
+    if soc.soc_pins_all_have_parked and get_bit(val, soc.soc_parked_bit):
+        warnings.append('%s: parked; the configuration is not in effect' % gpio_pin.fullname)
+    return (pin, warnings)
+
+class RegDump(ReprDictObj):
+    def __init__(self, pins, mipi_pad_ctrl_groups, unknown_regs, warnings):
+        # Board file pins table rows (dicts), sorted by register
+        self.pins = pins
+        # (name, mux) for each MIPI pad ctrl group
+        self.mipi_pad_ctrl_groups = mipi_pad_ctrl_groups
+        # Dumped offsets that aren't pin or MIPI pad ctrl registers
+        self.unknown_regs = unknown_regs
+        self.warnings = warnings
+
+def decode_reg_dump(soc, values, index=None):
+    if index is None:
+        index = RegIndex(soc)
+    pins = []
+    mipi_pad_ctrl_groups = []
+    unknown_regs = []
+    warnings = []
+    for reg in sorted(values):
+        val = values[reg]
+        entry = index.lookup(reg)
+        if entry is None:
+            unknown_regs.append(reg)
+        elif isinstance(entry, list):
+            for group in entry:
+                mipi_pad_ctrl_groups.append((group.name, group.funcs[int(get_bit(val, group.bit))]))
+        else:
+            (pin, pin_warnings) = decode_pin_reg(soc, entry, val)
+            pins.append(pin)
+            warnings += pin_warnings
+    return RegDump(pins, mipi_pad_ctrl_groups, unknown_regs, warnings)
+
+# Compares a board's pin configuration against a decoded dump, returning
+# one line per difference. Only the fields that the pin's register holds
+# are compared, and the mux only where the board sets it.
+def reg_dump_diffs(board, dump):
+    soc = board.soc
+    dumped_pins = {pin['fullname']: pin for pin in dump.pins}
+    dumped_groups = dict(dump.mipi_pad_ctrl_groups)
+    diffs = []
+    for pincfg in board.pincfgs_by_num():
+        gpio_pin = pincfg.gpio_pin
+        if pincfg.fullname not in dumped_pins:
+            diffs.append('%s: not in dump' % pincfg.fullname)
+            continue
+        pin = dumped_pins[pincfg.fullname]
+        fields = ['pull', 'tri', 'e_inp']
+        if pincfg.mux:
+            fields.insert(0, 'mux')
+        if gpio_pin.od:
+            fields.append('od')
+        if soc.soc_pins_have_rcv_sel and gpio_pin.rcv_sel:
+            fields.append('rcv_sel')
+        if soc.soc_pins_have_e_io_hv and gpio_pin.e_io_hv:
+            fields.append('e_io_hv')
+        for field in fields:
+            expected = getattr(pincfg, field)
+            if pin[field] != expected:
+                diffs.append('%s: %s is %s, board has %s' % (pincfg.fullname, field, repr(pin[field]), repr(expected)))
+    for cfg in board.mipipadctrlcfgs_by_num():
+        if cfg.name not in dumped_groups:
+            diffs.append('%s: not in dump' % cfg.mipi_pad_ctrl_group.fullname)
+        elif dumped_groups[cfg.name] != cfg.mux:
+            diffs.append('%s: mux is %s, board has %s' % (cfg.mipi_pad_ctrl_group.fullname, repr(dumped_groups[cfg.name]), repr(cfg.mux)))
+    return diffs
@@ -19,6 +19,7 @@
 # DEALINGS IN THE SOFTWARE.
 
 import collections
+import glob
 import os.path
 from tegra_pmx_parser_utils import *
 
@@ -203,6 +204,14 @@ class Soc(TopLevelParsedObj):
                 gpios_pins.append(gpios_pins_by_fullname[name])
             self._mipi_pad_ctrl_groups.append(MipiPadCtrlGroup(self, group, gpios_pins))
 
+        # Optional power-on reset value of each register, keyed by offset
+        self._reset_values = dict(data.get('reset_values', {}))
+        regs = [gpio_pin.reg for gpio_pin in self._gpios + self._pins if gpio_pin.reg]
+        regs += [group.reg for group in self._drive_groups + self._mipi_pad_ctrl_groups]
+        for reg in self._reset_values:
+            if reg not in regs:
+                raise Exception('reset_values entry 0x%x is not a pinmux register' % reg)
+
         self._generate_derived_data()
 
     def _generate_derived_data(self):
@@ -223,6 +232,17 @@ class Soc(TopLevelParsedObj):
         self._mipi_pad_ctrl_groups_by_reg = sorted(self._mipi_pad_ctrl_groups, key=lambda group: group.reg)
         self._mipi_pad_ctrl_groups_by_alpha = sorted(self._mipi_pad_ctrl_groups, key=lambda group: group.name)
 
+        # Name indices, for the many lookups made when parsing board data
+        self._gpios_pins_by_fullname = {}
+        self._gpios_pins_by_name = {}
+        for gpio_pin in self._gpios_pins_by_num:
+            self._gpios_pins_by_fullname.setdefault(gpio_pin.fullname, gpio_pin)
+            self._gpios_pins_by_name.setdefault(gpio_pin.signal, gpio_pin)
+            self._gpios_pins_by_name.setdefault('gpio_p' + gpio_pin.gpio, gpio_pin)
+        self._mipi_pad_ctrl_groups_by_name = {}
+        for group in self._mipi_pad_ctrl_groups:
+            self._mipi_pad_ctrl_groups_by_name.setdefault(group.name, group)
+
         functions = collections.OrderedDict()
         for pin in self._gpios + self._pins:
             if not pin.reg:
@@ -263,18 +283,10 @@ class Soc(TopLevelParsedObj):
         return self._gpios_pins_by_reg
 
     def gpio_or_pin_by_name(self, name):
-        for gpio_pin in self._gpios_pins_by_num:
-            if name == gpio_pin.signal:
-                return gpio_pin
-            if name == 'gpio_p' + gpio_pin.gpio:
-                return gpio_pin
-        return None
+        return self._gpios_pins_by_name.get(name)
 
     def gpio_or_pin_by_fullname(self, name):
-        for gpio_pin in self._gpios_pins_by_num:
-            if name == gpio_pin.fullname:
-                return gpio_pin
-        return None
+        return self._gpios_pins_by_fullname.get(name)
 
     def drive_groups_by_conf_order(self):
         return self._drive_groups
@@ -295,10 +307,13 @@ class Soc(TopLevelParsedObj):
         return self._mipi_pad_ctrl_groups_by_alpha
 
     def mipi_pad_ctrl_group_by_name(self, name):
-        for mipi_pad_ctrl in self._mipi_pad_ctrl_groups:
-            if name == mipi_pad_ctrl.name:
-                return mipi_pad_ctrl
-        return None
+        return self._mipi_pad_ctrl_groups_by_name.get(name)
+
+    def has_reset_values(self):
+        return bool(self._reset_values)
+
+    def reset_value(self, reg):
+        return self._reset_values.get(reg)
 
     def functions(self):
         return self._functions
@@ -306,11 +321,28 @@ class Soc(TopLevelParsedObj):
     def functions_by_alpha(self):
         return self._functions_by_alpha
 
+def soc_names():
+    fns = glob.glob(os.path.join(configs_dir, '*.soc'))
+    return sorted(os.path.basename(fn)[:-4] for fn in fns)
+
+def soc_filename(socname):
+    return os.path.join(configs_dir, socname + '.soc')
+
+# Parsed SoCs are kept, so that long-running users (such as build-all.py
+# --watch) only re-parse an SoC file when it has changed.
+_socs = {}
+
 def load_soc(socname):
-    fn = os.path.join(configs_dir, socname + '.soc')
+    fn = soc_filename(socname)
+    mtime = os.stat(fn).st_mtime_ns
+    if socname in _socs and _socs[socname][0] == mtime:
+        return _socs[socname][1]
+
     d = {}
     with open(fn) as f:
         code = compile(f.read(), fn, 'exec')
         exec(code, globals(), d)
 
-    return Soc(socname, d)
+    soc = Soc(socname, d)
+    _socs[socname] = (mtime, soc)
+    return soc
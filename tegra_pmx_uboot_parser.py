@@ -0,0 +1,692 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import collections
+import re
+import sys
+from tegra_pmx_parser_utils import *
+from tegra_pmx_utils import *
+
+re_copyright = re.compile(r' \* Copyright \(c\) (.*), NVIDIA CORPORATION. All rights reserved.')
+
+re_close_brace = re.compile('};')
+
+re_enum_entries = {
+    'pingrp': re.compile(r'\s+PMUX_PINGRP_([A-Z0-9_]+)(?: = \((0x[0-9a-f]+) / 4\))?,'),
+    'drvgrp': re.compile(r'\s+PMUX_DRVGRP_([A-Z0-9_]+)(?: = \((0x[0-9a-f]+) / 4\))?,'),
+    'mipipadctrlgrp': re.compile(r'\s+PMUX_MIPIPADCTRLGRP_([A-Z0-9_]+)(?: = \((0x[0-9a-f]+) / 4\))?,'),
+    'func': re.compile(r'\s+PMUX_FUNC_([A-Z0-9_]+),'),
+}
+
+re_pingroups_entry = re_compile_alternation((
+    ('pin', r'\s+PIN\((?P<pin_args>.*)\),'),
+    ('pin_reserved', r'\s+PIN_RESERVED,'),
+))
+
+# soc-to-uboot-driver.py has always spelled the reserved entry
+# MIPIPACTRL_RESERVED
+re_mipipadctrl_groups_entry = re_compile_alternation((
+    ('grp', r'\s+MIPIPADCTRL_GRP\((?P<grp_args>.*)\),'),
+    ('grp_reserved', r'\s+MIPIPA(?:D)?CTRL_RESERVED,'),
+))
+
+re_global = re_compile_alternation((
+    ('include_guard', r'#ifndef _(?P<include_guard_soc>TEGRA\d+)_PINMUX_H_'),
+    ('enum_start', 'enum pmux_(?P<enum_start_name>pingrp|drvgrp|mipipadctrlgrp|func) {'),
+    ('define', r'#define TEGRA_PMX_(?P<define_name>[A-Z0-9_]+)(?:\s+(?P<define_value>0x[0-9a-f]+))?\s*$'),
+    ('pingroups_start', r'static const struct pmux_pingrp_desc (?P<pingroups_start_soc>tegra\d+)_pingroups\[\] = \{'),
+    ('mipipadctrl_groups_start', r'static const struct pmux_mipipadctrlgrp_desc (?P<mipipadctrl_groups_start_soc>tegra\d+)_mipipadctrl_groups\[\] = \{'),
+))
+
+# The #defines in pinmux.h that correspond to .soc file variables
+define_flags = {
+    'SOC_HAS_IO_CLAMPING': 'soc_has_io_clamping',
+    'GRPS_HAVE_LPMD': 'soc_drvgroups_have_lpmd',
+    'GRPS_HAVE_SCHMT': 'soc_drvgroups_have_schmitt',
+    'GRPS_HAVE_HSM': 'soc_drvgroups_have_hsm',
+    'PINS_HAVE_OD': 'soc_pins_have_od',
+    'PINS_HAVE_IO_RESET': 'soc_pins_have_ior',
+    'PINS_HAVE_RCV_SEL': 'soc_pins_have_rcv_sel',
+    'PINS_HAVE_E_IO_HV': 'soc_pins_have_e_io_hv',
+}
+define_values = {
+    'SOC_DRV_GROUP_BASE_REG': 'soc_drv_reg_base',
+    'SOC_MIPIPADCTRL_BASE_REG': 'soc_mipipadctrl_reg_base',
+}
+
+# The result of parsing one U-Boot pinmux driver (pinmux.h and pinmux.c)
+class UbootDriver(ReprDictObj):
+    def __init__(self, soc, copyright_years, values, rsvd_base, pins, drive_groups, mipi_pad_ctrl_groups, functions):
+        self.soc = soc
+        self.uboot_copyright_years = copyright_years
+        for var in define_flags.values():
+            self.__setattr__(var, values.get(var, False))
+        for var in define_values.values():
+            self.__setattr__(var, values.get(var, 0))
+        self.soc_rsvd_base = rsvd_base
+        # fullname -> dict of the pin's reg and funcs, in register order
+        self.pins = pins
+        # name -> reg, in register order
+        self.drive_groups = drive_groups
+        # name -> dict of the group's reg and funcs, in register order
+        self.mipi_pad_ctrl_groups = mipi_pad_ctrl_groups
+        # Alphabetical, excluding the rsvd functions
+        self.functions = functions
+
+# Parses one driver; the header and C file may be passed to parse() in
+# either order. As with KernelDriverParser, instances share no state.
+class UbootDriverParser(object):
+    def __init__(self, dbg=False):
+        self.dbg = dbg
+        self.soc = None
+        self.copyright_years = None
+        self.values = {}
+        # enum name -> list of (name, value)
+        self.enums = {}
+        # The PIN() and MIPIPADCTRL_GRP() entries, indexed like their enums;
+        # None for reserved entries
+        self.pingroups = []
+        self.mipipadctrl_groups = []
+        self.enum = None
+        self.global_handlers = {
+            'include_guard': self.global_include_guard,
+            'enum_start': self.global_enum_start,
+            'define': self.global_define,
+            'pingroups_start': self.global_pingroups_start,
+            'mipipadctrl_groups_start': self.global_mipipadctrl_groups_start,
+        }
+        self.set_global_state()
+
+    def set_state(self, s, e):
+        if self.dbg: print("SET STATE: " + repr(s))
+        self.state = s
+        self.re_state_end = e
+
+    def set_global_state(self):
+        self.set_state(self.state_global, None)
+
+    def set_soc(self, soc):
+        if self.soc and soc != self.soc:
+            raise Exception('files describe both ' + self.soc + ' and ' + soc)
+        self.soc = soc
+
+    def state_enum(self, l):
+        m = re_enum_entries[self.enum].match(l)
+        if not m:
+            raise Exception('enum pmux_' + self.enum + ' entry cannot be parsed')
+        entries = self.enums[self.enum]
+        if m.lastindex == 2:
+            value = int(m.group(2), 0) // 4
+        elif entries:
+            value = entries[-1][1] + 1
+        else:
+            value = 0
+        if self.dbg: print('enum pmux_' + self.enum + ' entry:', repr(m.group(1)), value)
+        entries.append((m.group(1).lower(), value))
+
+    def state_pingroups(self, l):
+        m = re_pingroups_entry.match(l)
+        if not m:
+            raise Exception('pingroups array entry cannot be parsed')
+        if m.lastgroup == 'pin_reserved':
+            self.pingroups.append(None)
+            return
+        args = [arg.lower() for arg in re.split(r'\s*,\s*', m.group('pin_args'))]
+        if len(args) != 5:
+            raise Exception('PIN() entry does not have 5 arguments: ' + l.strip())
+        if self.dbg: print('pingroup:', repr(args))
+        self.pingroups.append((args[0], tuple(args[1:])))
+
+    def state_mipipadctrl_groups(self, l):
+        m = re_mipipadctrl_groups_entry.match(l)
+        if not m:
+            raise Exception('mipipadctrl groups array entry cannot be parsed')
+        if m.lastgroup == 'grp_reserved':
+            self.mipipadctrl_groups.append(None)
+            return
+        args = [arg.lower() for arg in re.split(r'\s*,\s*', m.group('grp_args'))]
+        if len(args) != 3:
+            raise Exception('MIPIPADCTRL_GRP() entry does not have 3 arguments: ' + l.strip())
+        if self.dbg: print('mipipadctrl group:', repr(args))
+        self.mipipadctrl_groups.append((args[0], tuple(args[1:])))
+
+    def global_include_guard(self, m):
+        self.set_soc(m.group('include_guard_soc').lower())
+
+    def global_enum_start(self, m):
+        self.enum = m.group('enum_start_name')
+        if self.enum in self.enums:
+            raise Exception('duplicate enum pmux_' + self.enum)
+        self.enums[self.enum] = []
+        self.set_state(self.state_enum, re_close_brace)
+
+    def global_define(self, m):
+        name = m.group('define_name')
+        if name in define_flags:
+            self.values[define_flags[name]] = True
+        elif name in define_values:
+            if not m.group('define_value'):
+                raise Exception('TEGRA_PMX_' + name + ' has no value')
+            self.values[define_values[name]] = int(m.group('define_value'), 0)
+
+    def global_pingroups_start(self, m):
+        self.set_soc(m.group('pingroups_start_soc'))
+        self.set_state(self.state_pingroups, re_close_brace)
+
+    def global_mipipadctrl_groups_start(self, m):
+        self.set_soc(m.group('mipipadctrl_groups_start_soc'))
+        self.set_state(self.state_mipipadctrl_groups, re_close_brace)
+
+    def state_global(self, l):
+        m = re_global.match(l)
+        if m:
+            self.global_handlers[m.lastgroup](m)
+
+    def parse_comment(self, comment):
+        m = re_copyright.match(comment)
+        if not m:
+            return
+        if self.copyright_years and m.group(1) != self.copyright_years:
+            raise Exception('files have different copyright years')
+        self.copyright_years = m.group(1)
+
+    def parse_line(self, l):
+        if self.dbg: print('<<<', repr(l))
+        if self.re_state_end and self.re_state_end.match(l):
+            self.set_global_state()
+            return
+        self.state(l)
+
+    # Matches the named entries of enum pmux_<enum> against the entries of
+    # the array indexed by it, and returns name -> (reg, funcs)
+    def match_enum_array(self, enum, array, array_name, reg_base):
+        entries = [(name, value) for (name, value) in self.enums.get(enum, []) if name != 'count']
+        counts = [value for (name, value) in self.enums.get(enum, []) if name == 'count']
+        if array is not None and counts and counts[0] != len(array):
+            raise Exception('%s has %d entries, but enum pmux_%s has %d' % (array_name, len(array), enum, counts[0]))
+        groups = collections.OrderedDict()
+        named = set()
+        for (name, value) in entries:
+            if array is None:
+                funcs = None
+            else:
+                if array[value] is None or array[value][0] != name:
+                    raise Exception('%s entry %d does not match enum pmux_%s entry %s' % (array_name, value, enum, name))
+                funcs = array[value][1]
+            named.add(value)
+            groups[name] = (reg_base + (value * 4), funcs)
+        if array is not None:
+            for (i, entry) in enumerate(array):
+                if entry is not None and i not in named:
+                    raise Exception('%s entry %s is not in enum pmux_%s' % (array_name, entry[0], enum))
+        return groups
+
+    def finish(self):
+        for enum in ('pingrp', 'drvgrp', 'func'):
+            if enum not in self.enums:
+                raise Exception('enum pmux_' + enum + ' not found')
+        if not self.pingroups:
+            raise Exception('pingroups array not found')
+        if ('mipipadctrlgrp' in self.enums) != bool(self.mipipadctrl_groups):
+            raise Exception('enum pmux_mipipadctrlgrp and the mipipadctrl groups array must both be present or both absent')
+        if 'soc_drv_reg_base' not in self.values:
+            raise Exception('TEGRA_PMX_SOC_DRV_GROUP_BASE_REG not found')
+
+        functions = []
+        rsvds = []
+        for (name, value) in self.enums['func']:
+            if name in ('default', 'count'):
+                continue
+            if name.startswith('rsvd'):
+                rsvds.append(int(name[4:]))
+                continue
+            functions.append(name)
+        if len(rsvds) != 4 or rsvds != list(range(rsvds[0], rsvds[0] + 4)):
+            raise Exception('enum pmux_func does not list 4 consecutive rsvd functions')
+        functions_set = set(functions + ['rsvd%d' % i for i in rsvds])
+
+        pins = collections.OrderedDict()
+        groups = self.match_enum_array('pingrp', self.pingroups, 'pingroups', 0x3000)
+        for name, (reg, funcs) in groups.items():
+            for f in funcs:
+                if not f in functions_set:
+                    raise Exception('invalid function', f)
+            pins[name] = {'reg': reg, 'funcs': funcs}
+
+        drive_groups = collections.OrderedDict()
+        groups = self.match_enum_array('drvgrp', None, None, self.values['soc_drv_reg_base'])
+        for name, (reg, funcs) in groups.items():
+            drive_groups[name] = reg
+
+        mipi_pad_ctrl_groups = collections.OrderedDict()
+        if self.mipipadctrl_groups:
+            if 'soc_mipipadctrl_reg_base' not in self.values:
+                raise Exception('TEGRA_PMX_SOC_MIPIPADCTRL_BASE_REG not found')
+            groups = self.match_enum_array('mipipadctrlgrp', self.mipipadctrl_groups,
+                'mipipadctrl groups', self.values['soc_mipipadctrl_reg_base'])
+            for name, (reg, funcs) in groups.items():
+                for f in funcs:
+                    if not f in functions_set:
+                        raise Exception('invalid function', f)
+                mipi_pad_ctrl_groups[name] = {'reg': reg, 'funcs': funcs}
+
+        if self.dbg:
+            print('pins:')
+            print(repr(pins))
+            print()
+            print('drive groups:')
+            print(repr(drive_groups))
+            print()
+            print('mipi pad ctrl groups:')
+            print(repr(mipi_pad_ctrl_groups))
+            print()
+            print('functions:')
+            print(repr(functions))
+
+        return UbootDriver(self.soc, self.copyright_years, self.values, rsvds[0],
+            pins, drive_groups, mipi_pad_ctrl_groups, functions)
+
+    def parse_lines(self, lines):
+        for (l, comment) in split_c_comments(lines):
+            if comment:
+                self.parse_comment(comment)
+            if l.strip():
+                self.parse_line(l)
+        if self.state != self.state_global:
+            raise Exception('file ends inside an enum or array')
+
+    def parse(self, *files):
+        for lines in files:
+            self.parse_lines(lines)
+        return self.finish()
+
+def parse_uboot_driver_files(header_fn, c_fn, dbg=False):
+    return UbootDriverParser(dbg).parse(mmap_lines(header_fn), mmap_lines(c_fn))
+
+re_gpio_fullname = re.compile('^(?:(.*)_)?p([a-z]+[0-7])$')
+
+# Writes the parts of a .soc file that the U-Boot driver describes. Columns
+# that it doesn't hold (e.g. od, ior, the MIPI pad control bit) are left out.
+def dump_soc(driver, file=None):
+    print('uboot_copyright_years =', repr(driver.uboot_copyright_years), file=file)
+    print(file=file)
+    print('soc_has_io_clamping =', repr(driver.soc_has_io_clamping), file=file)
+    print('soc_rsvd_base =', repr(driver.soc_rsvd_base), file=file)
+    for var in sorted(v for v in define_flags.values() if v != 'soc_has_io_clamping'):
+        print('%s = %s' % (var, repr(getattr(driver, var))), file=file)
+    print('soc_drv_reg_base = 0x%x' % driver.soc_drv_reg_base, file=file)
+    if driver.mipi_pad_ctrl_groups:
+        print('soc_mipipadctrl_reg_base = 0x%x' % driver.soc_mipipadctrl_reg_base, file=file)
+    print(file=file)
+
+    gpio_rows = []
+    pin_rows = []
+    for name, pin in driver.pins.items():
+        row = ('0x%x' % pin['reg'],) + tuple(repr(f) for f in pin['funcs'])
+        m = re_gpio_fullname.match(name)
+        if m:
+            gpio_rows.append((repr(m.group(1) or ''), repr(m.group(2))) + row)
+        else:
+            pin_rows.append((repr(name),) + row)
+
+    print('gpios = (', file=file)
+    dump_py_table(('name', 'gpio', 'reg', 'f0', 'f1', 'f2', 'f3'), gpio_rows, file=file)
+    print(')', file=file)
+    print(file=file)
+    print('pins = (', file=file)
+    dump_py_table(('name', 'reg', 'f0', 'f1', 'f2', 'f3'), pin_rows, file=file)
+    print(')', file=file)
+    print(file=file)
+    print('drive_groups = (', file=file)
+    rows = [(repr(name), '0x%x' % reg) for name, reg in driver.drive_groups.items()]
+    dump_py_table(('name', 'r'), rows, file=file)
+    print(')', file=file)
+
+    if driver.mipi_pad_ctrl_groups:
+        print(file=file)
+        print('mipi_pad_ctrl_groups = (', file=file)
+        rows = []
+        for name, group in driver.mipi_pad_ctrl_groups.items():
+            rows.append((repr(name), '0x%x' % group['reg']) + tuple(repr(f) for f in group['funcs']))
+        dump_py_table(('name', 'r', 'f0', 'f1'), rows, file=file)
+        print(')', file=file)
+
+# Returns a list of the differences between the driver and a parsed .soc file
+def compare_soc(driver, soc):
+    diffs = []
+
+    def compare(what, ours, theirs):
+        if ours != theirs:
+            diffs.append('%s: %s in U-Boot driver, %s in .soc file' % (what, ours, theirs))
+
+    compare('uboot_copyright_years', driver.uboot_copyright_years, str(soc.uboot_copyright_years))
+    compare('soc_rsvd_base', driver.soc_rsvd_base, soc.soc_rsvd_base)
+    for var in sorted(define_flags.values()):
+        compare(var, getattr(driver, var), getattr(soc, var))
+    compare('soc_drv_reg_base', hex(driver.soc_drv_reg_base), hex(soc.soc_drv_reg_base))
+    if driver.mipi_pad_ctrl_groups or soc.mipi_pad_ctrl_groups_by_reg():
+        compare('soc_mipipadctrl_reg_base', hex(driver.soc_mipipadctrl_reg_base), hex(soc.soc_mipipadctrl_reg_base))
+
+    def compare_groups(kind, ours, theirs):
+        for name in sorted(ours.keys() - theirs.keys()):
+            diffs.append('%s %s: only in U-Boot driver' % (kind, name))
+        for name in sorted(theirs.keys() - ours.keys()):
+            diffs.append('%s %s: only in .soc file' % (kind, name))
+        for name in ours:
+            if name not in theirs:
+                continue
+            (reg, funcs) = ours[name]
+            (soc_reg, soc_funcs) = theirs[name]
+            compare('%s %s reg' % (kind, name), hex(reg), hex(soc_reg))
+            compare('%s %s funcs' % (kind, name), funcs, soc_funcs)
+
+    compare_groups('pin',
+        {name: (pin['reg'], pin['funcs']) for name, pin in driver.pins.items()},
+        {pin.fullname: (pin.reg, tuple(pin.funcs)) for pin in soc.gpios_pins_by_reg()})
+    compare_groups('drive group',
+        {name: (reg, None) for name, reg in driver.drive_groups.items()},
+        {group.name: (group.reg, None) for group in soc.drive_groups_by_reg()})
+    compare_groups('mipi pad ctrl group',
+        {name: (group['reg'], group['funcs']) for name, group in driver.mipi_pad_ctrl_groups.items()},
+        {group.name: (group.reg, tuple(group.funcs)) for group in soc.mipi_pad_ctrl_groups_by_reg()})
+
+    soc_functions = set(f.name for f in soc.functions() if not f.name.startswith('rsvd'))
+    for f in sorted(set(driver.functions) - soc_functions):
+        diffs.append('function %s: only in U-Boot driver' % f)
+    for f in sorted(soc_functions - set(driver.functions)):
+        diffs.append('function %s: only in .soc file' % f)
+
+    return diffs
+
+# The parameters of the board-to-uboot.py table macros, used when a file
+# doesn't #define them itself. The last PINCFG parameter is _e_io_hv on
+# SoCs that have that rather than rcv_sel.
+default_board_macro_params = {
+    'GPIO_INIT': ('_port', '_gpio', '_init'),
+    'GPIO_PORT_INIT': ('_port', '_cnf', '_oe', '_out'),
+    'PINCFG': ('_pingrp', '_mux', '_pull', '_tri', '_io', '_od', '_rcv_sel'),
+    'PINCFG_RANGE': ('_pingrp', '_count', '_mux', '_pull', '_tri', '_io', '_od', '_rcv_sel'),
+    'DRVCFG': ('_drvgrp', '_slwf', '_slwr', '_drvup', '_drvdn', '_lpmd', '_schmt', '_hsm'),
+    'MIPIPADCTRLCFG': ('_grp', '_mux'),
+}
+
+# The macros each kind of table may use
+board_table_macros = {
+    'tegra_gpio_config': ('GPIO_INIT',),
+    'tegra_gpio_port_config': ('GPIO_PORT_INIT',),
+    'pmux_pingrp_config': ('PINCFG',),
+    'pmux_pingrp_range_config': ('PINCFG_RANGE',),
+    'pmux_drvgrp_config': ('DRVCFG',),
+    'pmux_mipipadctrlgrp_config': ('MIPIPADCTRLCFG',),
+}
+
+re_board_global = re_compile_alternation((
+    ('define', r'#define (?P<define_macro>[A-Z_]+)\((?P<define_params>[^)]*)\)'),
+    ('table_start', r'static (?:const )?struct (?P<table_start_struct>[a-z_]+) (?P<table_start_var>[a-z0-9_]+)\[\] = \{'),
+))
+
+re_board_table_entry = re.compile(r'\s*(?P<macro>[A-Z_]+)\((?P<args>[^)]*)\),?\s*$')
+
+# The result of parsing a U-Boot board pinmux header, such as
+# pinmux-config-<board>.h. Each table entry is a dict mapping the entry
+# macro's parameter names to its arguments, plus '_early' (True or False
+# for the tables of board-to-uboot.py --split-early, else None). Turning
+# that into board file data needs the SoC; see uboot_board_data().
+class UbootBoardConfig(ReprDictObj):
+    def __init__(self, copyright_years, entries):
+        self.uboot_copyright_years = copyright_years
+        # macro name -> list of entries
+        self.entries = entries
+
+# As with KernelDriverParser, instances share no state.
+class UbootBoardParser(object):
+    def __init__(self, dbg=False):
+        self.dbg = dbg
+        self.copyright_years = None
+        self.macro_params = dict(default_board_macro_params)
+        self.entries = collections.defaultdict(list)
+        self.lnum = 0
+        self.table_macros = None
+        self.table_early = None
+        self.global_handlers = {
+            'define': self.global_define,
+            'table_start': self.global_table_start,
+        }
+        self.set_global_state()
+
+    def set_state(self, s, e):
+        if self.dbg: print("SET STATE: " + repr(s))
+        self.state = s
+        self.re_state_end = e
+
+    def set_global_state(self):
+        self.set_state(self.state_global, None)
+
+    def global_define(self, m):
+        macro = m.group('define_macro')
+        if macro not in self.macro_params:
+            return
+        params = tuple(p.strip() for p in m.group('define_params').split(','))
+        if self.dbg: print('macro:', macro, repr(params))
+        self.macro_params[macro] = params
+
+    def global_table_start(self, m):
+        struct = m.group('table_start_struct')
+        if struct not in board_table_macros:
+            print('WARNING: line %d: ignoring table of struct %s' % (self.lnum, struct), file=sys.stderr)
+            self.set_state(self.state_ignored_table, re_close_brace)
+            return
+        var = m.group('table_start_var')
+        if var.endswith('_early'):
+            self.table_early = True
+        elif var.endswith('_late'):
+            self.table_early = False
+        else:
+            self.table_early = None
+        self.table_macros = board_table_macros[struct]
+        if self.dbg: print('table:', struct, var)
+        self.set_state(self.state_table, re_close_brace)
+
+    def state_global(self, l):
+        m = re_board_global.match(l)
+        if m:
+            self.global_handlers[m.lastgroup](m)
+
+    def state_ignored_table(self, l):
+        pass
+
+    def state_table(self, l):
+        m = re_board_table_entry.match(l)
+        if not m:
+            raise Exception('line %d: table entry cannot be parsed' % self.lnum)
+        macro = m.group('macro')
+        if macro not in self.table_macros:
+            raise Exception('line %d: unexpected %s() entry' % (self.lnum, macro))
+        args = [arg.strip() for arg in m.group('args').split(',')]
+        params = self.macro_params[macro]
+        if macro in ('PINCFG', 'PINCFG_RANGE') and len(args) == len(params) - 1:
+            # SoCs without rcv_sel or e_io_hv
+            params = params[:-1]
+        if len(args) != len(params):
+            raise Exception('line %d: %s() entry has %d arguments, not %d' % (self.lnum, macro, len(args), len(params)))
+        entry = dict(zip(params, args))
+        entry['_early'] = self.table_early
+        if self.dbg: print('entry:', macro, repr(entry))
+        self.entries[macro].append(entry)
+
+    def parse_comment(self, comment):
+        m = re_copyright.match(comment)
+        if m:
+            self.copyright_years = m.group(1)
+
+    def parse_line(self, l):
+        if self.dbg: print('<<<', repr(l))
+        if self.re_state_end and self.re_state_end.match(l):
+            self.set_global_state()
+            return
+        self.state(l)
+
+    def parse(self, lines):
+        # Macro definitions are continued over several lines
+        continued = ''
+        for (l, comment) in split_c_comments(lines):
+            self.lnum += 1
+            if comment:
+                self.parse_comment(comment)
+            if l.rstrip().endswith('\\'):
+                continued += l.rstrip()[:-1]
+                continue
+            l = continued + l
+            continued = ''
+            if l.strip():
+                self.parse_line(l)
+        if self.state != self.state_global:
+            raise Exception('file ends inside a table')
+        return UbootBoardConfig(self.copyright_years, dict(self.entries))
+
+def parse_uboot_board_file(fn, dbg=False):
+    return UbootBoardParser(dbg).parse(mmap_lines(fn))
+
+def _board_value(entry, param, values):
+    value = entry[param]
+    if value not in values:
+        raise Exception('%s %s: invalid %s %s' % (entry['_macro'], entry['_pingrp'], param[1:], value))
+    return values[value]
+
+# Converts a parsed U-Boot board pinmux header into board file data, for
+# tegra_pmx_board_parser.dump_board(). Raises an exception if the header
+# doesn't fit the SoC.
+def uboot_board_data(config, soc):
+    gpio_pins_by_reg = {gpio_pin.reg: gpio_pin for gpio_pin in soc.gpios_pins_by_reg()}
+    gpios_by_name = {gpio.gpio: gpio for gpio in soc.gpios_by_num()}
+    extra_field = None
+    if soc.soc_pins_have_rcv_sel:
+        extra_field = 'rcv_sel'
+    if soc.soc_pins_have_e_io_hv:
+        extra_field = 'e_io_hv'
+
+    def lookup_pin(name):
+        # Older headers name pin groups without their GPIO
+        gpio_pin = soc.gpio_or_pin_by_fullname(name) or soc.gpio_or_pin_by_name(name)
+        if not gpio_pin or not gpio_pin.reg:
+            raise Exception('pin group %s not in %s' % (name, soc.name))
+        return gpio_pin
+
+    pins = collections.OrderedDict()
+    early_pins = []
+
+    def add_pincfg(gpio_pin, entry):
+        if gpio_pin.fullname in pins:
+            raise Exception('pin group %s configured twice' % gpio_pin.fullname)
+        mux = entry['_mux'].lower()
+        if mux == 'default':
+            mux = None
+        elif mux not in gpio_pin.funcs:
+            raise Exception('pin group %s: mux %s not in %s' % (gpio_pin.fullname, mux, repr(gpio_pin.funcs)))
+        entry = dict(entry, _macro='PINCFG', _pingrp=gpio_pin.fullname)
+        pin = {
+            'fullname': gpio_pin.fullname,
+            'mux': mux,
+            'gpio_init': None,
+            'pull': _board_value(entry, '_pull', {'NORMAL': 'none', 'UP': 'up', 'DOWN': 'down'}),
+            'tri': _board_value(entry, '_tri', {'NORMAL': False, 'TRISTATE': True}),
+            'e_inp': _board_value(entry, '_io', {'OUTPUT': False, 'INPUT': True}),
+            'od': _board_value(entry, '_od', {'DEFAULT': False, 'DISABLE': False, 'ENABLE': True}),
+        }
+        extra = entry.get('_rcv_sel', entry.get('_e_io_hv'))
+        if (extra is None) != (extra_field is None):
+            raise Exception('PINCFG() rcv_sel/e_io_hv argument does not match %s' % soc.name)
+        if extra_field:
+            entry['_' + extra_field] = extra
+            pin[extra_field] = _board_value(entry, '_' + extra_field, {'DEFAULT': False, 'NORMAL': False, 'HIGH': True})
+        pins[gpio_pin.fullname] = pin
+        if entry['_early']:
+            early_pins.append(gpio_pin.fullname)
+
+    for entry in config.entries.get('PINCFG', []):
+        add_pincfg(lookup_pin(entry['_pingrp'].lower()), entry)
+    for entry in config.entries.get('PINCFG_RANGE', []):
+        first = lookup_pin(entry['_pingrp'].lower())
+        for i in range(int(entry['_count'], 0)):
+            gpio_pin = gpio_pins_by_reg.get(first.reg + (i * 4))
+            if not gpio_pin:
+                raise Exception('PINCFG_RANGE(%s, %s) extends past the last pin group' % (entry['_pingrp'], entry['_count']))
+            add_pincfg(gpio_pin, entry)
+
+    def set_gpio_init(gpio, init):
+        if gpio not in gpios_by_name:
+            raise Exception('GPIO %s not in %s' % (gpio, soc.name))
+        fullname = gpios_by_name[gpio].fullname
+        if fullname not in pins:
+            raise Exception('GPIO %s is initialized, but its pin group %s is not configured' % (gpio, fullname))
+        if pins[fullname]['gpio_init']:
+            raise Exception('GPIO %s initialized twice' % gpio)
+        pins[fullname]['gpio_init'] = init
+
+    for entry in config.entries.get('GPIO_INIT', []):
+        init = entry['_init'].lower()
+        if init not in ('in', 'out0', 'out1'):
+            raise Exception('GPIO %s%s: invalid init %s' % (entry['_port'], entry['_gpio'], entry['_init']))
+        set_gpio_init((entry['_port'] + entry['_gpio']).lower(), init)
+    for entry in config.entries.get('GPIO_PORT_INIT', []):
+        (cnf, oe, out) = (int(entry[p], 0) for p in ('_cnf', '_oe', '_out'))
+        for bit in range(8):
+            if not cnf & (1 << bit):
+                continue
+            if not oe & (1 << bit):
+                init = 'in'
+            elif out & (1 << bit):
+                init = 'out1'
+            else:
+                init = 'out0'
+            set_gpio_init(entry['_port'].lower() + str(bit), init)
+
+    mipi_pad_ctrl_groups = []
+    for entry in config.entries.get('MIPIPADCTRLCFG', []):
+        name = entry['_grp'].lower()
+        group = soc.mipi_pad_ctrl_group_by_name(name)
+        if not group:
+            raise Exception('MIPI pad control group %s not in %s' % (name, soc.name))
+        mux = entry['_mux'].lower()
+        if mux not in group.funcs:
+            raise Exception('MIPI pad control group %s: mux %s not in %s' % (name, mux, repr(group.funcs)))
+        mipi_pad_ctrl_groups.append((name, mux))
+
+    return {
+        'pins': list(pins.values()),
+        'mipi_pad_ctrl_groups': mipi_pad_ctrl_groups,
+        'early_pins': early_pins,
+    }
+
+# Returns the name of the only SoC whose pins, functions and GPIOs fit the
+# header
+def detect_uboot_board_soc(config, socs):
+    matches = []
+    for soc in socs:
+        try:
+            uboot_board_data(config, soc)
+        except Exception:
+            continue
+        matches.append(soc.name)
+    if not matches:
+        raise Exception('no SoC matches the pin configuration')
+    if len(matches) > 1:
+        raise Exception('pin configuration matches several SoCs (%s)' % ', '.join(matches))
+    return matches[0]
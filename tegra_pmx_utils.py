@@ -18,7 +18,12 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import datetime
+import hashlib
+import io
+import os
 import sys
+import tempfile
 
 def gen_tab_padding_to(curpos, targetpos):
     curpos -= 1
@@ -32,7 +37,9 @@ def gen_tab_padding_to(curpos, targetpos):
 def emit_tab_padding_to(curpos, targetpos):
     print(gen_tab_padding_to(curpos, targetpos), end='')
 
-def emit_padded_field(s, maxl, skip_comma=False, right_justify=False, file=sys.stdout):
+def emit_padded_field(s, maxl, skip_comma=False, right_justify=False, file=None):
+    if file is None:
+        file = sys.stdout
     pad = (' ' * (maxl - len(s)))
     if right_justify:
         print(pad, file=file, end='')
@@ -111,6 +118,9 @@ def boolean_to_c_bool(val):
     return {True: 'true', False: 'false'}[val]
 
 def dump_table(heading_prefix, heading_suffix, headings, row_prefix, row_suffix, rows, col_widths, file, right_justifies):
+    if file is None:
+        file = sys.stdout
+
     num_cols = 0
     if headings:
         num_cols = max(num_cols, len(headings))
@@ -162,10 +172,10 @@ def dump_table(heading_prefix, heading_suffix, headings, row_prefix, row_suffix,
                 emit_padded_field(val, widths[col], skip_comma = (col == len(row) - 1) and not force_comma, file=file, right_justify=right_justify)
             print(row_suffix, file=file)
 
-def dump_py_table(headings, rows, col_widths=None, file=sys.stdout, right_justifies=None):
+def dump_py_table(headings, rows, col_widths=None, file=None, right_justifies=None):
     dump_table('    #', '', headings, '    (', '),', rows, col_widths, file, right_justifies)
 
-def dump_c_table(headings, macro_name, rows, col_widths=None, file=sys.stdout, right_justifies=None, row_indent='\t'):
+def dump_c_table(headings, macro_name, rows, col_widths=None, file=None, right_justifies=None, row_indent='\t'):
     dump_table(row_indent + '/* ' + ' ' * (len(macro_name) - 2), ' */', headings, row_indent + macro_name + '(', '),', rows, col_widths, file, right_justifies)
 
 def spreadsheet_col_name_to_num(col):
@@ -182,3 +192,78 @@ def rsvd_0base_to_1base(f):
     n = int(f[4:])
     n += 1
     return 'rsvd' + str(n)
+
+def source_date_year():
+    # See https://reproducible-builds.org/specs/source-date-epoch/
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).year
+    return datetime.date.today().year
+
+def write_if_changed(fn, s):
+    if isinstance(s, str):
+        s = s.encode()
+    new_hash = hashlib.sha256(s).digest()
+    try:
+        with open(fn, 'rb') as f:
+            old_hash = hashlib.sha256(f.read()).digest()
+        if old_hash == new_hash:
+            return False
+        mode = os.stat(fn).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    # Write to a temporary file in the same directory and rename it over the
+    # target, so that readers never see a partially written file.
+    dirname = os.path.dirname(os.path.abspath(fn))
+    fd, tmpfn = tempfile.mkstemp(dir=dirname, prefix='.' + os.path.basename(fn) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(s)
+        os.chmod(tmpfn, mode)
+        os.replace(tmpfn, fn)
+    except BaseException:
+        os.unlink(tmpfn)
+        raise
+    return True
+
+class OutputFile(io.StringIO):
+    # Collects generated text in memory. When closed, the file is only
+    # replaced if the content differs, so that unchanged outputs keep their
+    # mtime and don't trigger rebuilds of whatever consumes them.
+    def __init__(self, fn, report=True):
+        io.StringIO.__init__(self)
+        self.fn = fn
+        self.report = report
+        self.changed = None
+        self.saved_stdout = None
+
+    def redirect_stdout(self):
+        self.saved_stdout = sys.stdout
+        sys.stdout = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            self.discard()
+        else:
+            self.close()
+
+    def _restore_stdout(self):
+        if self.saved_stdout:
+            sys.stdout = self.saved_stdout
+            self.saved_stdout = None
+
+    def discard(self):
+        self._restore_stdout()
+        io.StringIO.close(self)
+
+    def close(self):
+        if self.closed:
+            return
+        self._restore_stdout()
+        self.changed = write_if_changed(self.fn, self.getvalue())
+        if self.report:
+            print('%s: %s' % (self.fn, {True: 'updated', False: 'unchanged'}[self.changed]))
+        io.StringIO.close(self)
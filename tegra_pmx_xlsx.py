@@ -0,0 +1,126 @@
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+# Reads the cells of an .xlsx/.xlsm workbook's worksheet, using only the
+# standard library. The workbook is a zip file of XML parts; the worksheet
+# and the shared strings table are parsed incrementally, so only the shared
+# strings and the current row are held in memory.
+
+import posixpath
+import re
+import xml.etree.ElementTree as ElementTree
+import zipfile
+from tegra_pmx_utils import *
+
+ns_main = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+ns_rel = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+ns_pkg_rel = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+re_cell_ref = re.compile('([A-Z]+)([0-9]+)$')
+
+def _sheet_parts(zf):
+    rels = {}
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for event, elem in ElementTree.iterparse(f):
+            if elem.tag == ns_pkg_rel + 'Relationship':
+                target = elem.get('Target')
+                if target.startswith('/'):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(posixpath.join('xl', target))
+                rels[elem.get('Id')] = target
+    sheets = []
+    with zf.open('xl/workbook.xml') as f:
+        for event, elem in ElementTree.iterparse(f):
+            if elem.tag == ns_main + 'sheet':
+                sheets.append((elem.get('name'), rels[elem.get(ns_rel + 'id')]))
+    return sheets
+
+def xlsx_sheet_names(fn):
+    with zipfile.ZipFile(fn) as zf:
+        return [name for (name, part) in _sheet_parts(zf)]
+
+def _text(elem):
+    # Rich text is split into runs; phonetic hints (rPh) aren't cell text
+    if elem.tag == ns_main + 't':
+        return elem.text or ''
+    return ''.join(_text(child) for child in elem if child.tag != ns_main + 'rPh')
+
+def _shared_strings(zf):
+    strings = []
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return strings
+    with zf.open('xl/sharedStrings.xml') as f:
+        for event, elem in ElementTree.iterparse(f):
+            if elem.tag == ns_main + 'si':
+                strings.append(_text(elem))
+                elem.clear()
+    return strings
+
+def _col_num(ref):
+    m = re_cell_ref.match(ref)
+    if not m:
+        raise Exception('Bad cell reference ' + ref)
+    return spreadsheet_col_name_to_num(m.group(1))
+
+def _cell_value(cell, strings):
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        inline = cell.find(ns_main + 'is')
+        if inline is None:
+            return ''
+        return _text(inline)
+    v = cell.find(ns_main + 'v')
+    if v is None or v.text is None:
+        return ''
+    if cell_type == 's':
+        return strings[int(v.text)]
+    if cell_type == 'b':
+        return {'0': 'FALSE', '1': 'TRUE'}[v.text]
+    return v.text
+
+# Yields each row of the worksheet as a list of cell text, as a CSV export
+# of it would hold: missing cells are '', and rows missing from the file
+# (because they're empty) are yielded as empty lists.
+def xlsx_rows(fn, sheet):
+    with zipfile.ZipFile(fn) as zf:
+        parts = dict(_sheet_parts(zf))
+        if sheet not in parts:
+            raise Exception('%s has no worksheet "%s"; it has: %s' % (fn, sheet, ', '.join(repr(name) for name in parts)))
+        strings = _shared_strings(zf)
+        rnum = 0
+        with zf.open(parts[sheet]) as f:
+            for event, elem in ElementTree.iterparse(f):
+                if elem.tag != ns_main + 'row':
+                    continue
+                r = int(elem.get('r', rnum + 1))
+                while rnum < r - 1:
+                    rnum += 1
+                    yield []
+                rnum = r
+                row = []
+                for cell in elem.iter(ns_main + 'c'):
+                    ref = cell.get('r')
+                    if ref:
+                        col = _col_num(ref)
+                        row.extend([''] * (col - len(row)))
+                    row.append(_cell_value(cell, strings))
+                elem.clear()
+                yield row
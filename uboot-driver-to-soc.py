@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import sys
+import tegra_pmx_soc_parser
+import tegra_pmx_uboot_parser
+
+dbg = False
+
+parser = argparse.ArgumentParser(description='Create (the U-Boot related ' +
+    'parts of) a pinmux .soc file from U-Boot pinmux driver source code')
+parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+parser.add_argument('--check', action='store_true', help='Instead compare the driver against the SoC\'s .soc file, and report any differences')
+parser.add_argument('header', help='The driver\'s pinmux.h')
+parser.add_argument('cfile', help='The driver\'s pinmux.c')
+args = parser.parse_args()
+if args.debug:
+    dbg = True
+if dbg: print(args)
+
+driver = tegra_pmx_uboot_parser.parse_uboot_driver_files(args.header, args.cfile, dbg)
+
+if not args.check:
+    tegra_pmx_uboot_parser.dump_soc(driver)
+    sys.exit(0)
+
+soc = tegra_pmx_soc_parser.load_soc(driver.soc)
+diffs = tegra_pmx_uboot_parser.compare_soc(driver, soc)
+for diff in diffs:
+    print('ERROR: %s: %s' % (driver.soc, diff), file=sys.stderr)
+print('%s: %d differences' % (driver.soc, len(diffs)))
+if diffs:
+    sys.exit(1)
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+
+# Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import argparse
+import collections
+import concurrent.futures
+import io
+import os
+import os.path
+import re
+import sys
+import tegra_pmx_board_parser
+import tegra_pmx_soc_parser
+import tegra_pmx_uboot_parser
+from tegra_pmx_utils import *
+
+dbg = False
+
+re_header_fn = re.compile(r'pinmux-config-(.+)\.h$')
+
+def find_headers(paths):
+    headers = []
+    for path in paths:
+        if not os.path.isdir(path):
+            headers.append(path)
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                if re_header_fn.match(fn):
+                    headers.append(os.path.join(dirpath, fn))
+    return headers
+
+def board_name(fn):
+    m = re_header_fn.match(os.path.basename(fn))
+    if m:
+        return m.group(1)
+    return os.path.splitext(os.path.basename(fn))[0]
+
+# Runs in a worker process; returns the SoC, pin count and board file text
+def convert(fn, socname, dbg):
+    config = tegra_pmx_uboot_parser.parse_uboot_board_file(fn, dbg)
+    if not socname:
+        socs = [tegra_pmx_soc_parser.load_soc(name) for name in tegra_pmx_soc_parser.soc_names()]
+        socname = tegra_pmx_uboot_parser.detect_uboot_board_soc(config, socs)
+    soc = tegra_pmx_soc_parser.load_soc(socname)
+    data = tegra_pmx_uboot_parser.uboot_board_data(config, soc)
+    text = io.StringIO()
+    tegra_pmx_board_parser.dump_board(soc, data['pins'], data['mipi_pad_ctrl_groups'], text,
+        early_pins=data['early_pins'], uboot_copyright_years=config.uboot_copyright_years)
+    return (socname, len(data['pins']), text.getvalue())
+
+def main():
+    global dbg
+
+    parser = argparse.ArgumentParser(description='Create board config ' +
+        'files from U-Boot board pinmux headers (pinmux-config-<board>.h)')
+    parser.add_argument('--debug', action='store_true', help='Turn on debugging prints')
+    parser.add_argument('--soc', help='SoC the boards use (default: detect it from each header\'s pin configuration)')
+    parser.add_argument('--outdir', default=tegra_pmx_board_parser.configs_dir, help='Directory to write the board files to (default: configs/)')
+    parser.add_argument('--force', action='store_true', help='Overwrite existing board files')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of headers to convert in parallel (default: number of CPUs)')
+    parser.add_argument('paths', nargs='+', metavar='path', help='Header file, or directory (e.g. a U-Boot board/ tree) to search for pinmux-config-*.h')
+    args = parser.parse_args()
+    if args.debug:
+        dbg = True
+    if dbg: print(args)
+
+    if args.soc:
+        tegra_pmx_soc_parser.load_soc(args.soc)
+
+    headers = collections.OrderedDict()
+    for fn in find_headers(args.paths):
+        board = board_name(fn)
+        if board in headers:
+            raise Exception('%s and %s both describe board %s' % (headers[board], fn, board))
+        headers[board] = fn
+    if not headers:
+        raise Exception('No pinmux-config-*.h files found')
+
+    converted = 0
+    skipped = 0
+    failed = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = collections.OrderedDict()
+        for board, fn in headers.items():
+            outfn = os.path.join(args.outdir, board + '.board')
+            if os.path.exists(outfn) and not args.force:
+                print('%s: skipped; %s exists' % (board, outfn))
+                skipped += 1
+                continue
+            futures[board] = (outfn, executor.submit(convert, fn, args.soc, dbg))
+        for board, (outfn, future) in futures.items():
+            try:
+                (socname, num_pins, text) = future.result()
+            except Exception as e:
+                print('ERROR: %s: %s: %s' % (board, headers[board], e), file=sys.stderr)
+                failed += 1
+                continue
+            changed = write_if_changed(outfn, text)
+            print('%s: %s, %d pins: %s %s' % (board, socname, num_pins, outfn, {True: 'updated', False: 'unchanged'}[changed]))
+            converted += 1
+
+    print('%d boards converted, %d skipped, %d failed' % (converted, skipped, failed))
+    if failed:
+        sys.exit(1)
+
+# The guard keeps process pool workers that re-import this script from
+# running it again
+if __name__ == '__main__':
+    main()